@@ -4,12 +4,19 @@ Bu uygulama tüm modülleri birleştirir ve web arayüzü sağlar
 """
 
 from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import pandas as pd
 import numpy as np
+import orjson
 import logging
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from uuid import uuid4
 from datetime import datetime, timedelta
+from enum import Enum
 import json
 
 # Proje modüllerini import et
@@ -31,6 +38,82 @@ current_data = None
 current_signals = None
 current_predictions = None
 
+# Popüler kripto paralar
+POPULAR_SYMBOLS = [
+    'BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'ADAUSDT', 'SOLUSDT',
+    'DOTUSDT', 'DOGEUSDT', 'AVAXUSDT', 'MATICUSDT', 'LINKUSDT',
+    'UNIUSDT', 'LTCUSDT', 'BCHUSDT', 'XLMUSDT', 'VETUSDT'
+]
+
+def _frame_to_columnar(df: pd.DataFrame) -> dict:
+    """
+    DataFrame'i sütun bazlı, orjson'un doğrudan yazabileceği bir sözlüğe çevirir
+    
+    Hücreler Python nesnelerine kutulanmaz; her sütun NumPy dizisi olarak kalır
+    ve OPT_SERIALIZE_NUMPY ile tampon üzerinden yazılır.
+    """
+    return {
+        'columns': list(df.columns),
+        'index': df.index.to_numpy(),
+        'values': [np.ascontiguousarray(df[col].to_numpy()) for col in df.columns]
+    }
+
+def _frame_to_soa(df: pd.DataFrame) -> dict:
+    """
+    DataFrame'i sütun başına bitişik float32 satırlardan oluşan (C, N) diziye çevirir
+    
+    Global önbellekte pandas BlockManager/Index nesneleri tutulmaz; 'values'
+    _frame_to_columnar ile aynı şekilde sütun listesi olarak serileşir.
+    """
+    return {
+        'columns': tuple(df.columns),
+        'index': df.index.to_numpy(),
+        'values': np.ascontiguousarray(df.to_numpy(dtype=np.float32).T)
+    }
+
+def _default(obj):
+    """
+    orjson'un doğrudan yazamadığı nesneleri dönüştürür
+    
+    NumPy dizileri/skalerleri, dict, list ve Enum orjson tarafından C seviyesinde
+    yazılır; buraya yalnızca model nesneleri (ARIMA, Prophet, Keras), DataFrame'ler
+    ve bitişik olmayan diziler düşer.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+def _signals_to_json(signals: list) -> list:
+    """
+    Sinyal türlerini API'nin beklediği adlara ('BUY', 'STRONG_SELL', ...) çevirir
+    
+    SignalType bir IntEnum olduğundan orjson onu doğrudan tamsayı olarak yazar;
+    arayüz ve API istemcileri tür adını beklediği için sinyaller yanıt
+    hazırlanırken kopyalanarak dönüştürülür.
+    """
+    return [dict(s, type=s['type'].name) for s in signals]
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    jsonify çağrılarını orjson ile serileştiren Flask JSON sağlayıcısı
+    
+    NumPy dizileri tampon üzerinden, Enum/datetime C seviyesinde yazılır.
+    """
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = ORJSONProvider(app)
+
 class CryptoAnalyzer:
     """
     Tüm analiz modüllerini birleştiren ana sınıf
@@ -42,6 +125,8 @@ class CryptoAnalyzer:
         self.technical_indicators = TechnicalIndicators()
         self.price_predictor = PricePredictor()
         self.signal_generator = SignalGenerator()
+        # LSTM ölçeğinin uydurulduğu sembol
+        self._scaler_symbol = None
         
     def analyze_crypto(self, symbol: str, interval: str = '1h', limit: int = 500) -> dict:
         """
@@ -67,29 +152,26 @@ class CryptoAnalyzer:
             df_with_indicators = self.technical_indicators.calculate_all_indicators(df)
             
             # 3. AI tahminleri
-            predictions = self.price_predictor.get_ensemble_prediction(df_with_indicators)
+            predictions = self._get_predictions(symbol, df_with_indicators)
             
             # 4. Sinyal üretimi
-            signals = self.signal_generator.generate_signals(df_with_indicators, predictions)
+            signals = _signals_to_json(self.signal_generator.generate_signals(df_with_indicators, predictions))
             
             # 5. Sonuçları hazırla
-            # DataFrame'i JSON'a çevrilebilir hale getir
-            data_dict = df_with_indicators.reset_index().to_dict('records')
-            
-            # Predictions'ı JSON'a çevrilebilir hale getir
-            predictions_json = self._convert_predictions_to_json(predictions)
-            
-            # Signals'ı JSON'a çevrilebilir hale getir
-            signals_json = self._convert_signals_to_json(signals)
+            # DataFrame'i sütun bazlı JSON'a çevrilebilir hale getir
+            # (predictions/signals olduğu gibi kalır, ORJSONProvider serileştirir)
+            data_dict = _frame_to_columnar(df_with_indicators)
             
             result = {
                 'symbol': symbol,
                 'interval': interval,
                 'data': data_dict,
-                'predictions': predictions_json,
-                'signals': signals_json,
+                'predictions': predictions,
+                'signals': signals,
                 'summary': self._create_summary(df_with_indicators, signals, predictions),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': datetime.now().isoformat(),
+                # Route'un global önbelleği için ham DataFrame (serileştirilmez)
+                '_df': df_with_indicators
             }
             
             logger.info(f"{symbol} analizi tamamlandı")
@@ -99,28 +181,95 @@ class CryptoAnalyzer:
             logger.error(f"Analiz hatası: {e}")
             return {'error': str(e)}
     
+    def analyze_many(self, symbols: list, interval: str = '1h', limit: int = 500,
+                     with_predictions: bool = False) -> dict:
+        """
+        Birden fazla kripto para için toplu analiz yapar
+        
+        Geçmiş veriler paralel çekilir (I/O bekleme süreleri örtüşür), ardından
+        her sembol için göstergeler ve sinyaller hesaplanır. AI tahminleri her
+        sembol için ayrı model eğittiğinden varsayılan olarak kapalıdır.
+        
+        Args:
+            symbols (list): Kripto para çiftleri
+            interval (str): Zaman aralığı ('1h', '4h', '1d')
+            limit (int): Sembol başına veri sayısı
+            with_predictions (bool): AI tahminleri de yapılsın mı
+            
+        Returns:
+            dict: Sembol bazında analiz özetleri
+        """
+        try:
+            logger.info(f"{len(symbols)} sembol için toplu analiz başlatılıyor...")
+            
+            # 1. Veri toplama (paralel)
+            histories = self.data_collector.get_historical_data_many(symbols, interval, limit=limit)
+            
+            # 2. Teknik göstergeler (tüm semboller tek toplu çağrıda)
+            available = [symbol for symbol, df in histories.items() if not df.empty]
+            indicator_dfs = dict(zip(available, self.technical_indicators.calculate_all_indicators_batch(
+                [histories[symbol] for symbol in available]
+            )))
+            
+            results = {}
+            for symbol in histories:
+                if symbol not in indicator_dfs:
+                    results[symbol] = {'error': 'Veri çekilemedi'}
+                    continue
+                
+                # 3. (opsiyonel) AI tahminleri, 4. sinyaller
+                df_with_indicators = indicator_dfs[symbol]
+                predictions = self._get_predictions(symbol, df_with_indicators) if with_predictions else {}
+                signals = _signals_to_json(self.signal_generator.generate_signals(df_with_indicators, predictions))
+                
+                results[symbol] = {
+                    'signals': signals,
+                    'summary': self._create_summary(df_with_indicators, signals, predictions)
+                }
+            
+            logger.info("Toplu analiz tamamlandı")
+            return {
+                'interval': interval,
+                'results': results,
+                'timestamp': datetime.now().isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"Toplu analiz hatası: {e}")
+            return {'error': str(e)}
+    
+    def _get_predictions(self, symbol: str, df: pd.DataFrame) -> dict:
+        """
+        Sembol için ensemble tahmin yapar
+        
+        LSTM ölçeği aynı sembolün tekrar eğitimlerinde korunur; farklı bir
+        sembole geçildiğinde fiyat aralığı değiştiği için yeniden uydurulur.
+        """
+        if symbol != self._scaler_symbol:
+            self.price_predictor.refit_scaler()
+            self._scaler_symbol = symbol
+        return self.price_predictor.get_ensemble_prediction(df)
+    
     def _create_summary(self, df: pd.DataFrame, signals: list, predictions: dict) -> dict:
         """Analiz özeti oluşturur"""
         try:
-            latest = df.iloc[-1]
-            
-            # Latest signal'ı JSON'a çevir
-            latest_signal_json = None
-            if signals:
-                latest_signal_json = self._convert_signal_to_json(signals[-1])
+            # Series oluşturmadan doğrudan close dizisine eriş
+            close = df['close'].to_numpy()
+            last = float(close[-1])
             
             summary = {
-                'current_price': float(latest['close']),
+                'current_price': last,
                 'price_change_24h': 0,  # Hesaplanacak
                 'technical_summary': self.technical_indicators.get_indicator_summary(df),
                 'support_resistance': self.technical_indicators.get_support_resistance(df),
-                'latest_signal': latest_signal_json,
+                'latest_signal': signals[-1] if signals else None,
                 'prediction_summary': self._get_prediction_summary(predictions)
             }
             
-            # 24 saatlik değişim hesapla
-            if len(df) > 24:
-                summary['price_change_24h'] = ((latest['close'] - df.iloc[-24]['close']) / df.iloc[-24]['close']) * 100
+            # 24 periyotluk değişim hesapla (son kapanış ile 24 mum önceki kapanış)
+            if len(close) > 24:
+                prev = float(close[-25])
+                summary['price_change_24h'] = (last - prev) / prev * 100
             
             return summary
             
@@ -147,104 +296,92 @@ class CryptoAnalyzer:
         except Exception as e:
             logger.error(f"Tahmin özeti hatası: {e}")
             return {}
+
+# Global analyzer ve iş parçacığı havuzu ilk kullanımda oluşturulur; spawn ile
+# başlayan süreçler __main__'i yeniden içe aktardığında Binance istemcisi kurulmaz
+_analyzer = None
+_executor = None
+_singleton_lock = threading.Lock()
+
+def _get_analyzer() -> CryptoAnalyzer:
+    """Paylaşılan analyzer örneğini döndürür"""
+    global _analyzer
+    if _analyzer is None:
+        with _singleton_lock:
+            if _analyzer is None:
+                _analyzer = CryptoAnalyzer()
+    return _analyzer
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Arka plan analiz görevleri için iş parçacığı havuzunu döndürür"""
+    global _executor
+    if _executor is None:
+        with _singleton_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=4)
+    return _executor
+
+# Arka plan analiz görevleri: task_id -> Future
+TASKS: 'OrderedDict[str, Future]' = OrderedDict()
+MAX_TASKS = 100
+
+# Aynı (symbol, interval) için süren görev; eşzamanlı istekler tek Future'ı paylaşır
+_inflight_tasks = {}
+_tasks_lock = threading.Lock()
+
+# Her iş parçacığı kendi analyzer'ını kullanır (scaler/model durumu paylaşılmaz)
+_worker_state = threading.local()
+
+def _run_analysis(symbol: str, interval: str) -> dict:
+    """Analizi arka plan iş parçacığında çalıştırır ve global değişkenleri günceller"""
+    global current_data, current_signals, current_predictions
     
-    def _convert_predictions_to_json(self, predictions: dict) -> dict:
-        """Predictions'ı JSON'a çevrilebilir hale getirir"""
-        try:
-            if not predictions:
-                return {}
-            
-            json_predictions = {}
-            
-            for key, value in predictions.items():
-                if isinstance(value, np.ndarray):
-                    json_predictions[key] = value.tolist()
-                elif isinstance(value, dict):
-                    json_predictions[key] = self._convert_predictions_to_json(value)
-                elif isinstance(value, list):
-                    json_predictions[key] = [
-                        item.tolist() if isinstance(item, np.ndarray) else item 
-                        for item in value
-                    ]
-                elif hasattr(value, '__class__') and 'ARIMA' in str(value.__class__):
-                    # ARIMA model nesnelerini string'e çevir
-                    json_predictions[key] = str(value)
-                elif hasattr(value, 'tolist'):
-                    # NumPy array benzeri nesneler
-                    json_predictions[key] = value.tolist()
-                elif hasattr(value, '__dict__'):
-                    # Diğer nesneleri string'e çevir
-                    json_predictions[key] = str(value)
-                else:
-                    json_predictions[key] = value
-            
-            return json_predictions
-            
-        except Exception as e:
-            logger.error(f"Predictions JSON dönüştürme hatası: {e}")
-            return {}
+    worker = getattr(_worker_state, 'analyzer', None)
+    if worker is None:
+        worker = _worker_state.analyzer = CryptoAnalyzer()
     
-    def _convert_signals_to_json(self, signals: list) -> list:
-        """Signals'ı JSON'a çevrilebilir hale getirir"""
-        try:
-            if not signals:
-                return []
-            
-            json_signals = []
-            
-            for signal in signals:
-                json_signal = {}
-                
-                for key, value in signal.items():
-                    if hasattr(value, 'value'):  # Enum değerleri
-                        json_signal[key] = value.value
-                    elif isinstance(value, datetime):
-                        json_signal[key] = value.isoformat()
-                    elif isinstance(value, list):
-                        json_signal[key] = [
-                            item.value if hasattr(item, 'value') else item 
-                            for item in value
-                        ]
-                    else:
-                        json_signal[key] = value
-                
-                json_signals.append(json_signal)
-            
-            return json_signals
-            
-        except Exception as e:
-            logger.error(f"Signals JSON dönüştürme hatası: {e}")
-            return []
+    result = worker.analyze_crypto(symbol, interval)
+    df_with_indicators = result.pop('_df', None)
     
-    def _convert_signal_to_json(self, signal: dict) -> dict:
-        """Tek bir signal'ı JSON'a çevrilebilir hale getirir"""
-        try:
-            if not signal:
-                return {}
-            
-            json_signal = {}
-            
-            for key, value in signal.items():
-                if hasattr(value, 'value'):  # Enum değerleri
-                    json_signal[key] = value.value
-                elif isinstance(value, datetime):
-                    json_signal[key] = value.isoformat()
-                elif isinstance(value, list):
-                    json_signal[key] = [
-                        item.value if hasattr(item, 'value') else item 
-                        for item in value
-                    ]
-                else:
-                    json_signal[key] = value
-            
-            return json_signal
-            
-        except Exception as e:
-            logger.error(f"Signal JSON dönüştürme hatası: {e}")
-            return {}
+    if 'error' not in result:
+        current_signals = result['signals']
+        current_predictions = result['predictions']
+        
+        # Son 100 veriyi sütun bazlı float32 dizi olarak sakla
+        if df_with_indicators is not None:
+            current_data = _frame_to_soa(df_with_indicators.tail(100))
+    
+    return result
 
-# Global analyzer instance
-analyzer = CryptoAnalyzer()
+def _submit_analysis(symbol: str, interval: str) -> str:
+    """Analiz görevini kuyruğa ekler, aynı istek sürüyorsa onun task_id'sini döndürür"""
+    key = (symbol, interval)
+    
+    with _tasks_lock:
+        task_id = _inflight_tasks.get(key)
+        if task_id is not None:
+            return task_id
+        
+        task_id = uuid4().hex
+        future = _get_executor().submit(_run_analysis, symbol, interval)
+        TASKS[task_id] = future
+        _inflight_tasks[key] = task_id
+        
+        # Eski ve tamamlanmış görevleri at
+        for old_id in list(TASKS):
+            if len(TASKS) <= MAX_TASKS:
+                break
+            if TASKS[old_id].done():
+                del TASKS[old_id]
+    
+    def _release(_future):
+        with _tasks_lock:
+            if _inflight_tasks.get(key) == task_id:
+                del _inflight_tasks[key]
+    
+    # Kilit dışında eklenir: görev bitmişse callback hemen bu iş parçacığında çalışır
+    future.add_done_callback(_release)
+    return task_id
 
 @app.route('/')
 def index():
@@ -253,58 +390,76 @@ def index():
 
 @app.route('/analyze', methods=['POST'])
 def analyze():
-    """Kripto para analizi yapar"""
+    """Kripto para analizini arka planda başlatır ve görev kimliğini döndürür"""
     try:
         data = request.get_json()
         symbol = data.get('symbol', 'BTCUSDT')
         interval = data.get('interval', '1h')
         
-        # Analiz yap
-        result = analyzer.analyze_crypto(symbol, interval)
+        task_id = _submit_analysis(symbol, interval)
+        return jsonify({'task_id': task_id, 'status': 'pending'}), 202
         
-        if 'error' in result:
-            return jsonify({'error': result['error']}), 400
+    except Exception as e:
+        logger.error(f"Analiz endpoint hatası: {e}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/analyze/<task_id>')
+def analyze_result(task_id):
+    """Analiz görevinin durumunu veya sonucunu döndürür"""
+    try:
+        future = TASKS.get(task_id)
+        if future is None:
+            return jsonify({'error': 'Görev bulunamadı'}), 404
         
-        # Global değişkenleri güncelle
-        global current_data, current_signals, current_predictions
-        current_signals = result['signals']
-        current_predictions = result['predictions']
+        if not future.done():
+            return jsonify({'task_id': task_id, 'status': 'pending'}), 202
         
-        # DataFrame'i global değişkende sakla (sadece son 100 veri)
-        if 'data' in result and result['data']:
-            # JSON'dan DataFrame'e geri çevir
-            df_data = pd.DataFrame(result['data'])
-            current_data = df_data.tail(100)  # Son 100 veriyi sakla
+        result = future.result()
+        
+        if 'error' in result:
+            return jsonify({'error': result['error']}), 400
         
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"Analiz endpoint hatası: {e}")
+        logger.error(f"Analiz sonuç endpoint hatası: {e}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/symbols')
 def get_symbols():
     """Mevcut kripto para çiftlerini döndürür"""
     try:
-        # Popüler kripto paralar
-        symbols = [
-            'BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'ADAUSDT', 'SOLUSDT',
-            'DOTUSDT', 'DOGEUSDT', 'AVAXUSDT', 'MATICUSDT', 'LINKUSDT',
-            'UNIUSDT', 'LTCUSDT', 'BCHUSDT', 'XLMUSDT', 'VETUSDT'
-        ]
-        
-        return jsonify({'symbols': symbols})
+        return jsonify({'symbols': POPULAR_SYMBOLS})
         
     except Exception as e:
         logger.error(f"Symbols endpoint hatası: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/batch-analyze', methods=['POST'])
+def batch_analyze():
+    """Birden fazla kripto para için toplu analiz yapar"""
+    try:
+        data = request.get_json(silent=True) or {}
+        symbols = data.get('symbols', POPULAR_SYMBOLS)
+        interval = data.get('interval', '1h')
+        with_predictions = bool(data.get('with_predictions', False))
+        
+        result = _get_analyzer().analyze_many(symbols, interval, with_predictions=with_predictions)
+        
+        if 'error' in result:
+            return jsonify({'error': result['error']}), 400
+        
+        return jsonify(result)
+        
+    except Exception as e:
+        logger.error(f"Toplu analiz endpoint hatası: {e}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/market-overview')
 def market_overview():
     """Piyasa genel görünümü"""
     try:
-        collector = BinanceDataCollector()
-        gainers, losers = collector.get_top_gainers_losers(5)
+        gainers, losers = _get_analyzer().data_collector.get_top_gainers_losers(5)
         
         return jsonify({
             'top_gainers': gainers,
@@ -333,9 +488,7 @@ def get_data():
     """Mevcut veriyi döndürür"""
     global current_data
     if current_data is not None:
-        # DataFrame'i JSON'a çevir
-        data_dict = current_data.reset_index().to_dict('records')
-        return jsonify({'data': data_dict})
+        return jsonify({'data': current_data})
     return jsonify({'data': []})
 
 @app.route('/health')
@@ -0,0 +1,26 @@
+"""
+Numba yardımcı modülü
+Numba yüklü değilse njit/prange saf Python karşılıklarına düşer
+"""
+
+import logging
+import os
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError as e:
+    logging.warning(f"Numba yüklenemedi, kernel'ler saf Python ile çalışacak: {e}")
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Numba yoksa fonksiyonu değiştirmeden döndürür"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Kernel'leri import sırasında derle (testlerde KRIPTO_EAGER_JIT=0 ile kapatılabilir)
+EAGER_JIT = NUMBA_AVAILABLE and os.getenv('KRIPTO_EAGER_JIT', '1') == '1'
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE', 'EAGER_JIT']
@@ -0,0 +1,69 @@
+"""
+Veri işleme için Numba kernel'leri
+Özellik mühendisliği hesaplarını tek geçişte yapar
+"""
+
+import numpy as np
+
+from src._njit import EAGER_JIT, njit
+
+
+@njit(cache=True, error_model='numpy')
+def compute_features(close, high, low, volume,
+                     out_pct1, out_pct5, out_pct10,
+                     out_vol, out_volma5, out_volratio):
+    """
+    Fiyat değişimi, volatilite ve hacim özelliklerini tek döngüde hesaplar
+    
+    Çıktılar pandas karşılıklarıyla aynıdır: pct_change(1/5/10),
+    (high - low) / close * 100, rolling(5).mean() ve volume / volume_ma_5.
+    Pencere toplamı kayan bir akümülatörle tutulur; penceredeki NaN
+    sayısı ayrıca izlenir.
+    """
+    n = close.shape[0]
+    window = 5
+    vol_sum = 0.0
+    nan_count = 0
+    
+    for i in range(n):
+        c = close[i]
+        
+        out_pct1[i] = c / close[i - 1] - 1.0 if i >= 1 else np.nan
+        out_pct5[i] = c / close[i - 5] - 1.0 if i >= 5 else np.nan
+        out_pct10[i] = c / close[i - 10] - 1.0 if i >= 10 else np.nan
+        out_vol[i] = (high[i] - low[i]) / c * 100.0
+        
+        # Kayan pencere: yeni değeri ekle, pencereden çıkanı düş
+        v = volume[i]
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            vol_sum += v
+        if i >= window:
+            old = volume[i - window]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                vol_sum -= old
+        
+        if i >= window - 1 and nan_count == 0:
+            ma = vol_sum / window
+            out_volma5[i] = ma
+            out_volratio[i] = v / ma
+        else:
+            out_volma5[i] = np.nan
+            out_volratio[i] = np.nan
+
+
+def _warmup():
+    """
+    Kernel'leri gerçek çağrılarla aynı tiplerle (float64 girdi, float32 çıktı)
+    küçük dizilerle çalıştırır; ilk istek LLVM derlemesini beklemez
+    """
+    inputs = [np.ones(2) for _ in range(4)]
+    outputs = [np.empty(2, dtype=np.float32) for _ in range(6)]
+    compute_features(*inputs, *outputs)
+
+
+if EAGER_JIT:
+    _warmup()
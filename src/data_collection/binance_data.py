@@ -7,6 +7,10 @@ import pandas as pd
 import numpy as np
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 import time
 import logging
 from datetime import datetime, timedelta
@@ -16,11 +20,50 @@ from dotenv import load_dotenv
 # Çevre değişkenlerini yükle
 load_dotenv()
 
+# (api_key, secret_key) -> paylaşılan Client; TCP/TLS bağlantıları collector'lar arasında yeniden kullanılır
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+def _get_client(api_key=None, secret_key=None):
+    """
+    Anahtar çifti başına tek bir Binance Client döndürür
+    
+    İlk oluşturmada oturuma bağlantı havuzu ve yeniden deneme politikası takılır.
+    """
+    key = (api_key, secret_key)
+    client = _CLIENTS.get(key)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                client = Client(api_key, secret_key) if api_key and secret_key else Client()
+                adapter = HTTPAdapter(
+                    pool_connections=8,
+                    pool_maxsize=32,
+                    max_retries=Retry(total=3, backoff_factor=0.1)
+                )
+                client.session.mount('https://', adapter)
+                client.session.mount('http://', adapter)
+                _CLIENTS[key] = client
+    return client
+
 class BinanceDataCollector:
     """
     Binance API'den kripto para verilerini toplayan sınıf
     """
     
+    # Kline verisinden alınan sayısal sütunlar
+    OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+    
+    # Fiyatlar float64 kalır: float32'nin ~7 basamağı düşük volatilitede
+    # (saatlik ~%0.05) çubuk aralıklarını bozar ve stoch/RSI'da 1e-5'i aşan
+    # sapma üretir. Hacim yalnızca toplanır/oranlanır, float32 yeterlidir.
+    OHLCV_DTYPES = {'open': np.float64, 'high': np.float64, 'low': np.float64,
+                    'close': np.float64, 'volume': np.float32}
+    
+    # Yükselen/düşen listesinin önbellek süresi (saniye)
+    GAINERS_LOSERS_TTL = 30
+    
     def __init__(self, api_key=None, secret_key=None):
         """
         BinanceDataCollector sınıfını başlatır
@@ -32,16 +75,19 @@ class BinanceDataCollector:
         self.api_key = api_key or os.getenv('BINANCE_API_KEY')
         self.secret_key = secret_key or os.getenv('BINANCE_SECRET_KEY')
         
-        # API anahtarları yoksa sadece public veriler için client oluştur
+        # API anahtarları yoksa sadece public veriler için client kullan
         if self.api_key and self.secret_key:
-            self.client = Client(self.api_key, self.secret_key)
+            self.client = _get_client(self.api_key, self.secret_key)
         else:
-            self.client = Client()
+            self.client = _get_client()
             
         # Loglama ayarları
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         
+        # (zaman, limit, gainers, losers) önbelleği
+        self._gl_cache = None
+        
     def get_historical_data(self, symbol, interval, start_date=None, end_date=None, limit=1000):
         """
         Belirtilen kripto para için geçmiş verileri çeker
@@ -80,23 +126,15 @@ class BinanceDataCollector:
                 limit=limit
             )
             
-            # Verileri DataFrame'e dönüştür
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_asset_volume', 'number_of_trades',
-                'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-            ])
-            
-            # Veri tiplerini düzenle
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df['open'] = df['open'].astype(float)
-            df['high'] = df['high'].astype(float)
-            df['low'] = df['low'].astype(float)
-            df['close'] = df['close'].astype(float)
-            df['volume'] = df['volume'].astype(float)
-            
-            # Gereksiz sütunları kaldır
-            df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+            # Sadece ihtiyaç duyulan ilk 6 alanı al (timestamp + OHLCV)
+            arr = np.array([k[:6] for k in klines], dtype=object).reshape(-1, 6)
+            
+            # DataFrame'i tipleri belli sütunlardan tek seferde oluştur (OHLCV_DTYPES)
+            df = pd.DataFrame({
+                'timestamp': pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms'),
+                **{col: arr[:, i].astype(self.OHLCV_DTYPES[col])
+                   for i, col in enumerate(self.OHLCV_COLUMNS, start=1)}
+            })
             df.set_index('timestamp', inplace=True)
             
             self.logger.info(f"{len(df)} adet veri başarıyla çekildi")
@@ -109,6 +147,32 @@ class BinanceDataCollector:
             self.logger.error(f"Beklenmeyen hata: {e}")
             return pd.DataFrame()
     
+    def get_historical_data_many(self, symbols, interval, limit=1000, max_workers=8):
+        """
+        Birden fazla kripto para için geçmiş verileri paralel çeker
+        
+        İstekler I/O beklediği için iş parçacıklarıyla örtüştürülür; toplam süre
+        en yavaş isteğe yaklaşır. Paylaşılan oturumun bağlantı havuzu kullanılır.
+        
+        Args:
+            symbols (list): Kripto para çiftleri
+            interval (str): Zaman aralığı ('1h', '4h', '1d', vb.)
+            limit (int): Sembol başına maksimum veri sayısı
+            max_workers (int): Eşzamanlı istek sayısı
+            
+        Returns:
+            dict: Sembol -> OHLCV DataFrame (hata durumunda boş DataFrame)
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_historical_data, symbol, interval, limit=limit): symbol
+                for symbol in symbols
+            }
+            results = {futures[future]: future.result() for future in as_completed(futures)}
+        
+        # Girdi sırasını koru
+        return {symbol: results[symbol] for symbol in symbols}
+    
     def get_current_price(self, symbol):
         """
         Belirtilen kripto paranın güncel fiyatını alır
@@ -160,17 +224,28 @@ class BinanceDataCollector:
         Returns:
             tuple: (gainers, losers) listeleri
         """
+        # Önbellek geçerliyse tüm ticker listesini tekrar çekme
+        cache = self._gl_cache
+        if cache is not None and cache[1] == limit and time.time() - cache[0] < self.GAINERS_LOSERS_TTL:
+            return cache[2], cache[3]
+        
         try:
             # Tüm ticker'ları al
             tickers = self.client.get_ticker()
             
-            # USDT çiftlerini filtrele
-            usdt_pairs = [t for t in tickers if t['symbol'].endswith('USDT')]
+            if not tickers:
+                return [], []
+            
+            # USDT çiftlerini vektörel olarak filtrele
+            tdf = pd.DataFrame(tickers)
+            tdf = tdf[tdf['symbol'].str.endswith('USDT')]
+            pct = tdf['priceChangePercent'].astype(np.float32)
             
-            # Yüzde değişime göre sırala
-            gainers = sorted(usdt_pairs, key=lambda x: float(x['priceChangePercent']), reverse=True)[:limit]
-            losers = sorted(usdt_pairs, key=lambda x: float(x['priceChangePercent']))[:limit]
+            # Sadece uçlardaki limit kadar elemanı seç (tam sıralama yerine kısmi seçim)
+            gainers = tdf.loc[pct.nlargest(limit).index].to_dict('records')
+            losers = tdf.loc[pct.nsmallest(limit).index].to_dict('records')
             
+            self._gl_cache = (time.time(), limit, gainers, losers)
             return gainers, losers
             
         except Exception as e:
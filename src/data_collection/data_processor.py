@@ -5,8 +5,12 @@ Bu modül kripto verilerini temizler ve işler
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Optional, Dict, Any
 import logging
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
+
+from ._kernels import compute_features
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,9 @@ class DataProcessor:
         """
         Veriyi temizler (boş değerler, duplikatlar vb.)
         
+        Girdi değiştirilmez; doldurma ve filtreleme adımları zaten yeni
+        DataFrame döndürdüğü için baştan kopya alınmaz.
+        
         Args:
             df (pd.DataFrame): Ham veri
             
@@ -33,21 +40,18 @@ class DataProcessor:
         try:
             logger.info("Veri temizleme başlatılıyor...")
             
-            # Kopya oluştur
-            cleaned_df = df.copy()
-            
             # Boş değerleri doldur
-            cleaned_df = cleaned_df.fillna(method='ffill')
-            cleaned_df = cleaned_df.fillna(method='bfill')
+            cleaned_df = df.ffill().bfill()
             
             # Duplikatları kaldır
             cleaned_df = cleaned_df.drop_duplicates()
             
-            # Sıfır veya negatif fiyatları kaldır
-            price_columns = ['open', 'high', 'low', 'close']
-            for col in price_columns:
-                if col in cleaned_df.columns:
-                    cleaned_df = cleaned_df[cleaned_df[col] > 0]
+            # Sıfır veya negatif fiyatları tek maskeyle kaldır
+            price_columns = [col for col in ('open', 'high', 'low', 'close') if col in cleaned_df.columns]
+            if price_columns:
+                price_mat = cleaned_df[price_columns].to_numpy()
+                mask = (price_mat > 0).all(axis=1)
+                cleaned_df = cleaned_df.loc[mask]
             
             logger.info(f"Veri temizlendi. Satır sayısı: {len(cleaned_df)}")
             return cleaned_df
@@ -70,18 +74,23 @@ class DataProcessor:
         try:
             logger.info(f"Veri normalleştirme başlatılıyor ({method})...")
             
-            normalized_df = df.copy()
             numeric_columns = df.select_dtypes(include=[np.number]).columns
             
             if method == 'minmax':
-                from sklearn.preprocessing import MinMaxScaler
-                scaler = MinMaxScaler()
-                normalized_df[numeric_columns] = scaler.fit_transform(df[numeric_columns])
-                
+                scaler = MinMaxScaler(copy=False)
             elif method == 'zscore':
-                from sklearn.preprocessing import StandardScaler
-                scaler = StandardScaler()
-                normalized_df[numeric_columns] = scaler.fit_transform(df[numeric_columns])
+                scaler = StandardScaler(copy=False)
+            else:
+                scaler = None
+            
+            normalized_df = df.copy(deep=False)
+            
+            if scaler is not None:
+                # Tek bir float32 kopya üzerinde yerinde ölçekle
+                arr = df[numeric_columns].to_numpy(dtype=np.float32, copy=True)
+                scaler.fit(arr)
+                arr = scaler.transform(arr)
+                normalized_df[numeric_columns] = arr
             
             logger.info("Veri normalleştirme tamamlandı")
             return normalized_df
@@ -94,6 +103,10 @@ class DataProcessor:
         """
         Yeni özellikler ekler
         
+        Sütunlar girdinin sığ kopyasına eklenir: girdi DataFrame'e yeni sütun
+        eklenmez, fakat mevcut sütunların verisi paylaşılır. Dönen DataFrame'deki
+        mevcut sütunlar yerinde değiştirilecekse önce derin kopya alınmalıdır.
+        
         Args:
             df (pd.DataFrame): Mevcut veri
             
@@ -103,28 +116,48 @@ class DataProcessor:
         try:
             logger.info("Yeni özellikler ekleniyor...")
             
-            enhanced_df = df.copy()
+            enhanced_df = df.copy(deep=False)
+            
+            # Fiyat, volatilite ve hacim özelliklerini tek geçişte hesapla
+            n = len(df)
+            outputs = {name: np.empty(n, dtype=np.float32) for name in (
+                'price_change_pct', 'price_change_pct_5', 'price_change_pct_10',
+                'volatility', 'volume_ma_5', 'volume_ratio'
+            )}
+            compute_features(
+                self._column_array(df, 'close'),
+                self._column_array(df, 'high'),
+                self._column_array(df, 'low'),
+                self._column_array(df, 'volume'),
+                *outputs.values()
+            )
             
             # Fiyat değişim oranları
             if 'close' in df.columns:
-                enhanced_df['price_change_pct'] = df['close'].pct_change()
-                enhanced_df['price_change_pct_5'] = df['close'].pct_change(5)
-                enhanced_df['price_change_pct_10'] = df['close'].pct_change(10)
+                enhanced_df['price_change_pct'] = outputs['price_change_pct']
+                enhanced_df['price_change_pct_5'] = outputs['price_change_pct_5']
+                enhanced_df['price_change_pct_10'] = outputs['price_change_pct_10']
             
             # Volatilite
             if 'high' in df.columns and 'low' in df.columns:
-                enhanced_df['volatility'] = (df['high'] - df['low']) / df['close'] * 100
+                enhanced_df['volatility'] = outputs['volatility']
             
             # Hacim özellikleri
             if 'volume' in df.columns:
-                enhanced_df['volume_ma_5'] = df['volume'].rolling(5).mean()
-                enhanced_df['volume_ratio'] = df['volume'] / enhanced_df['volume_ma_5']
-            
-            # Zaman bazlı özellikler
-            if df.index.dtype == 'datetime64[ns]':
-                enhanced_df['hour'] = df.index.hour
-                enhanced_df['day_of_week'] = df.index.dayofweek
-                enhanced_df['month'] = df.index.month
+                enhanced_df['volume_ma_5'] = outputs['volume_ma_5']
+                enhanced_df['volume_ratio'] = outputs['volume_ratio']
+            
+            # Zaman bazlı özellikler (tüm birim/saat dilimi türleri için)
+            if isinstance(df.index, pd.DatetimeIndex):
+                # Yerel saat değerleri üzerinden epoch saniyesi
+                index = df.index.tz_localize(None) if df.index.tz is not None else df.index
+                secs = index.to_numpy().astype('datetime64[s]').astype(np.int64)
+                days = secs // 86400
+                
+                enhanced_df['hour'] = ((secs // 3600) % 24).astype(np.int8)
+                # 1970-01-01 Perşembe; pandas dayofweek'te Pazartesi=0, Perşembe=3
+                enhanced_df['day_of_week'] = ((days + 3) % 7).astype(np.int8)
+                enhanced_df['month'] = index.month.to_numpy().astype(np.int8)
             
             logger.info("Yeni özellikler eklendi")
             return enhanced_df
@@ -133,6 +166,13 @@ class DataProcessor:
             logger.error(f"Özellik ekleme hatası: {e}")
             return df
     
+    @staticmethod
+    def _column_array(df: pd.DataFrame, column: str) -> np.ndarray:
+        """Sütunu kernel girdisi olarak float64 diziye çevirir, yoksa NaN dizisi döndürür"""
+        if column in df.columns:
+            return np.ascontiguousarray(df[column].to_numpy(dtype=np.float64))
+        return np.full(len(df), np.nan)
+    
     def process_data(self, df: pd.DataFrame, 
                     clean: bool = True, 
                     normalize: bool = False, 
@@ -140,6 +180,9 @@ class DataProcessor:
         """
         Tam veri işleme pipeline'ı
         
+        Pipeline boyunca tek bir sığ kopya taşınır; gerçek kopya yalnızca
+        normalleştirmede (orijinal ölçeği korumak için) alınır.
+        
         Args:
             df (pd.DataFrame): Ham veri
             clean (bool): Veri temizleme yapılsın mı
@@ -152,7 +195,7 @@ class DataProcessor:
         try:
             logger.info("Veri işleme pipeline başlatılıyor...")
             
-            processed_df = df.copy()
+            processed_df = df.copy(deep=False)
             
             # Veri temizleme
             if clean:
@@ -187,7 +230,8 @@ class DataProcessor:
             sequence_length (int): Sekans uzunluğu
             
         Returns:
-            tuple: (X, y) eğitim verisi
+            tuple: (X, y) eğitim verisi. X, float32 dizinin üzerinde salt okunur
+            bir görünümdür; değiştirilecekse np.ascontiguousarray ile kopyalanmalıdır.
         """
         try:
             logger.info("Eğitim verisi hazırlanıyor...")
@@ -199,15 +243,16 @@ class DataProcessor:
             if target_column not in numeric_df.columns:
                 raise ValueError(f"Hedef sütun '{target_column}' bulunamadı")
             
-            # Sekanslar oluştur
-            X, y = [], []
-            
-            for i in range(sequence_length, len(numeric_df)):
-                X.append(numeric_df.iloc[i-sequence_length:i].values)
-                y.append(numeric_df[target_column].iloc[i])
+            arr = numeric_df.to_numpy(dtype=np.float32, copy=False)
+            n_features = arr.shape[1]
             
-            X = np.array(X)
-            y = np.array(y)
+            if len(arr) <= sequence_length:
+                X = np.empty((0, sequence_length, n_features), dtype=np.float32)
+                y = np.empty(0, dtype=np.float32)
+            else:
+                # Sekanslar oluştur (kopyasız, salt okunur görünüm)
+                X = sliding_window_view(arr, window_shape=(sequence_length, n_features))[:-1, 0]
+                y = arr[sequence_length:, numeric_df.columns.get_loc(target_column)]
             
             logger.info(f"Eğitim verisi hazırlandı. X shape: {X.shape}, y shape: {y.shape}")
             
@@ -0,0 +1,49 @@
+"""
+Tahmin modelleri için Numba kernel'leri
+Doğruluk metriklerini tek geçişte hesaplar
+"""
+
+import math
+
+import numpy as np
+
+from src._njit import EAGER_JIT, njit, prange
+
+
+# nnan/ninf bayrakları bilinçli olarak dışarıda: girdideki NaN'lar sonuca yansımalı
+@njit(parallel=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'},
+      cache=True, error_model='numpy')
+def prediction_metrics(actual, predicted):
+    """
+    MAE, MSE, RMSE ve MAPE değerlerini dizileri bir kez dolaşarak hesaplar
+    
+    MAPE paydası max(|gerçek|, 1e-8) ile sınırlanır; sıfır gerçek değer inf üretmez.
+    
+    Returns:
+        Tuple: (mae, mse, rmse, mape)
+    """
+    n = actual.size
+    s_abs = 0.0
+    s_sq = 0.0
+    s_ape = 0.0
+    
+    for i in prange(n):
+        d = actual[i] - predicted[i]
+        s_abs += abs(d)
+        s_sq += d * d
+        s_ape += abs(d) / max(abs(actual[i]), 1e-8)
+    
+    mse = s_sq / n
+    return s_abs / n, mse, math.sqrt(mse), 100.0 * s_ape / n
+
+
+def _warmup():
+    """
+    Kernel'i gerçek çağrılarla aynı tiplerle (float64) küçük dizilerle çalıştırır;
+    ilk istek LLVM derlemesini beklemez
+    """
+    prediction_metrics(np.ones(2), np.ones(2))
+
+
+if EAGER_JIT:
+    _warmup()
@@ -8,36 +8,186 @@ import numpy as np
 import logging
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+from numpy.lib.stride_tricks import sliding_window_view
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+import hashlib
+import multiprocessing
+import threading
+import os
 import warnings
-warnings.filterwarnings('ignore')
 
 # Makine öğrenmesi kütüphaneleri
 try:
     from prophet import Prophet
-    from sklearn.preprocessing import MinMaxScaler
-    from sklearn.metrics import mean_absolute_error, mean_squared_error
     import tensorflow as tf
     from tensorflow.keras.models import Sequential
-    from tensorflow.keras.layers import LSTM, Dense, Dropout
+    from tensorflow.keras.layers import LSTM, Dense, Dropout, Input
     from tensorflow.keras.optimizers import Adam
+    from tensorflow.keras.callbacks import CallbackList, EarlyStopping, ReduceLROnPlateau
     from statsmodels.tsa.arima.model import ARIMA
     from statsmodels.tsa.stattools import adfuller
+    from statsmodels.tools.sm_exceptions import ConvergenceWarning
     PROPHET_AVAILABLE = True
 except ImportError as e:
     logging.warning(f"Bazı ML kütüphaneleri yüklenemedi: {e}")
     PROPHET_AVAILABLE = False
 
+# Derlenmiş ARIMA (opsiyonel, yoksa statsmodels kullanılır)
+try:
+    from statsforecast.models import ARIMA as SF_ARIMA
+    STATSFORECAST_AVAILABLE = True
+except ImportError:
+    STATSFORECAST_AVAILABLE = False
+
+from src.ml_models._kernels import prediction_metrics
+
+# Ensemble modelleri ayrı süreçlerde eğitilir; havuz ilk kullanımda bir kez oluşturulur
+ENSEMBLE_WORKERS = 3
+_ENSEMBLE_POOL = None
+_ENSEMBLE_POOL_LOCK = threading.Lock()
+
+def _init_ensemble_worker(cpu_queue):
+    """
+    Ensemble alt sürecini kendi CPU alt kümesine sabitler
+    
+    TF/BLAS iş parçacıklarının süreçler arasında çekişmemesi için her süreç
+    kuyruktan bir CPU kümesi alır ve iş parçacığı sayısını ona göre sınırlar.
+    
+    Args:
+        cpu_queue: Süreç başına bir CPU listesi içeren kuyruk
+    """
+    try:
+        cpus = cpu_queue.get_nowait()
+    except Exception:
+        return
+    
+    threads = str(max(1, len(cpus)))
+    for var in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+        os.environ[var] = threads
+    
+    try:
+        if cpus and hasattr(os, 'sched_setaffinity'):
+            os.sched_setaffinity(0, cpus)
+        if PROPHET_AVAILABLE:
+            tf.config.threading.set_intra_op_parallelism_threads(int(threads))
+            tf.config.threading.set_inter_op_parallelism_threads(1)
+    except Exception as e:
+        logging.warning(f"Ensemble süreci yapılandırılamadı: {e}")
+
+def _get_ensemble_pool() -> ProcessPoolExecutor:
+    """
+    Paylaşılan ensemble süreç havuzunu döndürür
+    
+    TF'nin fork sonrası güvenli olmaması nedeniyle süreçler spawn ile başlatılır.
+    
+    Returns:
+        ProcessPoolExecutor: Ensemble süreç havuzu
+    """
+    global _ENSEMBLE_POOL
+    if _ENSEMBLE_POOL is None:
+        with _ENSEMBLE_POOL_LOCK:
+            if _ENSEMBLE_POOL is None:
+                if hasattr(os, 'sched_getaffinity'):
+                    cpus = sorted(os.sched_getaffinity(0))
+                else:
+                    cpus = list(range(os.cpu_count() or 1))
+                
+                ctx = multiprocessing.get_context('spawn')
+                cpu_queue = ctx.Queue()
+                for i in range(ENSEMBLE_WORKERS):
+                    cpu_queue.put(cpus[i::ENSEMBLE_WORKERS])
+                
+                _ENSEMBLE_POOL = ProcessPoolExecutor(
+                    max_workers=ENSEMBLE_WORKERS,
+                    mp_context=ctx,
+                    initializer=_init_ensemble_worker,
+                    initargs=(cpu_queue,)
+                )
+    return _ENSEMBLE_POOL
+
+def _train_model_in_process(model_name: str, df: pd.DataFrame,
+                            scale: Optional[Tuple[float, float]] = None) -> Tuple[Dict, Optional[Tuple]]:
+    """
+    Tek bir modeli alt süreçte eğitir
+    
+    Args:
+        model_name (str): 'prophet', 'lstm' veya 'arima'
+        df (pd.DataFrame): Eğitim verisi
+        scale (Optional[Tuple]): Ana süreçte daha önce uydurulmuş (lo, span)
+        
+    Returns:
+        Tuple: (model sonucu, LSTM için ölçekleme parametreleri (lo, span))
+    """
+    predictor = PricePredictor()
+    if scale is not None:
+        predictor._scale_lo, predictor._scale_span = scale
+        predictor._scaler_fitted = True
+    train = {
+        'prophet': predictor.train_prophet_model,
+        'lstm': predictor.train_lstm_model,
+        'arima': predictor.train_arima_model
+    }[model_name]
+    result = train(df)
+    scale = (predictor._scale_lo, predictor._scale_span) if model_name == 'lstm' else None
+    return result, scale
+
+# Tensor Core'lu GPU (compute capability >= 7.0) varsa LSTM'i mixed_float16 ile eğit
+# GPU yoksa, KRIPTO_BF16=1 ile bfloat16 destekli CPU'larda mixed_bfloat16 kullanılır
+# (kayıp ölçekleme gerekmez; varsayılan kapalı çünkü her CPU'da hızlanma sağlamaz)
+MIXED_PRECISION = False
+BF16_PRECISION = False
+# Eğitim adımı yalnızca GPU'da XLA ile derlenir; CPU'da her yeni model için
+# derleme süresi eğitimden uzun sürer
+XLA_TRAINING = False
+
+def _cpu_supports_bf16() -> bool:
+    """CPU'nun AVX512-BF16 veya AMX-BF16 desteği olup olmadığını döndürür"""
+    try:
+        with open('/proc/cpuinfo') as f:
+            flags = f.read()
+        return 'avx512_bf16' in flags or 'amx_bf16' in flags
+    except OSError:
+        return False
+
+try:
+    from tensorflow.keras import mixed_precision
+    XLA_TRAINING = bool(tf.config.list_physical_devices('GPU'))
+    for _gpu in tf.config.list_physical_devices('GPU'):
+        _capability = tf.config.experimental.get_device_details(_gpu).get('compute_capability')
+        if _capability and _capability >= (7, 0):
+            mixed_precision.set_global_policy('mixed_float16')
+            MIXED_PRECISION = True
+            break
+    
+    if not MIXED_PRECISION and os.getenv('KRIPTO_BF16', '0') == '1' and _cpu_supports_bf16():
+        mixed_precision.set_global_policy('mixed_bfloat16')
+        BF16_PRECISION = True
+except Exception as e:
+    logging.warning(f"Mixed precision etkinleştirilemedi: {e}")
+
 class PricePredictor:
     """
     Fiyat tahmin modellerini yöneten sınıf
     """
     
+    # Önbellekte tutulacak en fazla model sonucu
+    MAX_CACHED_MODELS = 32
+    
     def __init__(self):
         """PricePredictor sınıfını başlatır"""
         self.logger = logging.getLogger(__name__)
-        self.scaler = MinMaxScaler()
+        # Min-max ölçekleme parametreleri: scaled = (x - lo) / span
+        self._scale_lo = 0.0
+        self._scale_span = 1.0
+        # İlk eğitimde uydurulur, sonraki çağrılar aynı ölçeği kullanır
+        self._scaler_fitted = False
         self.models = {}
         self.predictions = {}
+        # (model, lookback, steps, derlenmiş tahmin fonksiyonu)
+        self._roll_forecast = None
+        # (veri parmak izi, model adı) -> (sonuç, LSTM ölçeği)
+        self._model_cache = OrderedDict()
         
     def prepare_data_for_prophet(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -60,13 +210,19 @@ class PricePredictor:
             self.logger.error(f"Prophet veri hazırlama hatası: {e}")
             return pd.DataFrame()
     
-    def train_prophet_model(self, df: pd.DataFrame, periods: int = 24) -> Dict:
+    def train_prophet_model(self, df: pd.DataFrame, periods: int = 24,
+                            uncertainty_samples: int = 0) -> Dict:
         """
         Prophet modelini eğitir ve tahmin yapar
         
+        Veri aralığının kapsamadığı mevsimsellikler (örn. bir yıldan kısa veride
+        yıllık) kapatılır. uncertainty_samples=0 iken posterior örnekleme atlanır
+        ve yhat_lower/yhat_upper, yhat ile doldurulur.
+        
         Args:
             df (pd.DataFrame): Eğitim verisi
             periods (int): Tahmin edilecek periyot sayısı
+            uncertainty_samples (int): Güven aralığı için örnek sayısı (0: kapalı)
             
         Returns:
             Dict: Model sonuçları
@@ -81,19 +237,30 @@ class PricePredictor:
             if prophet_df.empty:
                 return {'error': 'Veri hazırlama başarısız'}
             
+            # Sadece veri aralığının desteklediği mevsimsellikleri aç
+            span = prophet_df['ds'].max() - prophet_df['ds'].min()
+            
             # Prophet modelini oluştur ve eğit
             model = Prophet(
-                yearly_seasonality=True,
-                weekly_seasonality=True,
-                daily_seasonality=True,
-                seasonality_mode='multiplicative'
+                yearly_seasonality=bool(span > pd.Timedelta(days=365)),
+                weekly_seasonality=bool(span > pd.Timedelta(days=14)),
+                daily_seasonality=bool(span > pd.Timedelta(days=2)),
+                seasonality_mode='multiplicative',
+                uncertainty_samples=uncertainty_samples
             )
             
-            model.fit(prophet_df)
+            # Prophet içindeki pandas kullanım uyarıları yalnızca burada bastırılır
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', FutureWarning)
+                model.fit(prophet_df)
+                
+                # Gelecek tarihleri oluştur
+                future = model.make_future_dataframe(periods=periods, freq='h')
+                forecast = model.predict(future)
             
-            # Gelecek tarihleri oluştur
-            future = model.make_future_dataframe(periods=periods, freq='H')
-            forecast = model.predict(future)
+            if not uncertainty_samples:
+                forecast['yhat_lower'] = forecast['yhat']
+                forecast['yhat_upper'] = forecast['yhat']
             
             # Sonuçları hazırla
             result = {
@@ -113,31 +280,46 @@ class PricePredictor:
             self.logger.error(f"Prophet model hatası: {e}")
             return {'error': str(e)}
     
-    def prepare_data_for_lstm(self, df: pd.DataFrame, lookback: int = 60) -> Tuple[np.ndarray, np.ndarray]:
+    def prepare_data_for_lstm(self, df: pd.DataFrame, lookback: int = 60,
+                              contiguous: bool = False) -> Tuple[np.ndarray, np.ndarray]:
         """
         LSTM modeli için veriyi hazırlar
         
         Args:
             df (pd.DataFrame): OHLCV verileri
             lookback (int): Geriye bakılacak periyot sayısı
+            contiguous (bool): X'i yazılabilir, bitişik bir diziye kopyala
             
         Returns:
-            Tuple: (X, y) eğitim verileri
+            Tuple: (X, y) eğitim verileri; contiguous=False iken X, ölçeklenmiş
+            seriye salt okunur bir görünümdür
         """
         try:
             # Sadece close fiyatlarını al
-            data = df['close'].values.reshape(-1, 1)
+            data = df['close'].to_numpy()
+            
+            # Ölçek ilk çağrıda uydurulur (tek min/max geçişi), sonra yeniden kullanılır
+            if not self._scaler_fitted:
+                lo, hi = float(np.nanmin(data)), float(np.nanmax(data))
+                self._scale_lo, self._scale_span = lo, (hi - lo) or 1.0
+                self._scaler_fitted = True
             
-            # Veriyi normalize et
-            scaled_data = self.scaler.fit_transform(data)
+            # Veriyi ölçekle: float32 tek tampon (X ve y de float32 görünümlerdir)
+            scaled_data = np.subtract(data, self._scale_lo, dtype=np.float32)
+            scaled_data *= np.float32(1.0 / self._scale_span)
             
-            X, y = [], []
-            for i in range(lookback, len(scaled_data)):
-                X.append(scaled_data[i-lookback:i, 0])
-                y.append(scaled_data[i, 0])
+            if len(scaled_data) <= lookback:
+                return np.array([]), np.array([])
             
-            X, y = np.array(X), np.array(y)
-            X = np.reshape(X, (X.shape[0], X.shape[1], 1))
+            # Pencereler kopyasız görünüm olarak oluşturulur (salt okunur)
+            X = sliding_window_view(scaled_data, lookback)[:-1, :, None]
+            y = scaled_data[lookback:]
+            
+            if contiguous:
+                # Önceden ayrılmış tampona tek bir strided kopya
+                buf = np.empty(X.shape, dtype=np.float32)
+                np.copyto(buf, X)
+                X = buf
             
             return X, y
             
@@ -152,7 +334,7 @@ class PricePredictor:
         Args:
             df (pd.DataFrame): Eğitim verisi
             lookback (int): Geriye bakılacak periyot sayısı
-            epochs (int): Eğitim epoch sayısı
+            epochs (int): Eğitim epoch sayısı (en fazla 30; erken durdurma ile daha az olabilir)
             
         Returns:
             Dict: Model sonuçları
@@ -169,46 +351,53 @@ class PricePredictor:
             X_train, X_test = X[:train_size], X[train_size:]
             y_train, y_test = y[:train_size], y[train_size:]
             
-            # LSTM modelini oluştur
+            # LSTM modelini oluştur (birim sayısı Tensor Core için 8'in katı)
             model = Sequential([
-                LSTM(50, return_sequences=True, input_shape=(lookback, 1)),
+                Input(shape=(lookback, 1)),
+                LSTM(64, return_sequences=True),
                 Dropout(0.2),
-                LSTM(50, return_sequences=False),
+                LSTM(64, return_sequences=False),
                 Dropout(0.2),
-                Dense(1)
+                # Mixed precision'da da çıktı ve loss float32 kalır
+                Dense(1, dtype='float32')
             ])
             
-            model.compile(optimizer=Adam(learning_rate=0.001), loss='mse')
-            
-            # Modeli eğit
-            history = model.fit(
-                X_train, y_train,
-                epochs=epochs,
-                batch_size=32,
-                validation_data=(X_test, y_test),
-                verbose=0
+            optimizer = Adam(learning_rate=0.001)
+            if MIXED_PRECISION:
+                optimizer = mixed_precision.LossScaleOptimizer(optimizer)
+            
+            model.compile(optimizer=optimizer, loss='mse')
+            
+            # Doğrulama kaybı iyileşmeyi bırakınca erken dur, plato'da öğrenme oranını düşür
+            callbacks = [
+                EarlyStopping(monitor='val_loss', patience=5, restore_best_weights=True),
+                ReduceLROnPlateau(monitor='val_loss', factor=0.5, patience=2)
+            ]
+            
+            # Modeli eğit (zaman serisi: sıra korunur)
+            history = self._fit_lstm(
+                model, optimizer, lookback,
+                X_train, y_train, X_test, y_test,
+                epochs=min(epochs, 30),
+                batch_size=64,
+                callbacks=callbacks
             )
             
-            # Test tahminleri
-            test_predictions = model.predict(X_test)
-            test_predictions = self.scaler.inverse_transform(test_predictions)
-            y_test_actual = self.scaler.inverse_transform(y_test.reshape(-1, 1))
-            
-            # Gelecek tahminleri için son verileri kullan
-            last_sequence = X[-1:]
-            future_predictions = []
+            # Test tahminleri: predict yerine doğrudan model çağrısı (512'lik parçalar)
+            test_predictions = np.concatenate([
+                model(X_test[i:i + 512], training=False).numpy()
+                for i in range(0, len(X_test), 512)
+            ])
+            test_predictions = self._inverse(test_predictions)
+            y_test_actual = self._inverse(y_test)
             
-            for _ in range(24):  # 24 saatlik tahmin
-                next_pred = model.predict(last_sequence)
-                future_predictions.append(next_pred[0, 0])
-                
-                # Sequence'i güncelle
-                last_sequence = np.roll(last_sequence, -1)
-                last_sequence[0, -1, 0] = next_pred[0, 0]
+            # Gelecek tahminleri için son verileri kullan (24 adım tek graph çağrısında)
+            roll_forecast = self._get_roll_forecast(model, lookback, steps=24)
+            future_predictions = roll_forecast(tf.constant(X[-1:], tf.float32)).numpy()
             
             # Tahminleri denormalize et
-            future_predictions = np.array(future_predictions).reshape(-1, 1)
-            future_predictions = self.scaler.inverse_transform(future_predictions)
+            future_predictions = future_predictions.reshape(-1, 1)
+            future_predictions = self._inverse(future_predictions)
             
             result = {
                 'model': model,
@@ -229,10 +418,186 @@ class PricePredictor:
             self.logger.error(f"LSTM model hatası: {e}")
             return {'error': str(e)}
     
+    def refit_scaler(self):
+        """
+        Ölçekleme parametrelerini sıfırlar; bir sonraki LSTM veri hazırlığında
+        yeniden uydurulur (örn. sembol veya piyasa rejimi değiştiğinde)
+        """
+        self._scaler_fitted = False
+    
+    def _inverse(self, x: np.ndarray) -> np.ndarray:
+        """
+        Ölçeklenmiş değerleri fiyat birimine geri çevirir
+        
+        Args:
+            x (np.ndarray): [0, 1] aralığındaki değerler
+            
+        Returns:
+            np.ndarray: float64 fiyatlar
+        """
+        return np.asarray(x, dtype=np.float64) * self._scale_span + self._scale_lo
+    
+    def _fit_lstm(self, model, optimizer, lookback: int,
+                  X_train: np.ndarray, y_train: np.ndarray,
+                  X_test: np.ndarray, y_test: np.ndarray,
+                  epochs: int, batch_size: int = 64, callbacks: Optional[List] = None):
+        """
+        LSTM'i derlenmiş eğitim adımıyla, model.fit olmadan eğitir
+        
+        Epoch'lar sırayla (karıştırmadan) batch'lere bölünür; Keras callback'leri
+        epoch sonunda train/val kaybıyla çağrılır ve History döndürülür.
+        
+        Args:
+            model: Derlenmiş Keras modeli
+            optimizer: Model optimizer'ı
+            lookback (int): Pencere uzunluğu
+            X_train, y_train (np.ndarray): Eğitim verisi
+            X_test, y_test (np.ndarray): Doğrulama verisi
+            epochs (int): En fazla epoch sayısı
+            batch_size (int): Batch boyutu
+            callbacks (Optional[List]): Keras callback'leri
+            
+        Returns:
+            History: Epoch bazında loss/val_loss kaydı
+        """
+        train_step, eval_step = self._build_train_step(model, optimizer, lookback)
+        
+        X_train, y_train = tf.constant(X_train), tf.constant(y_train)
+        X_test, y_test = tf.constant(X_test), tf.constant(y_test)
+        n = int(X_train.shape[0])
+        
+        callback_list = CallbackList(callbacks, add_history=True, model=model)
+        callback_list.on_train_begin()
+        model.stop_training = False
+        
+        for epoch in range(epochs):
+            callback_list.on_epoch_begin(epoch)
+            
+            total = 0.0
+            for start in range(0, n, batch_size):
+                x, y = X_train[start:start + batch_size], y_train[start:start + batch_size]
+                total += float(train_step(x, y)) * int(x.shape[0])
+            
+            logs = {'loss': total / n, 'val_loss': float(eval_step(X_test, y_test))}
+            callback_list.on_epoch_end(epoch, logs)
+            if model.stop_training:
+                break
+        
+        callback_list.on_train_end()
+        return model.history
+    
+    @staticmethod
+    def _build_train_step(model, optimizer, lookback: int):
+        """
+        Sabit girdi imzalı eğitim ve doğrulama adımlarını derler
+        
+        GPU varsa eğitim adımı jit_compile ile XLA'ya derlenir; mixed_float16'da kayıp
+        optimizer.scale_loss ile ölçeklenir ve apply_gradients geri çevirir.
+        
+        Args:
+            model: Keras modeli
+            optimizer: Model optimizer'ı
+            lookback (int): Pencere uzunluğu
+            
+        Returns:
+            Tuple: (train_step, eval_step) fonksiyonları
+        """
+        signature = [
+            tf.TensorSpec([None, lookback, 1], tf.float32),
+            tf.TensorSpec([None], tf.float32)
+        ]
+        
+        # Optimizer değişkenleri graph dışında oluşturulur
+        optimizer.build(model.trainable_variables)
+        
+        @tf.function(input_signature=signature, jit_compile=XLA_TRAINING)
+        def train_step(x, y):
+            with tf.GradientTape() as tape:
+                pred = tf.cast(model(x, training=True), tf.float32)[:, 0]
+                loss = tf.reduce_mean(tf.square(pred - y))
+                scaled_loss = optimizer.scale_loss(loss)
+            grads = tape.gradient(scaled_loss, model.trainable_variables)
+            optimizer.apply_gradients(zip(grads, model.trainable_variables))
+            return loss
+        
+        @tf.function(input_signature=signature)
+        def eval_step(x, y):
+            pred = tf.cast(model(x, training=False), tf.float32)[:, 0]
+            return tf.reduce_mean(tf.square(pred - y))
+        
+        return train_step, eval_step
+    
+    def batch_future_forecast(self, seqs: np.ndarray, steps: int = 24) -> np.ndarray:
+        """
+        Birden fazla son pencere için LSTM tahminini tek batch'te yapar
+        
+        S sembolün (veya senaryonun) pencereleri [S, lookback, 1] olarak
+        yığılır ve her adımda model tüm batch için bir kez çağrılır.
+        
+        Args:
+            seqs (np.ndarray): [S, lookback, 1] ölçeklenmiş pencereler
+            steps (int): Tahmin adımı sayısı
+            
+        Returns:
+            np.ndarray: [S, steps] ölçeklenmiş tahminler
+        """
+        try:
+            model = self.models.get('lstm')
+            if model is None:
+                raise ValueError('Eğitilmiş LSTM modeli yok')
+            
+            seqs = np.asarray(seqs, dtype=np.float32)
+            roll_forecast = self._get_roll_forecast(model, seqs.shape[1], steps)
+            return roll_forecast(tf.constant(seqs)).numpy()
+            
+        except Exception as e:
+            self.logger.error(f"Batch LSTM tahmin hatası: {e}")
+            return np.empty((0, steps), dtype=np.float32)
+    
+    def _get_roll_forecast(self, model, lookback: int, steps: int = 24):
+        """
+        Model için derlenmiş tahmin fonksiyonunu döndürür; aynı model ve
+        pencere boyu için yeniden trace edilmez
+        """
+        cached = self._roll_forecast
+        if cached is None or cached[0] is not model or cached[1:3] != (lookback, steps):
+            cached = (model, lookback, steps, self._build_roll_forecast(model, lookback, steps))
+            self._roll_forecast = cached
+        return cached[3]
+    
+    @staticmethod
+    def _build_roll_forecast(model, lookback: int, steps: int = 24):
+        """
+        Otoregresif LSTM tahmin döngüsünü tek bir tf.function olarak derler
+        
+        Her adımda model çağrılır, pencere bir kaydırılıp tahmin sona eklenir;
+        döngü graph içinde çalıştığı için adım başına Python/Keras çağrı maliyeti oluşmaz.
+        
+        Args:
+            model: Eğitilmiş Keras modeli
+            lookback (int): Pencere uzunluğu
+            steps (int): Tahmin adımı sayısı
+            
+        Returns:
+            Callable: [S, lookback, 1] girdiden [S, steps] tahmin döndüren fonksiyon
+        """
+        @tf.function(input_signature=[tf.TensorSpec([None, lookback, 1], tf.float32)])
+        def roll_forecast(seq):
+            predictions = tf.TensorArray(tf.float32, size=steps)
+            for i in tf.range(steps):
+                pred = tf.cast(model(seq, training=False), tf.float32)
+                predictions = predictions.write(i, pred[:, 0])
+                seq = tf.concat([seq[:, 1:, :], pred[:, None, :]], axis=1)
+            return tf.transpose(predictions.stack())
+        
+        return roll_forecast
+    
     def train_arima_model(self, df: pd.DataFrame, order: Tuple = (1, 1, 1)) -> Dict:
         """
         ARIMA modelini eğitir
         
+        statsforecast yüklüyse derlenmiş ARIMA, değilse statsmodels kullanılır.
+        
         Args:
             df (pd.DataFrame): Eğitim verisi
             order (Tuple): ARIMA parametreleri (p, d, q)
@@ -242,20 +607,36 @@ class PricePredictor:
         """
         try:
             # Close fiyatlarını al
-            data = df['close'].values
+            data = df['close'].to_numpy(dtype=np.float64)
             
-            # Modeli eğit
-            model = ARIMA(data, order=order)
-            fitted_model = model.fit()
-            
-            # Gelecek tahminleri
-            forecast = fitted_model.forecast(steps=24)
+            if STATSFORECAST_AVAILABLE:
+                # Modeli eğit
+                fitted_model = SF_ARIMA(order=order)
+                fitted_model.fit(data)
+                
+                # Gelecek tahminleri
+                forecast = fitted_model.predict(h=24)['mean']
+                aic, bic = fitted_model.model_['aic'], fitted_model.model_['bic']
+            else:
+                # Modeli eğit: kısıt projeksiyonu ve kovaryans (sayısal Hessian) atlanır
+                model = ARIMA(data, order=order,
+                              enforce_stationarity=False, enforce_invertibility=False)
+                
+                # Yakınsama ve başlangıç parametresi uyarıları yalnızca fit sırasında bastırılır
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', ConvergenceWarning)
+                    warnings.simplefilter('ignore', UserWarning)
+                    fitted_model = model.fit(cov_type='none')
+                
+                # Gelecek tahminleri
+                forecast = fitted_model.forecast(steps=24)
+                aic, bic = fitted_model.aic, fitted_model.bic
             
             result = {
                 'model': fitted_model,
                 'forecast': forecast,
-                'aic': fitted_model.aic,
-                'bic': fitted_model.bic,
+                'aic': aic,
+                'bic': bic,
                 'model_type': 'ARIMA'
             }
             
@@ -281,12 +662,14 @@ class PricePredictor:
             Dict: Doğruluk metrikleri
         """
         try:
-            mae = mean_absolute_error(actual, predicted)
-            mse = mean_squared_error(actual, predicted)
-            rmse = np.sqrt(mse)
+            actual = np.ascontiguousarray(actual, dtype=np.float64).ravel()
+            predicted = np.ascontiguousarray(predicted, dtype=np.float64).ravel()
+            
+            if actual.size == 0 or actual.size != predicted.size:
+                raise ValueError(f"Geçersiz dizi boyutları: {actual.size} / {predicted.size}")
             
-            # MAPE (Mean Absolute Percentage Error)
-            mape = np.mean(np.abs((actual - predicted) / actual)) * 100
+            # MAE, MSE, RMSE ve MAPE tek geçişte
+            mae, mse, rmse, mape = prediction_metrics(actual, predicted)
             
             return {
                 'mae': mae,
@@ -298,56 +681,182 @@ class PricePredictor:
             self.logger.error(f"Doğruluk hesaplama hatası: {e}")
             return {}
     
-    def get_ensemble_prediction(self, df: pd.DataFrame) -> Dict:
+    @staticmethod
+    def _data_fingerprint(df: pd.DataFrame) -> str:
+        """
+        close serisinin içerik özetini döndürür (model önbelleği anahtarı)
+        
+        Args:
+            df (pd.DataFrame): Eğitim verisi
+            
+        Returns:
+            str: 16 baytlık blake2b özeti (hex)
+        """
+        close = np.ascontiguousarray(df['close'].to_numpy())
+        return hashlib.blake2b(close.tobytes(), digest_size=16).hexdigest()
+    
+    def _get_cached_model(self, key: str, name: str) -> Optional[Dict]:
+        """
+        Aynı veriyle daha önce eğitilmiş model sonucunu döndürür
+        
+        LSTM için eğitimde kullanılan ölçek de geri yüklenir.
+        
+        Args:
+            key (str): Veri parmak izi
+            name (str): Model adı
+            
+        Returns:
+            Optional[Dict]: Önbellekteki model sonucu, yoksa None
+        """
+        entry = self._model_cache.get((key, name))
+        if entry is None:
+            return None
+        
+        self._model_cache.move_to_end((key, name))
+        result, scale = entry
+        if scale is not None:
+            self._scale_lo, self._scale_span = scale
+            self._scaler_fitted = True
+        self.models[name] = result['model']
+        self.predictions[name] = result
+        return result
+    
+    def _cache_model(self, key: str, name: str, result: Dict):
+        """Eğitilmiş model sonucunu veri parmak izi ile önbelleğe alır"""
+        scale = (self._scale_lo, self._scale_span) if name == 'lstm' else None
+        self._model_cache[(key, name)] = (result, scale)
+        while len(self._model_cache) > self.MAX_CACHED_MODELS:
+            self._model_cache.popitem(last=False)
+    
+    def _train_models_sequential(self, df: pd.DataFrame, model_names: List[str]) -> Dict:
+        """
+        Modelleri bu süreçte sırayla eğitir
+        
+        Args:
+            df (pd.DataFrame): Eğitim verisi
+            model_names (List[str]): Eğitilecek modeller
+            
+        Returns:
+            Dict: Başarılı model sonuçları
+        """
+        train = {
+            'prophet': self.train_prophet_model,
+            'lstm': self.train_lstm_model,
+            'arima': self.train_arima_model
+        }
+        
+        results = {}
+        for name in model_names:
+            result = train[name](df)
+            if 'error' not in result:
+                results[name] = result
+        return results
+    
+    def _train_models_parallel(self, df: pd.DataFrame, model_names: List[str]) -> Optional[Dict]:
+        """
+        Modelleri süreç havuzunda aynı anda eğitir
+        
+        Args:
+            df (pd.DataFrame): Eğitim verisi
+            model_names (List[str]): Eğitilecek modeller
+            
+        Returns:
+            Optional[Dict]: Başarılı model sonuçları, havuz kullanılamazsa None
+        """
+        global _ENSEMBLE_POOL
+        try:
+            # Modeller yalnızca close serisini kullanır; süreçlere sadece o gönderilir
+            close_df = df[['close']]
+            
+            pool = _get_ensemble_pool()
+            scale = (self._scale_lo, self._scale_span) if self._scaler_fitted else None
+            futures = {
+                name: pool.submit(_train_model_in_process, name, close_df, scale if name == 'lstm' else None)
+                for name in model_names
+            }
+            
+            results = {}
+            for name, future in futures.items():
+                result, scale = future.result()
+                if 'error' in result:
+                    continue
+                if scale is not None:
+                    self._scale_lo, self._scale_span = scale
+                    self._scaler_fitted = True
+                self.models[name] = result['model']
+                self.predictions[name] = result
+                results[name] = result
+            
+            return results
+            
+        except Exception as e:
+            self.logger.warning(f"Paralel model eğitimi başarısız, sıralı eğitime geçiliyor: {e}")
+            with _ENSEMBLE_POOL_LOCK:
+                # Bozulan havuzun süreçleri bırakılmadan sızmaması için kapatılır
+                if _ENSEMBLE_POOL is not None:
+                    _ENSEMBLE_POOL.shutdown(wait=False, cancel_futures=True)
+                _ENSEMBLE_POOL = None
+            return None
+    
+    def get_ensemble_prediction(self, df: pd.DataFrame, parallel: bool = True) -> Dict:
         """
         Tüm modelleri kullanarak ensemble tahmin yapar
         
+        Aynı close serisiyle daha önce eğitilmiş modeller yeniden eğitilmez.
+        
         Args:
             df (pd.DataFrame): Eğitim verisi
+            parallel (bool): Modelleri ayrı süreçlerde aynı anda eğit
             
         Returns:
             Dict: Ensemble tahmin sonuçları
         """
         try:
-            results = {}
+            model_names = (['prophet'] if PROPHET_AVAILABLE else []) + ['lstm', 'arima']
+            key = self._data_fingerprint(df)
             
-            # Prophet modeli
-            if PROPHET_AVAILABLE:
-                prophet_result = self.train_prophet_model(df)
-                if 'error' not in prophet_result:
-                    results['prophet'] = prophet_result
-            
-            # LSTM modeli
-            lstm_result = self.train_lstm_model(df)
-            if 'error' not in lstm_result:
-                results['lstm'] = lstm_result
-            
-            # ARIMA modeli
-            arima_result = self.train_arima_model(df)
-            if 'error' not in arima_result:
-                results['arima'] = arima_result
-            
-            # Ensemble tahmin (ağırlıklı ortalama)
-            ensemble_predictions = []
-            weights = []
-            
-            for model_name, result in results.items():
-                if model_name == 'prophet':
-                    pred = result['predictions']['yhat'].values
-                    weights.append(0.4)  # Prophet'e daha fazla ağırlık
-                elif model_name == 'lstm':
-                    pred = result['future_predictions']
-                    weights.append(0.35)
-                elif model_name == 'arima':
-                    pred = result['forecast']
-                    weights.append(0.25)
+            results = {}
+            missing = []
+            for name in model_names:
+                cached = self._get_cached_model(key, name)
+                if cached is None:
+                    missing.append(name)
+                else:
+                    results[name] = cached
+            
+            if missing:
+                trained = self._train_models_parallel(df, missing) if parallel else None
+                if trained is None:
+                    trained = self._train_models_sequential(df, missing)
                 
-                ensemble_predictions.append(pred[:24])  # İlk 24 tahmin
-            
-            if ensemble_predictions:
-                # Ağırlıklı ortalama hesapla
-                weights = np.array(weights) / sum(weights)
-                ensemble_final = np.average(ensemble_predictions, axis=0, weights=weights)
+                for name, result in trained.items():
+                    self._cache_model(key, name, result)
+                results.update(trained)
+            
+            # Ensemble tahmin (ağırlıklı ortalama), Prophet'e daha fazla ağırlık
+            model_weights = {'prophet': 0.4, 'lstm': 0.35, 'arima': 0.25}
+            names = [name for name in model_weights if name in results]
+            
+            if names:
+                # İlk 24 tahmin, model başına bir satır (float32)
+                buf = np.empty((len(names), 24), dtype=np.float32)
+                weights = np.empty(len(names))
+                
+                for i, model_name in enumerate(names):
+                    result = results[model_name]
+                    if model_name == 'prophet':
+                        pred = result['predictions']['yhat'].to_numpy()
+                    elif model_name == 'lstm':
+                        pred = result['future_predictions']
+                    else:
+                        pred = result['forecast']
+                    
+                    buf[i] = pred[:24]
+                    weights[i] = model_weights[model_name]
+                
+                # Ağırlıklı ortalama hesapla (tek geçiş)
+                weights /= weights.sum()
+                ensemble_final = np.einsum('k,kt->t', weights, buf)
                 
                 return {
                     'ensemble_prediction': ensemble_final,
@@ -364,24 +873,21 @@ class PricePredictor:
 # Test fonksiyonu
 if __name__ == "__main__":
     # Test için örnek veri oluştur
-    dates = pd.date_range('2024-01-01', periods=500, freq='H')
-    np.random.seed(42)
+    dates = pd.date_range('2024-01-01', periods=500, freq='h', name='timestamp')
+    rng = np.random.default_rng(42)
     
     # Gerçekçi fiyat verisi oluştur
     base_price = 100
-    price_changes = np.random.randn(500) * 0.02  # %2 volatilite
-    prices = [base_price]
-    
-    for change in price_changes[1:]:
-        new_price = prices[-1] * (1 + change)
-        prices.append(new_price)
+    price_changes = rng.standard_normal(500) * 0.02  # %2 volatilite
+    price_changes[0] = 0
+    prices = base_price * np.cumprod(1.0 + price_changes)
     
     test_data = pd.DataFrame({
         'open': prices,
-        'high': [p * 1.01 for p in prices],
-        'low': [p * 0.99 for p in prices],
+        'high': prices * 1.01,
+        'low': prices * 0.99,
         'close': prices,
-        'volume': np.random.randint(1000, 10000, 500)
+        'volume': rng.integers(1000, 10000, 500)
     }, index=dates)
     
     # Fiyat tahmin modellerini test et
@@ -0,0 +1,233 @@
+"""
+Sinyal üretimi için Numba kernel'leri
+Gösterge kesişim/eşik koşullarını tüm çubuklar için tek döngüde ya da
+vektörel NumPy ifadeleriyle kodlar
+"""
+
+import numpy as np
+
+from src._njit import NUMBA_AVAILABLE, njit
+
+
+# Her kernel, SignalGenerator analizörlerindeki if/elif sırasını izler:
+# 0 = sinyal yok, k = k. dal. NaN karşılaştırmaları False olduğundan fastmath
+# kullanılmaz. İlk çubukta önceki değer NaN kabul edilir.
+# Numba varken fused_codes bu kernel'lerin yerini aldığından import sırasında
+# derlenmezler; yalnızca doğrudan çağrıldıklarında derlenirler.
+
+@njit(cache=True)
+def rsi_codes(rsi):
+    """RSI: 1 aşırı satımdan çıkış, 2 aşırı alımdan çıkış, 3 yükseliş, 4 düşüş"""
+    n = rsi.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    for i in range(n):
+        cur = rsi[i]
+        prev = rsi[i - 1] if i > 0 else np.nan
+        if prev < 30 and cur > 30:
+            out[i] = 1
+        elif prev > 70 and cur < 70:
+            out[i] = 2
+        elif cur > prev and cur > 50:
+            out[i] = 3
+        elif cur < prev and cur < 50:
+            out[i] = 4
+    return out
+
+
+@njit(cache=True)
+def macd_codes(macd, signal, hist):
+    """MACD: 1 yukarı kesişim, 2 aşağı kesişim, 3 pozitif ve artan histogram"""
+    n = macd.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    for i in range(n):
+        if i > 0:
+            macd_prev, signal_prev, hist_prev = macd[i - 1], signal[i - 1], hist[i - 1]
+        else:
+            macd_prev, signal_prev, hist_prev = np.nan, np.nan, np.nan
+        if macd_prev < signal_prev and macd[i] > signal[i]:
+            out[i] = 1
+        elif macd_prev > signal_prev and macd[i] < signal[i]:
+            out[i] = 2
+        elif hist[i] > 0 and hist[i] > hist_prev:
+            out[i] = 3
+    return out
+
+
+@njit(cache=True)
+def moving_average_codes(close, ema_12, ema_26, sma_50):
+    """Hareketli ortalama: 1 altın kesişim, 2 ölüm kesişimi, 3 fiyat SMA 50 üstüne çıktı"""
+    n = close.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    for i in range(n):
+        if i > 0:
+            ema_12_prev, ema_26_prev = ema_12[i - 1], ema_26[i - 1]
+            close_prev, sma_50_prev = close[i - 1], sma_50[i - 1]
+        else:
+            ema_12_prev, ema_26_prev = np.nan, np.nan
+            close_prev, sma_50_prev = np.nan, np.nan
+        if ema_12_prev <= ema_26_prev and ema_12[i] > ema_26[i]:
+            out[i] = 1
+        elif ema_12_prev >= ema_26_prev and ema_12[i] < ema_26[i]:
+            out[i] = 2
+        elif close[i] > sma_50[i] and close_prev <= sma_50_prev:
+            out[i] = 3
+    return out
+
+
+@njit(cache=True)
+def stochastic_codes(stoch_k, stoch_d):
+    """Stochastic: 1 aşırı satımdan çıkış, 2 aşırı alımdan çıkış, 3 K/D yukarı kesişim"""
+    n = stoch_k.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    for i in range(n):
+        if i > 0:
+            k_prev, d_prev = stoch_k[i - 1], stoch_d[i - 1]
+        else:
+            k_prev, d_prev = np.nan, np.nan
+        if k_prev < 20 and stoch_k[i] > 20:
+            out[i] = 1
+        elif k_prev > 80 and stoch_k[i] < 80:
+            out[i] = 2
+        elif k_prev < d_prev and stoch_k[i] > stoch_d[i]:
+            out[i] = 3
+    return out
+
+
+# Yalnızca aynı çubuğa ve bir önceki çubuğa bakan koşullar, Numba'ya gerek
+# kalmadan sütun dizileri üzerinde kaydırılmış karşılaştırmalarla kodlanır;
+# np.select ilk doğru koşulu seçtiği için if/elif sırası korunur.
+
+def _shift(x):
+    """Diziyi bir çubuk kaydırır (ilk çubuğun önceki değeri NaN)"""
+    prev = np.empty_like(x)
+    prev[0] = np.nan
+    prev[1:] = x[:-1]
+    return prev
+
+
+def bollinger_codes(close, upper, lower, width):
+    """Bollinger: 1 alt banda temas, 2 üst banda temas, 3 band sıkışması"""
+    if close.shape[0] == 0:
+        return np.zeros(0, dtype=np.int8)
+    return np.select(
+        [close <= lower * 1.01, close >= upper * 0.99, width < _shift(width) * 0.9],
+        [1, 2, 3], 0
+    ).astype(np.int8)
+
+
+def volume_codes(volume_ratio, close, open_):
+    """Hacim: 1 yüksek hacimle artış, 2 yüksek hacimle düşüş"""
+    high_volume = volume_ratio > 2.0
+    return np.select(
+        [high_volume & (close > open_), high_volume & (close < open_)],
+        [1, 2], 0
+    ).astype(np.int8)
+
+
+# Gösterge anahtarı -> (ayrı kernel, kernel'in sırasıyla aldığı sütunlar)
+CODE_KERNELS = {
+    'rsi': (rsi_codes, ('rsi',)),
+    'macd': (macd_codes, ('macd', 'macd_signal', 'macd_hist')),
+    'bb': (bollinger_codes, ('close', 'bb_upper', 'bb_lower', 'bb_width')),
+    'ma': (moving_average_codes, ('close', 'ema_12', 'ema_26', 'sma_50')),
+    'stoch': (stochastic_codes, ('stoch_k', 'stoch_d')),
+    'volume': (volume_codes, ('volume_ratio', 'close', 'open')),
+}
+
+# Birleşik kernel için döngü gövdeleri; ayrı kernel'lerle aynı dal sırası.
+# Döngü start >= 1'den başladığından önceki çubuk her zaman i - 1'dir.
+_FUSED_BODIES = {
+    'rsi': """
+        if rsi[i - 1] < 30 and rsi[i] > 30:
+            out[i, {slot}] = 1
+        elif rsi[i - 1] > 70 and rsi[i] < 70:
+            out[i, {slot}] = 2
+        elif rsi[i] > rsi[i - 1] and rsi[i] > 50:
+            out[i, {slot}] = 3
+        elif rsi[i] < rsi[i - 1] and rsi[i] < 50:
+            out[i, {slot}] = 4
+""",
+    'macd': """
+        if macd[i - 1] < macd_signal[i - 1] and macd[i] > macd_signal[i]:
+            out[i, {slot}] = 1
+        elif macd[i - 1] > macd_signal[i - 1] and macd[i] < macd_signal[i]:
+            out[i, {slot}] = 2
+        elif macd_hist[i] > 0 and macd_hist[i] > macd_hist[i - 1]:
+            out[i, {slot}] = 3
+""",
+    'bb': """
+        if close[i] <= bb_lower[i] * 1.01:
+            out[i, {slot}] = 1
+        elif close[i] >= bb_upper[i] * 0.99:
+            out[i, {slot}] = 2
+        elif bb_width[i] < bb_width[i - 1] * 0.9:
+            out[i, {slot}] = 3
+""",
+    'ma': """
+        if ema_12[i - 1] <= ema_26[i - 1] and ema_12[i] > ema_26[i]:
+            out[i, {slot}] = 1
+        elif ema_12[i - 1] >= ema_26[i - 1] and ema_12[i] < ema_26[i]:
+            out[i, {slot}] = 2
+        elif close[i] > sma_50[i] and close[i - 1] <= sma_50[i - 1]:
+            out[i, {slot}] = 3
+""",
+    'stoch': """
+        if stoch_k[i - 1] < 20 and stoch_k[i] > 20:
+            out[i, {slot}] = 1
+        elif stoch_k[i - 1] > 80 and stoch_k[i] < 80:
+            out[i, {slot}] = 2
+        elif stoch_k[i - 1] < stoch_d[i - 1] and stoch_k[i] > stoch_d[i]:
+            out[i, {slot}] = 3
+""",
+    'volume': """
+        if volume_ratio[i] > 2.0 and close[i] > open_[i]:
+            out[i, {slot}] = 1
+        elif volume_ratio[i] > 2.0 and close[i] < open_[i]:
+            out[i, {slot}] = 2
+""",
+}
+
+_FUSED_CACHE = {}
+
+
+def fused_codes(keys):
+    """
+    Yalnızca verilen göstergeleri tek çubuk döngüsünde kodlayan kernel üretir
+    
+    Kaynak, etkin göstergelerin döngü gövdeleri birleştirilerek oluşturulur ve
+    njit ile derlenir; kapalı göstergeler için hiçbir yükleme ya da dal kalmaz.
+    Sonuç gösterge kümesine göre önbelleklenir. Numba yoksa saf Python döngüsü
+    ayrı (vektörel) kernel'lerden yavaş olacağından None döner.
+    
+    Args:
+        keys (tuple): CODE_KERNELS sırasındaki gösterge anahtarları
+        
+    Returns:
+        Optional[tuple]: (kernel, sütunlar) ya da None; kernel(start, *sütun dizileri)
+            (n, len(keys)) int8 kod matrisi döndürür, start öncesi çubuklar 0'dır
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+    
+    cache_key = frozenset(keys)
+    if cache_key not in _FUSED_CACHE:
+        keys = [key for key in CODE_KERNELS if key in cache_key]
+        columns = []
+        for key in keys:
+            columns.extend(c for c in CODE_KERNELS[key][1] if c not in columns)
+        args = ', '.join('open_' if c == 'open' else c for c in columns)
+        
+        source = (
+            f"def _fused_codes(start, {args}):\n"
+            f"    n = {args.split(',')[0]}.shape[0]\n"
+            f"    out = np.zeros((n, {len(keys)}), dtype=np.int8)\n"
+            f"    for i in range(max(start, 1), n):\n"
+            + ''.join(_FUSED_BODIES[key].format(slot=slot) for slot, key in enumerate(keys))
+            + "    return out\n"
+        )
+        namespace = {'np': np}
+        exec(source, namespace)
+        # exec ile üretilen kaynak dosyada olmadığından disk önbelleği kullanılamaz
+        _FUSED_CACHE[cache_key] = (njit(namespace['_fused_codes']), tuple(columns))
+    
+    return _FUSED_CACHE[cache_key]
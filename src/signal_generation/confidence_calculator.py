@@ -5,10 +5,58 @@ Güven hesaplama modülü
 import pandas as pd
 import numpy as np
 import logging
+from typing import List, Optional
 
 class ConfidenceCalculator:
-    def __init__(self):
+    """
+    Sinyal güven skorlarını mum bazında vektörel olarak hesaplayan sınıf
+    """
+    
+    def __init__(self, weights: Optional[np.ndarray] = None):
+        """
+        ConfidenceCalculator sınıfını başlatır
+        
+        Args:
+            weights (Optional[np.ndarray]): Özellik ağırlıkları (F,); verilmezse eşit ağırlık
+        """
         self.logger = logging.getLogger(__name__)
+        self.weights = None if weights is None else np.asarray(weights, dtype=np.float32)
+    
+    def calculate_confidence(self, features: np.ndarray) -> np.ndarray:
+        """
+        Özellik matrisinden mum başına güven skoru hesaplar
+        
+        Skor, ağırlıklı toplamın (gemv) [0, 1] aralığına kırpılmış halidir.
+        
+        Args:
+            features (np.ndarray): (T, F) float32 özellik matrisi, özellikler [0, 1] ölçeğinde
+            
+        Returns:
+            np.ndarray: (T,) güven skorları
+        """
+        try:
+            features = np.asarray(features, dtype=np.float32)
+            weights = self.weights
+            if weights is None:
+                weights = np.full(features.shape[1], 1.0 / features.shape[1], dtype=np.float32)
+            
+            score = features @ weights
+            return np.clip(score, 0.0, 1.0, out=score)
+            
+        except Exception as e:
+            self.logger.error(f"Güven hesaplama hatası: {e}")
+            return np.empty(0, dtype=np.float32)
     
-    def calculate_confidence(self, data):
-        return {"confidence": 0.7, "factors": ["technical", "volume"]} 
\ No newline at end of file
+    def calculate_confidence_df(self, df: pd.DataFrame, columns: List[str]) -> pd.Series:
+        """
+        DataFrame sütunlarından güven skoru hesaplar
+        
+        Args:
+            df (pd.DataFrame): Özellikleri içeren veri
+            columns (List[str]): Kullanılacak özellik sütunları (ağırlık sırasıyla)
+            
+        Returns:
+            pd.Series: Mum başına güven skorları
+        """
+        features = df[columns].to_numpy(dtype=np.float32)
+        return pd.Series(self.calculate_confidence(features), index=df.index, name='confidence')
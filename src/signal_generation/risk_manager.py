@@ -5,10 +5,65 @@ Risk yönetimi modülü
 import pandas as pd
 import numpy as np
 import logging
+from typing import Dict
 
 class RiskManager:
-    def __init__(self):
+    """
+    ATR tabanlı stop-loss / take-profit seviyelerini vektörel hesaplayan sınıf
+    """
+    
+    # Risk yüzdesi eşikleri: < 2 düşük, < 5 orta, diğerleri yüksek
+    RISK_THRESHOLDS = np.array([2.0, 5.0])
+    RISK_LEVELS = np.array(['LOW', 'MEDIUM', 'HIGH'])
+    
+    def __init__(self, atr_multiplier: float = 2.0, reward_ratio: float = 2.0):
+        """
+        RiskManager sınıfını başlatır
+        
+        Args:
+            atr_multiplier (float): Stop mesafesi için ATR çarpanı
+            reward_ratio (float): Kâr hedefinin stop mesafesine oranı
+        """
         self.logger = logging.getLogger(__name__)
+        self.atr_multiplier = atr_multiplier
+        self.reward_ratio = reward_ratio
+    
+    def calculate_risk(self, entry: np.ndarray, atr: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Giriş fiyatları ve ATR dizilerinden risk seviyelerini hesaplar
+        
+        Args:
+            entry (np.ndarray): (T,) giriş fiyatları
+            atr (np.ndarray): (T,) ATR değerleri
+            
+        Returns:
+            Dict[str, np.ndarray]: stop_loss, take_profit, risk_pct ve risk_level dizileri
+        """
+        try:
+            entry = np.asarray(entry, dtype=np.float32)
+            distance = np.asarray(atr, dtype=np.float32) * np.float32(self.atr_multiplier)
+            risk_pct = distance / entry * 100
+            
+            return {
+                'stop_loss': entry - distance,
+                'take_profit': entry + distance * np.float32(self.reward_ratio),
+                'risk_pct': risk_pct,
+                'risk_level': self.RISK_LEVELS[np.searchsorted(self.RISK_THRESHOLDS, risk_pct, side='right')]
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Risk hesaplama hatası: {e}")
+            return {}
     
-    def calculate_risk(self, data):
-        return {"risk_level": "LOW", "stop_loss": 0.0} 
\ No newline at end of file
+    def calculate_risk_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        close ve atr sütunlarından risk seviyelerini hesaplar
+        
+        Args:
+            df (pd.DataFrame): Teknik göstergeleri içeren veri
+            
+        Returns:
+            pd.DataFrame: Mum başına risk seviyeleri
+        """
+        risk = self.calculate_risk(df['close'].to_numpy(), df['atr'].to_numpy())
+        return pd.DataFrame(risk, index=df.index)
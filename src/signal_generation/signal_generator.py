@@ -6,34 +6,179 @@ Bu modül teknik analiz ve AI tahminlerini birleştirerek sinyaller üretir
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import IntEnum
+from dataclasses import dataclass
 
-class SignalType(Enum):
-    """Sinyal türleri"""
-    BUY = "BUY"
-    SELL = "SELL"
-    HOLD = "HOLD"
-    STRONG_BUY = "STRONG_BUY"
-    STRONG_SELL = "STRONG_SELL"
+from src.signal_generation._kernels import CODE_KERNELS, fused_codes
 
-class SignalStrength(Enum):
+class SignalType(IntEnum):
+    """Sinyal türleri (işaret yönü verir: alım > 0, satım < 0, bekleme 0)"""
+    HOLD = 0
+    BUY = 1
+    STRONG_BUY = 2
+    SELL = -1
+    STRONG_SELL = -2
+
+class SignalStrength(IntEnum):
     """Sinyal gücü"""
     WEAK = 1
     MODERATE = 2
     STRONG = 3
     VERY_STRONG = 4
 
+@dataclass(slots=True)
+class Signal:
+    """Tek bir göstergenin ürettiği sinyal (toplu yolda 'bar' çubuğun indeks değeridir)"""
+    type: SignalType
+    strength: SignalStrength
+    indicator: str
+    value: float
+    reason: str
+    confidence: float
+    bar: Any = None
+
+# generate_signals_array çıktısının sütun düzeni
+SIGNAL_DTYPE = np.dtype([
+    ('type', 'i1'),
+    ('strength', 'i1'),
+    ('confidence', 'f4'),
+    ('value', 'f4'),
+    ('indicator', 'U16'),
+    ('reason', 'U64'),
+    ('timestamp', 'datetime64[ns]')
+])
+
 class SignalGenerator:
     """
     Alım/satım sinyalleri üreten ana sınıf
     """
     
-    def __init__(self):
-        """SignalGenerator sınıfını başlatır"""
+    # self.signals'ta tutulan en fazla birleşik sinyal sayısı
+    MAX_SIGNAL_HISTORY = 10_000
+    
+    # Canlı analizörlerin okuduğu sütunlar ve satır dizisindeki konumları
+    _COLS = (
+        'rsi', 'macd', 'macd_signal', 'macd_hist', 'close', 'bb_upper', 'bb_lower',
+        'bb_position', 'bb_width', 'ema_12', 'ema_26', 'sma_50', 'sma_200',
+        'stoch_k', 'stoch_d', 'volume', 'volume_ratio', 'open'
+    )
+    _IDX = {col: i for i, col in enumerate(_COLS)}
+    
+    # Analizörlerin sabit sinyal alanları; sıra, _kernels'deki kodların (1, 2, ...)
+    # sırasıdır. Canlı ve toplu yol bunlara yalnızca 'value' (ve 'bar') ekleyerek Signal kurar.
+    _RSI_SIGNALS = (
+        {'type': SignalType.BUY, 'strength': SignalStrength.STRONG, 'indicator': 'RSI',
+         'reason': 'Aşırı satım bölgesinden çıkış', 'confidence': 75},
+        {'type': SignalType.SELL, 'strength': SignalStrength.STRONG, 'indicator': 'RSI',
+         'reason': 'Aşırı alım bölgesinden çıkış', 'confidence': 75},
+        {'type': SignalType.BUY, 'strength': SignalStrength.MODERATE, 'indicator': 'RSI',
+         'reason': 'RSI yükseliş trendi', 'confidence': 60},
+        {'type': SignalType.SELL, 'strength': SignalStrength.MODERATE, 'indicator': 'RSI',
+         'reason': 'RSI düşüş trendi', 'confidence': 60}
+    )
+    _MACD_SIGNALS = (
+        {'type': SignalType.BUY, 'strength': SignalStrength.STRONG, 'indicator': 'MACD',
+         'reason': 'MACD sinyal çizgisini yukarı kesti', 'confidence': 80},
+        {'type': SignalType.SELL, 'strength': SignalStrength.STRONG, 'indicator': 'MACD',
+         'reason': 'MACD sinyal çizgisini aşağı kesti', 'confidence': 80},
+        {'type': SignalType.BUY, 'strength': SignalStrength.MODERATE, 'indicator': 'MACD',
+         'reason': 'MACD histogramı pozitif ve artıyor', 'confidence': 65}
+    )
+    _BOLLINGER_SIGNALS = (
+        {'type': SignalType.BUY, 'strength': SignalStrength.STRONG, 'indicator': 'Bollinger Bands',
+         'reason': 'Fiyat alt Bollinger Bandına dokundu', 'confidence': 70},
+        {'type': SignalType.SELL, 'strength': SignalStrength.STRONG, 'indicator': 'Bollinger Bands',
+         'reason': 'Fiyat üst Bollinger Bandına dokundu', 'confidence': 70},
+        {'type': SignalType.HOLD, 'strength': SignalStrength.WEAK, 'indicator': 'Bollinger Bands',
+         'reason': 'Bollinger Bands sıkışması - breakout bekleniyor', 'confidence': 50}
+    )
+    _MA_SIGNALS = (
+        {'type': SignalType.STRONG_BUY, 'strength': SignalStrength.VERY_STRONG, 'indicator': 'Moving Averages',
+         'reason': 'Altın kesişim (EMA 12 > EMA 26)', 'confidence': 85},
+        {'type': SignalType.STRONG_SELL, 'strength': SignalStrength.VERY_STRONG, 'indicator': 'Moving Averages',
+         'reason': 'Ölüm kesişimi (EMA 12 < EMA 26)', 'confidence': 85},
+        {'type': SignalType.BUY, 'strength': SignalStrength.MODERATE, 'indicator': 'Moving Averages',
+         'reason': 'Fiyat 50 SMA\'nın üstüne çıktı', 'confidence': 65}
+    )
+    _STOCHASTIC_SIGNALS = (
+        {'type': SignalType.BUY, 'strength': SignalStrength.STRONG, 'indicator': 'Stochastic',
+         'reason': 'Stochastic aşırı satım bölgesinden çıkış', 'confidence': 70},
+        {'type': SignalType.SELL, 'strength': SignalStrength.STRONG, 'indicator': 'Stochastic',
+         'reason': 'Stochastic aşırı alım bölgesinden çıkış', 'confidence': 70},
+        {'type': SignalType.BUY, 'strength': SignalStrength.MODERATE, 'indicator': 'Stochastic',
+         'reason': 'Stochastic K ve D çizgileri yukarı kesişim', 'confidence': 60}
+    )
+    _VOLUME_SIGNALS = (
+        {'type': SignalType.BUY, 'strength': SignalStrength.STRONG, 'indicator': 'Volume',
+         'reason': 'Yüksek hacimle fiyat artışı', 'confidence': 75},
+        {'type': SignalType.SELL, 'strength': SignalStrength.STRONG, 'indicator': 'Volume',
+         'reason': 'Yüksek hacimle fiyat düşüşü', 'confidence': 75}
+    )
+    
+    # AI tahmini fiyat değişimi (%) bölgeleri ve bölge başına (şablon, yön);
+    # orta bölge (-2..2) sinyal üretmez
+    _AI_THRESHOLDS = (-5.0, -2.0, 2.0, 5.0)
+    _AI_SIGNALS = (
+        ({'type': SignalType.STRONG_SELL, 'strength': SignalStrength.VERY_STRONG,
+          'indicator': 'AI Prediction', 'confidence': 80}, 'düşüş'),
+        ({'type': SignalType.SELL, 'strength': SignalStrength.STRONG,
+          'indicator': 'AI Prediction', 'confidence': 70}, 'düşüş'),
+        None,
+        ({'type': SignalType.BUY, 'strength': SignalStrength.STRONG,
+          'indicator': 'AI Prediction', 'confidence': 70}, 'artış'),
+        ({'type': SignalType.STRONG_BUY, 'strength': SignalStrength.VERY_STRONG,
+          'indicator': 'AI Prediction', 'confidence': 80}, 'artış')
+    )
+    
+    # Gösterge anahtarı -> (gerekli sütunlar, canlı analizör, sinyal şablonları,
+    # koda göre 'value' sütunları); sıra sinyallerin üretim sırasıdır
+    INDICATORS = ('rsi', 'macd', 'bb', 'ma', 'stoch', 'volume')
+    _ANALYZERS = {
+        'rsi': (('rsi',), '_analyze_rsi', _RSI_SIGNALS, ('rsi',) * 4),
+        'macd': (('macd', 'macd_signal', 'macd_hist'), '_analyze_macd', _MACD_SIGNALS, ('macd',) * 3),
+        'bb': (('close', 'bb_upper', 'bb_lower', 'bb_position', 'bb_width'), '_analyze_bollinger_bands',
+               _BOLLINGER_SIGNALS, ('bb_position', 'bb_position', 'bb_width')),
+        'ma': (('close', 'ema_12', 'ema_26', 'sma_50', 'sma_200'), '_analyze_moving_averages',
+               _MA_SIGNALS, ('ema_12', 'ema_12', 'sma_50')),
+        'stoch': (('stoch_k', 'stoch_d'), '_analyze_stochastic', _STOCHASTIC_SIGNALS, ('stoch_k',) * 3),
+        'volume': (('volume', 'volume_ratio', 'close', 'open'), '_analyze_volume',
+                   _VOLUME_SIGNALS, ('volume_ratio',) * 2),
+    }
+    
+    def __init__(self, enabled: Tuple[str, ...] = INDICATORS):
+        """
+        SignalGenerator sınıfını başlatır
+        
+        Args:
+            enabled (tuple): Kullanılacak göstergeler (INDICATORS alt kümesi)
+        """
         self.logger = logging.getLogger(__name__)
-        self.signals = []
+        # Üretilen sinyallerin geçmişi; uzun canlı oturumlarda bellek sabit kalır
+        self.signals = deque(maxlen=self.MAX_SIGNAL_HISTORY)
+        
+        unknown = set(enabled) - set(self.INDICATORS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen göstergeler: {sorted(unknown)}")
+        
+        # Gösterge seçimi burada bir kez çözülür: canlı yol yalnızca etkin
+        # analizörleri çağırır, toplu yol yalnızca onları kodlayan kernel'i derler
+        self.enabled = tuple(key for key in self.INDICATORS if key in enabled)
+        self._analyzers = tuple(getattr(self, self._ANALYZERS[key][1]) for key in self.enabled)
+        self._required = frozenset(col for key in self.enabled for col in self._ANALYZERS[key][0])
+        
+        # update() akış durumu: son çubuğun _COLS sırasındaki değerleri ve
+        # işlenen çubuk sayısı. generate_signals bu durumu kullanmaz.
+        self._prev: Optional[np.ndarray] = None
+        self._bars = 0
+        
+        # Son generate_signals çağrısının girdi parmak izi ve sonucu
+        self._last_key = None
+        self._last_signals: List[Dict] = []
         
     def generate_signals(self, df: pd.DataFrame, predictions: Dict = None) -> List[Dict]:
         """
@@ -47,6 +192,17 @@ class SignalGenerator:
             List[Dict]: Üretilen sinyaller listesi
         """
         try:
+            # Sütunlar bir kez doğrulanır; analizörler kendi hatalarını yakalamaz
+            missing = self._required - set(df.columns)
+            if missing:
+                raise KeyError(f"Eksik gösterge sütunları: {sorted(missing)}")
+            
+            # Aynı çubuk/fiyat/tahmin için tekrar gelen çağrılar (ör. mum kapanmadan
+            # gelen yinelenen tick'ler) son sonucu döndürür
+            key = self._input_key(df, predictions)
+            if key is not None and key == self._last_key:
+                return self._last_signals
+            
             signals = []
             
             # Teknik analiz sinyalleri
@@ -61,357 +217,344 @@ class SignalGenerator:
             # Sinyalleri birleştir ve güven skorunu hesapla
             final_signals = self._combine_signals(signals)
             
-            # Son sinyali kaydet
+            # Sinyalleri geçmişe ekle
             if final_signals:
-                self.signals = final_signals
+                self.signals.extend(final_signals)
                 self.logger.info(f"{len(final_signals)} sinyal üretildi")
             
+            self._last_key, self._last_signals = key, final_signals
             return final_signals
             
         except Exception as e:
             self.logger.error(f"Sinyal üretme hatası: {e}")
             return []
     
-    def _generate_technical_signals(self, df: pd.DataFrame) -> List[Dict]:
-        """Teknik analiz tabanlı sinyaller üretir"""
-        signals = []
+    def _input_key(self, df: pd.DataFrame, predictions: Optional[Dict]) -> Optional[Tuple]:
+        """
+        generate_signals girdisinin parmak izini döndürür
         
+        Son çubuğun indeksi ve DataFrame uzunluğuna, aynı saatte farklı semboller
+        ya da kapanmamış mumun güncellenen fiyatı ayrışsın diye son kapanış ve
+        ilk ensemble tahmini eklenir.
+        """
+        if len(df) == 0:
+            return None
+        ensemble = predictions.get('ensemble_prediction') if predictions else None
+        next_prediction = float(ensemble[0]) if ensemble is not None and len(ensemble) > 0 else None
+        return (df.index[-1], len(df), float(df['close'].to_numpy()[-1]), next_prediction)
+    
+    def _generate_technical_signals(self, df: pd.DataFrame) -> List[Signal]:
+        """Teknik analiz tabanlı sinyaller üretir"""
         try:
-            if len(df) < 50:  # Yeterli veri yoksa sinyal üretme
-                return signals
-            
-            latest = df.iloc[-1]
-            previous = df.iloc[-2]
-            
-            # RSI sinyalleri
-            rsi_signal = self._analyze_rsi(latest, previous)
-            if rsi_signal:
-                signals.append(rsi_signal)
-            
-            # MACD sinyalleri
-            macd_signal = self._analyze_macd(latest, previous)
-            if macd_signal:
-                signals.append(macd_signal)
-            
-            # Bollinger Bands sinyalleri
-            bb_signal = self._analyze_bollinger_bands(latest, previous)
-            if bb_signal:
-                signals.append(bb_signal)
-            
-            # Moving Average sinyalleri
-            ma_signal = self._analyze_moving_averages(latest, previous)
-            if ma_signal:
-                signals.append(ma_signal)
-            
-            # Stochastic sinyalleri
-            stoch_signal = self._analyze_stochastic(latest, previous)
-            if stoch_signal:
-                signals.append(stoch_signal)
-            
-            # Volume sinyalleri
-            volume_signal = self._analyze_volume(latest, df.tail(20))
-            if volume_signal:
-                signals.append(volume_signal)
+            if len(df) < 2:
+                return []
             
-            return signals
+            # Durumsuz: önceki çubuk her zaman çerçevenin kendi sondan ikinci
+            # satırıdır (başka sembolün ya da kapanmamış mumun eski değeri değil)
+            return self._analyze_rows(self._row(df, -1), self._row(df, -2), len(df))
             
         except Exception as e:
             self.logger.error(f"Teknik sinyal üretme hatası: {e}")
             return []
     
-    def _analyze_rsi(self, latest: pd.Series, previous: pd.Series) -> Optional[Dict]:
-        """RSI analizi yapar"""
-        try:
-            current_rsi = latest['rsi']
-            previous_rsi = previous['rsi']
-            
-            signal = None
-            
-            # Aşırı satım bölgesinden çıkış
-            if previous_rsi < 30 and current_rsi > 30:
-                signal = {
-                    'type': SignalType.BUY,
-                    'strength': SignalStrength.STRONG,
-                    'indicator': 'RSI',
-                    'value': current_rsi,
-                    'reason': 'Aşırı satım bölgesinden çıkış',
-                    'confidence': 75
-                }
-            
-            # Aşırı alım bölgesinden çıkış
-            elif previous_rsi > 70 and current_rsi < 70:
-                signal = {
-                    'type': SignalType.SELL,
-                    'strength': SignalStrength.STRONG,
-                    'indicator': 'RSI',
-                    'value': current_rsi,
-                    'reason': 'Aşırı alım bölgesinden çıkış',
-                    'confidence': 75
-                }
-            
-            # RSI yükseliş trendi
-            elif current_rsi > previous_rsi and current_rsi > 50:
-                signal = {
-                    'type': SignalType.BUY,
-                    'strength': SignalStrength.MODERATE,
-                    'indicator': 'RSI',
-                    'value': current_rsi,
-                    'reason': 'RSI yükseliş trendi',
-                    'confidence': 60
-                }
-            
-            # RSI düşüş trendi
-            elif current_rsi < previous_rsi and current_rsi < 50:
-                signal = {
-                    'type': SignalType.SELL,
-                    'strength': SignalStrength.MODERATE,
-                    'indicator': 'RSI',
-                    'value': current_rsi,
-                    'reason': 'RSI düşüş trendi',
-                    'confidence': 60
-                }
-            
-            return signal
-            
-        except Exception as e:
-            self.logger.error(f"RSI analiz hatası: {e}")
-            return None
+    def _row(self, df: pd.DataFrame, position: int) -> np.ndarray:
+        """DataFrame'in bir çubuğunu _COLS sırasında float dizisine çevirir"""
+        row = np.full(len(self._COLS), np.nan)
+        for i, col in enumerate(self._COLS):
+            if col in df.columns:
+                row[i] = df[col].to_numpy()[position]
+        return row
     
-    def _analyze_macd(self, latest: pd.Series, previous: pd.Series) -> Optional[Dict]:
-        """MACD analizi yapar"""
+    def reset(self):
+        """Akış durumunu sıfırlar"""
+        self._prev = None
+        self._bars = 0
+    
+    def update(self, bar: Dict) -> List[Signal]:
+        """
+        Yeni bir çubuğu işleyerek teknik sinyalleri O(1) sürede üretir
+        
+        Analizörler yalnızca bir önceki çubuğun saklanan değerleri ile yeni
+        çubuğun değerlerini karşılaştırır; ardından durum yeni çubukla güncellenir.
+        İlk 50 çubukta sinyal üretilmez.
+        
+        Args:
+            bar (Dict): Gösterge sütunlarını içeren tek çubuk (ör. df.iloc[-1].to_dict())
+            
+        Returns:
+            List[Signal]: Bu çubukta üretilen teknik sinyaller
+        """
         try:
-            current_macd = latest['macd']
-            current_signal = latest['macd_signal']
-            previous_macd = previous['macd']
-            previous_signal = previous['macd_signal']
-            
-            signal = None
-            
-            # MACD sinyal çizgisini yukarı kesiyor
-            if previous_macd < previous_signal and current_macd > current_signal:
-                signal = {
-                    'type': SignalType.BUY,
-                    'strength': SignalStrength.STRONG,
-                    'indicator': 'MACD',
-                    'value': current_macd,
-                    'reason': 'MACD sinyal çizgisini yukarı kesti',
-                    'confidence': 80
-                }
-            
-            # MACD sinyal çizgisini aşağı kesiyor
-            elif previous_macd > previous_signal and current_macd < current_signal:
-                signal = {
-                    'type': SignalType.SELL,
-                    'strength': SignalStrength.STRONG,
-                    'indicator': 'MACD',
-                    'value': current_macd,
-                    'reason': 'MACD sinyal çizgisini aşağı kesti',
-                    'confidence': 80
-                }
-            
-            # MACD histogramı pozitif ve artıyor
-            elif latest['macd_hist'] > 0 and latest['macd_hist'] > previous['macd_hist']:
-                signal = {
-                    'type': SignalType.BUY,
-                    'strength': SignalStrength.MODERATE,
-                    'indicator': 'MACD',
-                    'value': current_macd,
-                    'reason': 'MACD histogramı pozitif ve artıyor',
-                    'confidence': 65
-                }
-            
-            return signal
+            row = np.array([bar.get(col, np.nan) for col in self._COLS], dtype=np.float64)
+            return self._update_row(row)
             
         except Exception as e:
-            self.logger.error(f"MACD analiz hatası: {e}")
+            self.logger.error(f"Çubuk güncelleme hatası: {e}")
+            return []
+    
+    def _update_row(self, latest: np.ndarray) -> List[Signal]:
+        """_COLS sırasındaki bir çubuğu işler ve akış durumunu ilerletir"""
+        previous = self._prev
+        self._prev = latest
+        self._bars += 1
+        
+        if previous is None:
+            return []
+        return self._analyze_rows(latest, previous, self._bars)
+    
+    def _analyze_rows(self, latest: np.ndarray, previous: np.ndarray, bars: int) -> List[Signal]:
+        """Son iki çubuğu (_COLS sırasında) etkin analizörlerle değerlendirir"""
+        if bars < 50:  # Yeterli veri yoksa sinyal üretme
+            return []
+        
+        idx = self._IDX
+        signals = [analyze(latest, previous, idx) for analyze in self._analyzers]
+        return [signal for signal in signals if signal]
+    
+    def _batch_codes(self, df: pd.DataFrame) -> Optional[Tuple[Tuple[str, ...], np.ndarray, Any]]:
+        """
+        Tüm çubuklar için (çubuk, gösterge) int8 sinyal kod matrisini hesaplar
+        
+        Returns:
+            Optional[tuple]: (gösterge anahtarları, kod matrisi, sütun erişimcisi);
+                yeterli veri ya da gösterge yoksa None
+        """
+        n = len(df)
+        if n < 50:  # Yeterli veri yoksa sinyal üretme
             return None
+        
+        # Etkin ve sütunları mevcut göstergeler
+        columns = set(df.columns)
+        keys = tuple(key for key in self.enabled if set(self._ANALYZERS[key][0]) <= columns)
+        if not keys:
+            return None
+        
+        arrays = {}
+        
+        def col(name):
+            if name not in arrays:
+                arrays[name] = df[name].to_numpy(dtype=np.float64)
+            return arrays[name]
+        
+        # İlk 49 çubukta canlı yol da sinyal üretmez.
+        # Numba varsa etkin göstergeler tek birleşik döngüde kodlanır.
+        fused = fused_codes(keys)
+        if fused is not None:
+            kernel, kernel_columns = fused
+            codes = kernel(49, *[col(name) for name in kernel_columns])
+        else:
+            codes = np.column_stack([
+                CODE_KERNELS[key][0](*[col(name) for name in CODE_KERNELS[key][1]])
+                for key in keys
+            ])
+            codes[:49] = 0
+        
+        return keys, codes, col
     
-    def _analyze_bollinger_bands(self, latest: pd.Series, previous: pd.Series) -> Optional[Dict]:
-        """Bollinger Bands analizi yapar"""
+    def _generate_technical_signals_batch(self, df: pd.DataFrame) -> List[Signal]:
+        """
+        Teknik analiz sinyallerini tüm çubuklar için vektörel olarak üretir
+        
+        Her çubuk için sonuç, _generate_technical_signals'ın o çubukta biten
+        veriyle üreteceği sinyallerle aynıdır. Kesişim/eşik koşulları Numba
+        kernel'lerinde çubuk başına int8 koda çevrilir, sözlükler yalnızca
+        sinyal olan çubuklar için oluşturulur. Her sinyalin 'bar' alanı çubuğun
+        indeks değeridir.
+        
+        Args:
+            df (pd.DataFrame): Teknik göstergeler eklenmiş DataFrame
+            
+        Returns:
+            List[Signal]: Çubuk sırasıyla tüm teknik sinyaller
+        """
         try:
-            current_price = latest['close']
-            current_upper = latest['bb_upper']
-            current_lower = latest['bb_lower']
-            current_position = latest['bb_position']
-            
-            signal = None
-            
-            # Fiyat alt banda dokunuyor
-            if current_price <= current_lower * 1.01:
-                signal = {
-                    'type': SignalType.BUY,
-                    'strength': SignalStrength.STRONG,
-                    'indicator': 'Bollinger Bands',
-                    'value': current_position,
-                    'reason': 'Fiyat alt Bollinger Bandına dokundu',
-                    'confidence': 70
-                }
-            
-            # Fiyat üst banda dokunuyor
-            elif current_price >= current_upper * 0.99:
-                signal = {
-                    'type': SignalType.SELL,
-                    'strength': SignalStrength.STRONG,
-                    'indicator': 'Bollinger Bands',
-                    'value': current_position,
-                    'reason': 'Fiyat üst Bollinger Bandına dokundu',
-                    'confidence': 70
-                }
-            
-            # Band genişliği daralıyor (sıkışma)
-            elif latest['bb_width'] < previous['bb_width'] * 0.9:
-                signal = {
-                    'type': SignalType.HOLD,
-                    'strength': SignalStrength.WEAK,
-                    'indicator': 'Bollinger Bands',
-                    'value': latest['bb_width'],
-                    'reason': 'Bollinger Bands sıkışması - breakout bekleniyor',
-                    'confidence': 50
-                }
+            batch = self._batch_codes(df)
+            if batch is None:
+                return []
+            keys, codes, col = batch
             
-            return signal
+            # Her gösterge için: (sinyal şablonları, koda göre değer dizileri)
+            analyzers = [
+                (self._ANALYZERS[key][2], [col(name) for name in self._ANALYZERS[key][3]])
+                for key in keys
+            ]
+            
+            bars, slots = np.nonzero(codes)
+            index = df.index
+            
+            signals = []
+            for i, j in zip(bars.tolist(), slots.tolist()):
+                templates, values = analyzers[j]
+                k = codes[i, j] - 1
+                signals.append(Signal(**templates[k], value=values[k][i], bar=index[i]))
+            return signals
             
         except Exception as e:
-            self.logger.error(f"Bollinger Bands analiz hatası: {e}")
-            return None
+            self.logger.error(f"Toplu teknik sinyal üretme hatası: {e}")
+            return []
     
-    def _analyze_moving_averages(self, latest: pd.Series, previous: pd.Series) -> Optional[Dict]:
-        """Hareketli ortalama analizi yapar"""
+    def generate_signals_array(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Tüm çubukların teknik sinyallerini SIGNAL_DTYPE yapılandırılmış dizisi olarak döndürür
+        
+        _generate_technical_signals_batch ile aynı sinyalleri aynı sırayla üretir;
+        ancak Signal nesneleri kurulmaz, alanlar kod matrisinden şablon tablolarına
+        indekslenerek sütun sütun doldurulur. pd.DataFrame(dizi) ile doğrudan
+        backtest tablosuna çevrilebilir; 'timestamp' çubuğun indeks değeridir.
+        
+        Args:
+            df (pd.DataFrame): DatetimeIndex'li, teknik göstergeler eklenmiş DataFrame
+            
+        Returns:
+            np.ndarray: SIGNAL_DTYPE tipinde sinyal dizisi (sinyal yoksa boş)
+        """
         try:
-            current_price = latest['close']
-            ema_12 = latest['ema_12']
-            ema_26 = latest['ema_26']
-            sma_50 = latest['sma_50']
-            sma_200 = latest['sma_200']
-            
-            signal = None
-            
-            # Altın kesişim (Golden Cross)
-            if previous['ema_12'] <= previous['ema_26'] and ema_12 > ema_26:
-                signal = {
-                    'type': SignalType.STRONG_BUY,
-                    'strength': SignalStrength.VERY_STRONG,
-                    'indicator': 'Moving Averages',
-                    'value': ema_12,
-                    'reason': 'Altın kesişim (EMA 12 > EMA 26)',
-                    'confidence': 85
-                }
-            
-            # Ölüm kesişimi (Death Cross)
-            elif previous['ema_12'] >= previous['ema_26'] and ema_12 < ema_26:
-                signal = {
-                    'type': SignalType.STRONG_SELL,
-                    'strength': SignalStrength.VERY_STRONG,
-                    'indicator': 'Moving Averages',
-                    'value': ema_12,
-                    'reason': 'Ölüm kesişimi (EMA 12 < EMA 26)',
-                    'confidence': 85
-                }
-            
-            # Fiyat 50 SMA'nın üstünde
-            elif current_price > sma_50 and previous['close'] <= previous['sma_50']:
-                signal = {
-                    'type': SignalType.BUY,
-                    'strength': SignalStrength.MODERATE,
-                    'indicator': 'Moving Averages',
-                    'value': sma_50,
-                    'reason': 'Fiyat 50 SMA\'nın üstüne çıktı',
-                    'confidence': 65
-                }
-            
-            return signal
+            batch = self._batch_codes(df)
+            if batch is None:
+                return np.empty(0, dtype=SIGNAL_DTYPE)
+            keys, codes, col = batch
+            
+            # Etkin göstergelerin şablonları tek tabloda; gösterge j'nin k kodlu
+            # şablonu offsets[j] + k - 1 satırındadır
+            templates = [t for key in keys for t in self._ANALYZERS[key][2]]
+            value_columns = [c for key in keys for c in self._ANALYZERS[key][3]]
+            offsets = np.cumsum([0] + [len(self._ANALYZERS[key][2]) for key in keys[:-1]])
+            
+            bars, slots = np.nonzero(codes)
+            rows = offsets[slots] + codes[bars, slots] - 1
+            values = np.stack([col(name) for name in value_columns])
+            
+            out = np.empty(len(bars), dtype=SIGNAL_DTYPE)
+            for field in ('type', 'strength', 'confidence', 'indicator', 'reason'):
+                table = np.array([t[field] for t in templates], dtype=SIGNAL_DTYPE[field])
+                out[field] = table[rows]
+            out['value'] = values[rows, bars]
+            out['timestamp'] = df.index.to_numpy()[bars]
+            return out
             
         except Exception as e:
-            self.logger.error(f"Hareketli ortalama analiz hatası: {e}")
-            return None
+            self.logger.error(f"Sinyal dizisi üretme hatası: {e}")
+            return np.empty(0, dtype=SIGNAL_DTYPE)
     
-    def _analyze_stochastic(self, latest: pd.Series, previous: pd.Series) -> Optional[Dict]:
+    def _analyze_rsi(self, latest: np.ndarray, previous: np.ndarray, idx: Dict[str, int]) -> Optional[Signal]:
+        """RSI analizi yapar"""
+        current_rsi = latest[idx['rsi']]
+        previous_rsi = previous[idx['rsi']]
+        
+        # Aşırı satım bölgesinden çıkış
+        if previous_rsi < 30 and current_rsi > 30:
+            return Signal(**self._RSI_SIGNALS[0], value=current_rsi)
+        
+        # Aşırı alım bölgesinden çıkış
+        if previous_rsi > 70 and current_rsi < 70:
+            return Signal(**self._RSI_SIGNALS[1], value=current_rsi)
+        
+        # RSI yükseliş trendi
+        if current_rsi > previous_rsi and current_rsi > 50:
+            return Signal(**self._RSI_SIGNALS[2], value=current_rsi)
+        
+        # RSI düşüş trendi
+        if current_rsi < previous_rsi and current_rsi < 50:
+            return Signal(**self._RSI_SIGNALS[3], value=current_rsi)
+        
+        return None
+    
+    def _analyze_macd(self, latest: np.ndarray, previous: np.ndarray, idx: Dict[str, int]) -> Optional[Signal]:
+        """MACD analizi yapar"""
+        current_macd = latest[idx['macd']]
+        current_signal = latest[idx['macd_signal']]
+        previous_macd = previous[idx['macd']]
+        previous_signal = previous[idx['macd_signal']]
+        
+        # MACD sinyal çizgisini yukarı kesiyor
+        if previous_macd < previous_signal and current_macd > current_signal:
+            return Signal(**self._MACD_SIGNALS[0], value=current_macd)
+        
+        # MACD sinyal çizgisini aşağı kesiyor
+        if previous_macd > previous_signal and current_macd < current_signal:
+            return Signal(**self._MACD_SIGNALS[1], value=current_macd)
+        
+        # MACD histogramı pozitif ve artıyor
+        if latest[idx['macd_hist']] > 0 and latest[idx['macd_hist']] > previous[idx['macd_hist']]:
+            return Signal(**self._MACD_SIGNALS[2], value=current_macd)
+        
+        return None
+    
+    def _analyze_bollinger_bands(self, latest: np.ndarray, previous: np.ndarray, idx: Dict[str, int]) -> Optional[Signal]:
+        """Bollinger Bands analizi yapar"""
+        current_price = latest[idx['close']]
+        current_position = latest[idx['bb_position']]
+        
+        # Fiyat alt banda dokunuyor
+        if current_price <= latest[idx['bb_lower']] * 1.01:
+            return Signal(**self._BOLLINGER_SIGNALS[0], value=current_position)
+        
+        # Fiyat üst banda dokunuyor
+        if current_price >= latest[idx['bb_upper']] * 0.99:
+            return Signal(**self._BOLLINGER_SIGNALS[1], value=current_position)
+        
+        # Band genişliği daralıyor (sıkışma)
+        if latest[idx['bb_width']] < previous[idx['bb_width']] * 0.9:
+            return Signal(**self._BOLLINGER_SIGNALS[2], value=latest[idx['bb_width']])
+        
+        return None
+    
+    def _analyze_moving_averages(self, latest: np.ndarray, previous: np.ndarray, idx: Dict[str, int]) -> Optional[Signal]:
+        """Hareketli ortalama analizi yapar"""
+        ema_12 = latest[idx['ema_12']]
+        ema_26 = latest[idx['ema_26']]
+        sma_50 = latest[idx['sma_50']]
+        
+        # Altın kesişim (Golden Cross)
+        if previous[idx['ema_12']] <= previous[idx['ema_26']] and ema_12 > ema_26:
+            return Signal(**self._MA_SIGNALS[0], value=ema_12)
+        
+        # Ölüm kesişimi (Death Cross)
+        if previous[idx['ema_12']] >= previous[idx['ema_26']] and ema_12 < ema_26:
+            return Signal(**self._MA_SIGNALS[1], value=ema_12)
+        
+        # Fiyat 50 SMA'nın üstünde
+        if latest[idx['close']] > sma_50 and previous[idx['close']] <= previous[idx['sma_50']]:
+            return Signal(**self._MA_SIGNALS[2], value=sma_50)
+        
+        return None
+    
+    def _analyze_stochastic(self, latest: np.ndarray, previous: np.ndarray, idx: Dict[str, int]) -> Optional[Signal]:
         """Stochastic analizi yapar"""
-        try:
-            current_k = latest['stoch_k']
-            current_d = latest['stoch_d']
-            previous_k = previous['stoch_k']
-            previous_d = previous['stoch_d']
-            
-            signal = None
-            
-            # Aşırı satım bölgesinden çıkış
-            if previous_k < 20 and current_k > 20:
-                signal = {
-                    'type': SignalType.BUY,
-                    'strength': SignalStrength.STRONG,
-                    'indicator': 'Stochastic',
-                    'value': current_k,
-                    'reason': 'Stochastic aşırı satım bölgesinden çıkış',
-                    'confidence': 70
-                }
-            
-            # Aşırı alım bölgesinden çıkış
-            elif previous_k > 80 and current_k < 80:
-                signal = {
-                    'type': SignalType.SELL,
-                    'strength': SignalStrength.STRONG,
-                    'indicator': 'Stochastic',
-                    'value': current_k,
-                    'reason': 'Stochastic aşırı alım bölgesinden çıkış',
-                    'confidence': 70
-                }
-            
-            # K ve D çizgileri kesişimi
-            elif previous_k < previous_d and current_k > current_d:
-                signal = {
-                    'type': SignalType.BUY,
-                    'strength': SignalStrength.MODERATE,
-                    'indicator': 'Stochastic',
-                    'value': current_k,
-                    'reason': 'Stochastic K ve D çizgileri yukarı kesişim',
-                    'confidence': 60
-                }
-            
-            return signal
-            
-        except Exception as e:
-            self.logger.error(f"Stochastic analiz hatası: {e}")
-            return None
+        current_k = latest[idx['stoch_k']]
+        current_d = latest[idx['stoch_d']]
+        previous_k = previous[idx['stoch_k']]
+        previous_d = previous[idx['stoch_d']]
+        
+        # Aşırı satım bölgesinden çıkış
+        if previous_k < 20 and current_k > 20:
+            return Signal(**self._STOCHASTIC_SIGNALS[0], value=current_k)
+        
+        # Aşırı alım bölgesinden çıkış
+        if previous_k > 80 and current_k < 80:
+            return Signal(**self._STOCHASTIC_SIGNALS[1], value=current_k)
+        
+        # K ve D çizgileri kesişimi
+        if previous_k < previous_d and current_k > current_d:
+            return Signal(**self._STOCHASTIC_SIGNALS[2], value=current_k)
+        
+        return None
     
-    def _analyze_volume(self, latest: pd.Series, recent_data: pd.DataFrame) -> Optional[Dict]:
+    def _analyze_volume(self, latest: np.ndarray, previous: np.ndarray, idx: Dict[str, int]) -> Optional[Signal]:
         """Hacim analizi yapar"""
-        try:
-            current_volume = latest['volume']
-            avg_volume = recent_data['volume'].mean()
-            volume_ratio = latest['volume_ratio']
-            
-            signal = None
-            
-            # Yüksek hacimle fiyat artışı
-            if volume_ratio > 2.0 and latest['close'] > latest['open']:
-                signal = {
-                    'type': SignalType.BUY,
-                    'strength': SignalStrength.STRONG,
-                    'indicator': 'Volume',
-                    'value': volume_ratio,
-                    'reason': 'Yüksek hacimle fiyat artışı',
-                    'confidence': 75
-                }
-            
-            # Yüksek hacimle fiyat düşüşü
-            elif volume_ratio > 2.0 and latest['close'] < latest['open']:
-                signal = {
-                    'type': SignalType.SELL,
-                    'strength': SignalStrength.STRONG,
-                    'indicator': 'Volume',
-                    'value': volume_ratio,
-                    'reason': 'Yüksek hacimle fiyat düşüşü',
-                    'confidence': 75
-                }
-            
-            return signal
-            
-        except Exception as e:
-            self.logger.error(f"Hacim analiz hatası: {e}")
-            return None
+        volume_ratio = latest[idx['volume_ratio']]
+        
+        # Yüksek hacimle fiyat artışı
+        if volume_ratio > 2.0 and latest[idx['close']] > latest[idx['open']]:
+            return Signal(**self._VOLUME_SIGNALS[0], value=volume_ratio)
+        
+        # Yüksek hacimle fiyat düşüşü
+        if volume_ratio > 2.0 and latest[idx['close']] < latest[idx['open']]:
+            return Signal(**self._VOLUME_SIGNALS[1], value=volume_ratio)
+        
+        return None
     
-    def _generate_ai_signals(self, df: pd.DataFrame, predictions: Dict) -> List[Dict]:
+    def _generate_ai_signals(self, df: pd.DataFrame, predictions: Dict) -> List[Signal]:
         """AI tahminlerine dayalı sinyaller üretir"""
         signals = []
         
@@ -426,42 +569,18 @@ class SignalGenerator:
                 # Fiyat değişim yüzdesi
                 price_change_pct = ((next_24h_pred - current_price) / current_price) * 100
                 
-                if price_change_pct > 5:  # %5'ten fazla artış bekleniyor
-                    signals.append({
-                        'type': SignalType.STRONG_BUY,
-                        'strength': SignalStrength.VERY_STRONG,
-                        'indicator': 'AI Prediction',
-                        'value': price_change_pct,
-                        'reason': f'AI {price_change_pct:.1f}% artış tahmin ediyor',
-                        'confidence': 80
-                    })
-                elif price_change_pct > 2:  # %2-5 arası artış
-                    signals.append({
-                        'type': SignalType.BUY,
-                        'strength': SignalStrength.STRONG,
-                        'indicator': 'AI Prediction',
-                        'value': price_change_pct,
-                        'reason': f'AI {price_change_pct:.1f}% artış tahmin ediyor',
-                        'confidence': 70
-                    })
-                elif price_change_pct < -5:  # %5'ten fazla düşüş
-                    signals.append({
-                        'type': SignalType.STRONG_SELL,
-                        'strength': SignalStrength.VERY_STRONG,
-                        'indicator': 'AI Prediction',
-                        'value': price_change_pct,
-                        'reason': f'AI {abs(price_change_pct):.1f}% düşüş tahmin ediyor',
-                        'confidence': 80
-                    })
-                elif price_change_pct < -2:  # %2-5 arası düşüş
-                    signals.append({
-                        'type': SignalType.SELL,
-                        'strength': SignalStrength.STRONG,
-                        'indicator': 'AI Prediction',
-                        'value': price_change_pct,
-                        'reason': f'AI {abs(price_change_pct):.1f}% düşüş tahmin ediyor',
-                        'confidence': 70
-                    })
+                # Bölge: < -5, [-5, -2), [-2, 2], (2, 5], > 5. Eşikler kesin
+                # karşılaştırmadır; eşiğe eşit değer sıfıra yakın bölgede kalır.
+                if not np.isnan(price_change_pct):
+                    find_zone = bisect_right if price_change_pct < 0 else bisect_left
+                    zone = self._AI_SIGNALS[find_zone(self._AI_THRESHOLDS, price_change_pct)]
+                    if zone is not None:
+                        template, direction = zone
+                        signals.append(Signal(
+                            **template,
+                            value=price_change_pct,
+                            reason=f'AI {abs(price_change_pct):.1f}% {direction} tahmin ediyor'
+                        ))
             
             return signals
             
@@ -469,60 +588,71 @@ class SignalGenerator:
             self.logger.error(f"AI sinyal üretme hatası: {e}")
             return []
     
-    def _combine_signals(self, signals: List[Dict]) -> List[Dict]:
+    def _combine_signals(self, signals: List[Signal]) -> List[Dict]:
         """Sinyalleri birleştirir ve güven skorunu hesaplar"""
         try:
             if not signals:
                 return []
             
-            # Sinyalleri türlerine göre grupla
-            buy_signals = [s for s in signals if s['type'] in [SignalType.BUY, SignalType.STRONG_BUY]]
-            sell_signals = [s for s in signals if s['type'] in [SignalType.SELL, SignalType.STRONG_SELL]]
-            hold_signals = [s for s in signals if s['type'] == SignalType.HOLD]
-            
+            # Sinyalleri tek geçişte türlerine göre grupla; güven toplamı, güçlü
+            # sinyal sayısı ve gösterge/gerekçe listeleri aynı döngüde biriktirilir
+            strong = SignalStrength.STRONG
+            buy_conf = buy_strong = sell_conf = sell_strong = 0
+            buy_indicators, buy_reasons = [], []
+            sell_indicators, sell_reasons = [], []
+            hold_indicators, hold_reasons = [], []
+            
+            for s in signals:
+                signal_type = s.type
+                if signal_type > 0:
+                    buy_conf += s.confidence
+                    buy_strong += s.strength >= strong
+                    buy_indicators.append(s.indicator)
+                    buy_reasons.append(s.reason)
+                elif signal_type < 0:
+                    sell_conf += s.confidence
+                    sell_strong += s.strength >= strong
+                    sell_indicators.append(s.indicator)
+                    sell_reasons.append(s.reason)
+                else:
+                    hold_indicators.append(s.indicator)
+                    hold_reasons.append(s.reason)
+            
+            buy_count, sell_count = len(buy_indicators), len(sell_indicators)
             final_signals = []
+            now = datetime.now()  # Aynı çağrıdaki sinyaller ortak zaman damgası taşır
             
             # Alım sinyalleri
-            if buy_signals:
-                avg_confidence = np.mean([s['confidence'] for s in buy_signals])
-                strength_count = sum(1 for s in buy_signals if s['strength'] in [SignalStrength.STRONG, SignalStrength.VERY_STRONG])
-                
-                signal_type = SignalType.STRONG_BUY if strength_count >= 2 else SignalType.BUY
-                
+            if buy_count:
                 final_signals.append({
-                    'type': signal_type,
-                    'confidence': min(avg_confidence + 10, 95),  # Bonus güven puanı
-                    'signals_count': len(buy_signals),
-                    'indicators': [s['indicator'] for s in buy_signals],
-                    'reasons': [s['reason'] for s in buy_signals],
-                    'timestamp': datetime.now()
+                    'type': SignalType.STRONG_BUY if buy_strong >= 2 else SignalType.BUY,
+                    'confidence': min(buy_conf / buy_count + 10, 95),  # Bonus güven puanı
+                    'signals_count': buy_count,
+                    'indicators': buy_indicators,
+                    'reasons': buy_reasons,
+                    'timestamp': now
                 })
             
             # Satım sinyalleri
-            if sell_signals:
-                avg_confidence = np.mean([s['confidence'] for s in sell_signals])
-                strength_count = sum(1 for s in sell_signals if s['strength'] in [SignalStrength.STRONG, SignalStrength.VERY_STRONG])
-                
-                signal_type = SignalType.STRONG_SELL if strength_count >= 2 else SignalType.SELL
-                
+            if sell_count:
                 final_signals.append({
-                    'type': signal_type,
-                    'confidence': min(avg_confidence + 10, 95),
-                    'signals_count': len(sell_signals),
-                    'indicators': [s['indicator'] for s in sell_signals],
-                    'reasons': [s['reason'] for s in sell_signals],
-                    'timestamp': datetime.now()
+                    'type': SignalType.STRONG_SELL if sell_strong >= 2 else SignalType.SELL,
+                    'confidence': min(sell_conf / sell_count + 10, 95),
+                    'signals_count': sell_count,
+                    'indicators': sell_indicators,
+                    'reasons': sell_reasons,
+                    'timestamp': now
                 })
             
             # Bekleme sinyalleri
-            if hold_signals and not buy_signals and not sell_signals:
+            if hold_indicators and not buy_count and not sell_count:
                 final_signals.append({
                     'type': SignalType.HOLD,
                     'confidence': 50,
-                    'signals_count': len(hold_signals),
-                    'indicators': [s['indicator'] for s in hold_signals],
-                    'reasons': [s['reason'] for s in hold_signals],
-                    'timestamp': datetime.now()
+                    'signals_count': len(hold_indicators),
+                    'indicators': hold_indicators,
+                    'reasons': hold_reasons,
+                    'timestamp': now
                 })
             
             return final_signals
@@ -537,36 +667,36 @@ class SignalGenerator:
     
     def get_signal_history(self, limit: int = 10) -> List[Dict]:
         """Sinyal geçmişini döndürür"""
-        return self.signals[-limit:] if self.signals else []
+        return list(islice(self.signals, max(0, len(self.signals) - limit), None))
 
-# Test fonksiyonu
-if __name__ == "__main__":
+def _selftest():
+    """Sentetik göstergelerle sinyal üreticiyi çalıştırır"""
     # Test için örnek veri oluştur
-    dates = pd.date_range('2024-01-01', periods=100, freq='H')
-    np.random.seed(42)
-    
-    test_data = pd.DataFrame({
-        'open': np.random.randn(100).cumsum() + 100,
-        'high': np.random.randn(100).cumsum() + 102,
-        'low': np.random.randn(100).cumsum() + 98,
-        'close': np.random.randn(100).cumsum() + 100,
-        'volume': np.random.randint(1000, 10000, 100),
-        'rsi': np.random.uniform(20, 80, 100),
-        'macd': np.random.randn(100),
-        'macd_signal': np.random.randn(100),
-        'macd_histogram': np.random.randn(100),
-        'bb_upper': np.random.randn(100).cumsum() + 105,
-        'bb_lower': np.random.randn(100).cumsum() + 95,
-        'bb_position': np.random.uniform(0, 1, 100),
-        'bb_width': np.random.uniform(0.1, 0.3, 100),
-        'ema_12': np.random.randn(100).cumsum() + 100,
-        'ema_26': np.random.randn(100).cumsum() + 100,
-        'sma_50': np.random.randn(100).cumsum() + 100,
-        'sma_200': np.random.randn(100).cumsum() + 100,
-        'stoch_k': np.random.uniform(0, 100, 100),
-        'stoch_d': np.random.uniform(0, 100, 100),
-        'volume_ratio': np.random.uniform(0.5, 3.0, 100)
-    }, index=dates)
+    n = 100
+    dates = pd.date_range('2024-01-01', periods=n, freq='h')
+    rng = np.random.default_rng(42)
+    
+    # Rastgele yürüyüş sütunları (fiyatlar, bantlar ve ortalamalar) tek seferde
+    walk_columns = ['open', 'high', 'low', 'close', 'bb_upper', 'bb_lower',
+                    'ema_12', 'ema_26', 'sma_50', 'sma_200']
+    offsets = np.array([100, 102, 98, 100, 105, 95, 100, 100, 100, 100], dtype=np.float64)
+    walks = rng.standard_normal((len(walk_columns), n)).cumsum(axis=1) + offsets[:, None]
+    
+    # Düzgün dağılımlı osilatör/oran sütunları
+    uniform_columns = ['rsi', 'bb_position', 'bb_width', 'stoch_k', 'stoch_d', 'volume_ratio']
+    lows = np.array([20, 0, 0.1, 0, 0, 0.5])
+    highs = np.array([80, 1, 0.3, 100, 100, 3.0])
+    uniforms = rng.uniform(lows[:, None], highs[:, None], (len(uniform_columns), n))
+    
+    normal_columns = ['macd', 'macd_signal', 'macd_hist']
+    normals = rng.standard_normal((len(normal_columns), n))
+    
+    test_data = pd.DataFrame(
+        np.vstack([walks, uniforms, normals]).T,
+        columns=walk_columns + uniform_columns + normal_columns,
+        index=dates
+    )
+    test_data['volume'] = rng.integers(1000, 10000, n)
     
     # Sinyal üreticiyi test et
     generator = SignalGenerator()
@@ -574,6 +704,10 @@ if __name__ == "__main__":
     
     print(f"Üretilen sinyal sayısı: {len(signals)}")
     for signal in signals:
-        print(f"Sinyal: {signal['type'].value}, Güven: {signal['confidence']:.1f}%")
+        print(f"Sinyal: {signal['type'].name}, Güven: {signal['confidence']:.1f}%")
         print(f"Göstergeler: {', '.join(signal['indicators'])}")
-        print("---") 
\ No newline at end of file
+        print("---")
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    _selftest()
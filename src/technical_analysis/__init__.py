@@ -1,19 +1,8 @@
 # Teknik Analiz Modülü
 # Bu modül çeşitli teknik göstergeleri hesaplar
 
-from .indicators import TechnicalIndicators
+from .indicators import IncrementalIndicators, TechnicalIndicators
+from .patterns import PatternRecognition
+from .signals import SignalGenerator
 
-# Eksik modüller için basit placeholder'lar
-class PatternRecognition:
-    def __init__(self):
-        pass
-    def detect_patterns(self, df):
-        return {}
-
-class SignalGenerator:
-    def __init__(self):
-        pass
-    def generate_signals(self, df):
-        return {}
-
-__all__ = ['TechnicalIndicators', 'PatternRecognition', 'SignalGenerator'] 
\ No newline at end of file
+__all__ = ['TechnicalIndicators', 'IncrementalIndicators', 'PatternRecognition', 'SignalGenerator']
@@ -0,0 +1,448 @@
+"""
+Teknik göstergeler için Numba kernel'leri
+Tüm göstergeleri fiyat/hacim dizilerini tek kez dolaşarak hesaplar
+"""
+
+import math
+
+import numpy as np
+
+from src._njit import EAGER_JIT, njit, prange
+
+
+# compute_all çıktılarının sırası
+INDICATOR_COLUMNS = (
+    'sma_20', 'sma_50', 'sma_200', 'ema_12', 'ema_26', 'ema_50', 'wma_20',
+    'rsi', 'macd', 'macd_signal', 'macd_hist',
+    'bb_upper', 'bb_middle', 'bb_lower', 'bb_width', 'bb_position',
+    'stoch_k', 'stoch_d', 'williams_r', 'atr', 'obv', 'volume_sma', 'volume_ratio'
+)
+
+
+@njit(cache=True)
+def sma_incremental(x, period, out):
+    """
+    Basit hareketli ortalamayı kayan toplamla O(N) hesaplar
+
+    Her adımda pencereye giren değer eklenip çıkan değer düşülür; süre
+    pencere boyutundan bağımsızdır. Pencere dolmadan değerler NaN olur.
+
+    Args:
+        x (np.ndarray): float64 giriş dizisi
+        period (int): Pencere uzunluğu
+        out (np.ndarray): Sonucun yazılacağı x ile aynı boyutta dizi
+    """
+    n = x.shape[0]
+    out[:min(period - 1, n)] = np.nan
+    if n < period:
+        return
+    s = x[:period].sum()
+    out[period - 1] = s / period
+    for i in range(period, n):
+        s += x[i] - x[i - period]
+        out[i] = s / period
+
+
+@njit(cache=True)
+def ewma(x, alpha, min_periods, out):
+    """
+    Üstel hareketli ortalamayı (adjust=False) tek geçişte hesaplar
+
+    Baştaki NaN değerler atlanır ve ortalama ilk geçerli değerle başlar
+    (MACD sinyali için gerekli). ta ile aynı şekilde ilk geçerli değerden
+    itibaren min_periods - 1 değer NaN kalır.
+
+    Args:
+        x (np.ndarray): float64 giriş dizisi
+        alpha (float): Düzeltme katsayısı, 2 / (pencere + 1)
+        min_periods (int): Geçerli sonuç için gereken en az gözlem
+        out (np.ndarray): Sonucun yazılacağı x ile aynı boyutta dizi
+    """
+    n = x.shape[0]
+    out[:] = np.nan
+    start = 0
+    while start < n and np.isnan(x[start]):
+        start += 1
+    if start == n:
+        return
+    e = x[start]
+    for i in range(start, n):
+        if i > start:
+            e = alpha * x[i] + (1.0 - alpha) * e
+        if i - start >= min_periods - 1:
+            out[i] = e
+
+
+@njit(cache=True)
+def wilder_rsi(close, period, out):
+    """
+    Wilder RSI'ı tek özyinelemeli geçişte hesaplar
+
+    ta.momentum.rsi ile aynı tanım: ilk fark 0 kabul edilir, yükseliş/düşüş
+    ortalamaları alpha = 1/period ile adjust=False üstel ortalamadır ve ilk
+    period - 1 değer NaN olur. Düşüş ortalaması 0 ise RSI 100'dür.
+
+    Args:
+        close (np.ndarray): float64 kapanış dizisi
+        period (int): RSI periyodu
+        out (np.ndarray): Sonucun yazılacağı close ile aynı boyutta dizi
+    """
+    n = close.shape[0]
+    alpha = 1.0 / period
+    up = down = 0.0
+    for i in range(n):
+        if i > 0:
+            d = close[i] - close[i - 1]
+            up = alpha * max(d, 0.0) + (1.0 - alpha) * up
+            down = alpha * max(-d, 0.0) + (1.0 - alpha) * down
+        if i < period - 1:
+            out[i] = np.nan
+        else:
+            out[i] = 100.0 if down == 0.0 else 100.0 - 100.0 / (1.0 + up / down)
+
+
+@njit(cache=True)
+def wilder_atr(high, low, close, period, out):
+    """
+    Wilder ATR'ı tek geçişte hesaplar
+
+    ta.volatility.average_true_range ile aynı tanım: ilk gerçek aralık yalnızca
+    high - low, ilk period - 1 değer 0, out[period - 1] ilk period gerçek
+    aralığın ortalaması, sonrası Wilder düzeltmesi.
+
+    Args:
+        high (np.ndarray): float64 yüksek fiyat dizisi
+        low (np.ndarray): float64 düşük fiyat dizisi
+        close (np.ndarray): float64 kapanış dizisi
+        period (int): ATR periyodu
+        out (np.ndarray): Sonucun yazılacağı close ile aynı boyutta dizi
+    """
+    n = close.shape[0]
+    tr_sum = 0.0
+    for i in range(n):
+        tr = high[i] - low[i]
+        if i > 0:
+            prev = close[i - 1]
+            tr = max(tr, abs(high[i] - prev), abs(low[i] - prev))
+        if i < period:
+            tr_sum += tr
+            out[i] = tr_sum / period if i == period - 1 else 0.0
+        else:
+            out[i] = (out[i - 1] * (period - 1) + tr) / period
+
+
+@njit(cache=True)
+def rolling_max_min(high, low, period, maxh, minl):
+    """
+    Kayan en yüksek high ve en düşük low değerlerini O(N) hesaplar
+
+    Her biri için pencere içindeki adayların indeksleri, period kapasiteli
+    halka tampondaki monoton bir kuyrukta tutulur; her indeks kuyruğa en
+    fazla bir kez girip çıkar. Pencere dolmadan değerler NaN olur.
+
+    Args:
+        high (np.ndarray): float64 yüksek fiyat dizisi
+        low (np.ndarray): float64 düşük fiyat dizisi
+        period (int): Pencere uzunluğu
+        maxh (np.ndarray): Kayan en yüksek değerlerin yazılacağı dizi
+        minl (np.ndarray): Kayan en düşük değerlerin yazılacağı dizi
+    """
+    n = high.shape[0]
+    qmax = np.empty(period, np.int64)
+    qmin = np.empty(period, np.int64)
+    head_max = count_max = 0
+    head_min = count_min = 0
+    for i in range(n):
+        # Pencereden çıkan indeksleri baştan at
+        if count_max > 0 and qmax[head_max] <= i - period:
+            head_max = (head_max + 1) % period
+            count_max -= 1
+        if count_min > 0 and qmin[head_min] <= i - period:
+            head_min = (head_min + 1) % period
+            count_min -= 1
+        
+        # Yeni değerin geçersiz kıldığı adayları sondan at
+        while count_max > 0 and high[qmax[(head_max + count_max - 1) % period]] <= high[i]:
+            count_max -= 1
+        qmax[(head_max + count_max) % period] = i
+        count_max += 1
+        while count_min > 0 and low[qmin[(head_min + count_min - 1) % period]] >= low[i]:
+            count_min -= 1
+        qmin[(head_min + count_min) % period] = i
+        count_min += 1
+        
+        if i < period - 1:
+            maxh[i] = minl[i] = np.nan
+        else:
+            maxh[i] = high[qmax[head_max]]
+            minl[i] = low[qmin[head_min]]
+
+
+@njit(cache=True, error_model='numpy')
+def bbands_fused(close, period, k, upper, middle, lower, width, position):
+    """
+    Bollinger Bands'in beş çıktısını tek döngüde hesaplar
+
+    Pencere ortalaması ve kareler toplamı Welford ekle/çıkar güncellemesiyle
+    tutulur (ddof=0, ta ile aynı). Bantlar eşitse genişlik/pozisyon bölmesi
+    istisna yerine NaN/inf üretir.
+
+    Args:
+        close (np.ndarray): float64 kapanış dizisi
+        period (int): Pencere uzunluğu
+        k (float): Standart sapma çarpanı
+        upper, middle, lower, width, position (np.ndarray): close ile aynı
+            boyutta çıktı dizileri
+    """
+    n = close.shape[0]
+    mean = m2 = 0.0
+    for i in range(n):
+        c = close[i]
+        if i < period:
+            delta = c - mean
+            mean += delta / (i + 1)
+            m2 += delta * (c - mean)
+        else:
+            old = close[i - period]
+            new_mean = mean + (c - old) / period
+            m2 += (c - old) * (c - new_mean + old - mean)
+            mean = new_mean
+        if i < period - 1:
+            upper[i] = middle[i] = lower[i] = width[i] = position[i] = np.nan
+            continue
+        std = math.sqrt(max(m2 / period, 0.0))
+        hi = mean + k * std
+        lo = mean - k * std
+        upper[i] = hi
+        middle[i] = mean
+        lower[i] = lo
+        width[i] = (hi - lo) / mean
+        position[i] = (c - lo) / (hi - lo)
+
+
+# Sonuçlar ta kütüphanesiyle aynı tanımları izler: SMA/BB/Stochastic/Williams
+# pencereler dolmadan NaN, EMA'lar adjust=False ve min_periods=pencere,
+# RSI ilk farkı 0 kabul eden Wilder ortalaması, ATR ilk 13 çubukta 0.
+# NaN karşılaştırmaları sonuca yansımalı; fastmath kullanılmaz. Sıfıra bölme
+# (ör. yatay piyasada stoch) istisna yerine inf/NaN üretir.
+@njit(cache=True, error_model='numpy')
+def compute_all(high, low, close, volume, out):
+    """
+    Tüm göstergeleri tek çubuk döngüsünde hesaplar
+
+    Hareketli ortalamalar kayan toplamlarla, Bollinger varyansı Welford
+    ekle/çıkar güncellemesiyle, EMA/RSI/ATR özyinelemeli olarak, en yüksek/
+    en düşük ve WMA 14/20 çubukluk pencere taramasıyla hesaplanır.
+
+    Ara değerler float64 yerel değişkenlerde tutulur ve çıktıdan geri
+    okunmaz; out float32 olduğunda yalnızca yazılan sonuçlar yuvarlanır.
+
+    Args:
+        high, low, close, volume (np.ndarray): float64 OHLCV dizileri
+        out (np.ndarray): (len(INDICATOR_COLUMNS), N) float32/float64 çıktı
+            tamponu; satırlar INDICATOR_COLUMNS sırasındadır
+    """
+    n = close.shape[0]
+
+    # Her satır bir gösterge; pencere dolmadan NaN (ATR'de 0)
+    out[:] = np.nan
+    sma_20 = out[0]
+    sma_50 = out[1]
+    sma_200 = out[2]
+    ema_12 = out[3]
+    ema_26 = out[4]
+    ema_50 = out[5]
+    wma_20 = out[6]
+    rsi = out[7]
+    macd = out[8]
+    macd_signal = out[9]
+    macd_hist = out[10]
+    bb_upper = out[11]
+    bb_middle = out[12]
+    bb_lower = out[13]
+    bb_width = out[14]
+    bb_position = out[15]
+    stoch_k = out[16]
+    stoch_d = out[17]
+    williams_r = out[18]
+    atr = out[19]
+    obv = out[20]
+    volume_sma = out[21]
+    volume_ratio = out[22]
+    atr[:] = 0.0
+
+    a12, a26, a50, a9 = 2.0 / 13.0, 2.0 / 27.0, 2.0 / 51.0, 2.0 / 10.0
+    a_rsi = 1.0 / 14.0
+
+    s20 = s50 = s200 = v20 = 0.0
+    bb_mean = bb_m2 = 0.0
+    e12 = e26 = e50 = 0.0
+    up = down = 0.0
+    signal = 0.0
+    k1 = k2 = np.nan
+    tr_sum = atr_value = 0.0
+    obv_sum = 0.0
+
+    for i in range(n):
+        c = close[i]
+
+        # Kayan toplamlar (SMA 20/50/200, hacim SMA 20)
+        s20 += c
+        s50 += c
+        s200 += c
+        v20 += volume[i]
+        if i >= 20:
+            s20 -= close[i - 20]
+            v20 -= volume[i - 20]
+        if i >= 50:
+            s50 -= close[i - 50]
+        if i >= 200:
+            s200 -= close[i - 200]
+        if i >= 19:
+            sma_20[i] = s20 / 20.0
+            volume_sma[i] = v20 / 20.0
+            volume_ratio[i] = volume[i] / (v20 / 20.0)
+        if i >= 49:
+            sma_50[i] = s50 / 50.0
+        if i >= 199:
+            sma_200[i] = s200 / 200.0
+
+        # EMA 12/26/50 (adjust=False)
+        if i == 0:
+            e12 = e26 = e50 = c
+        else:
+            e12 = a12 * c + (1.0 - a12) * e12
+            e26 = a26 * c + (1.0 - a26) * e26
+            e50 = a50 * c + (1.0 - a50) * e50
+        if i >= 11:
+            ema_12[i] = e12
+        if i >= 25:
+            ema_26[i] = e26
+        if i >= 49:
+            ema_50[i] = e50
+
+        # MACD: sinyal, MACD'nin ilk geçerli değerinden başlayan EMA 9
+        if i >= 25:
+            m = e12 - e26
+            macd[i] = m
+            signal = m if i == 25 else a9 * m + (1.0 - a9) * signal
+            if i >= 33:
+                macd_signal[i] = signal
+                macd_hist[i] = m - signal
+
+        # WMA 20 (ağırlıklar 1..20)
+        if i >= 19:
+            w = 0.0
+            for k in range(20):
+                w += (k + 1) * close[i - 19 + k]
+            wma_20[i] = w / 210.0
+
+        # RSI (Wilder, alpha = 1/14)
+        if i > 0:
+            d = c - close[i - 1]
+            up = a_rsi * max(d, 0.0) + (1.0 - a_rsi) * up
+            down = a_rsi * max(-d, 0.0) + (1.0 - a_rsi) * down
+        if i >= 13:
+            rsi[i] = 100.0 if down == 0.0 else 100.0 - 100.0 / (1.0 + up / down)
+
+        # Bollinger Bands (20, 2, ddof=0) - Welford ekle/çıkar
+        if i < 20:
+            delta = c - bb_mean
+            bb_mean += delta / (i + 1)
+            bb_m2 += delta * (c - bb_mean)
+        else:
+            old = close[i - 20]
+            new_mean = bb_mean + (c - old) / 20.0
+            bb_m2 += (c - old) * (c - new_mean + old - bb_mean)
+            bb_mean = new_mean
+        if i >= 19:
+            std = math.sqrt(max(bb_m2 / 20.0, 0.0))
+            mid = s20 / 20.0
+            upper = mid + 2.0 * std
+            lower = mid - 2.0 * std
+            bb_middle[i] = mid
+            bb_upper[i] = upper
+            bb_lower[i] = lower
+            bb_width[i] = (upper - lower) / mid
+            bb_position[i] = (c - lower) / (upper - lower)
+
+        # Stochastic (14, 3) ve Williams %R (14)
+        if i >= 13:
+            hh = high[i]
+            ll = low[i]
+            for k in range(i - 13, i):
+                hh = max(hh, high[k])
+                ll = min(ll, low[k])
+            k = 100.0 * (c - ll) / (hh - ll)
+            stoch_k[i] = k
+            williams_r[i] = -100.0 * (hh - c) / (hh - ll)
+            if i >= 15:
+                stoch_d[i] = (k + k1 + k2) / 3.0
+            k2 = k1
+            k1 = k
+
+        # ATR (Wilder, 14); ilk gerçek aralık yalnızca high - low
+        tr = high[i] - low[i]
+        if i > 0:
+            prev = close[i - 1]
+            tr = max(tr, abs(high[i] - prev), abs(low[i] - prev))
+        if i < 14:
+            tr_sum += tr
+            if i == 13:
+                atr_value = tr_sum / 14.0
+                atr[i] = atr_value
+        else:
+            atr_value = (atr_value * 13.0 + tr) / 14.0
+            atr[i] = atr_value
+
+        # OBV: düşüşte -hacim, aksi halde +hacim
+        if i > 0 and c < close[i - 1]:
+            obv_sum -= volume[i]
+        else:
+            obv_sum += volume[i]
+        obv[i] = obv_sum
+
+
+@njit(cache=True, parallel=True)
+def compute_all_batch(high, low, close, volume, offsets, out):
+    """
+    Birden fazla sembolün göstergelerini semboller üzerinde paralel hesaplar
+
+    Semboller uç uca eklenmiş dizilerde tutulur; s. sembol
+    offsets[s]:offsets[s + 1] aralığındadır. Her sembol compute_all ile
+    bağımsız hesaplanır ve sonuçlarını out'un aynı sütun aralığına yazar.
+
+    Args:
+        high, low, close, volume (np.ndarray): Uç uca eklenmiş float64 diziler
+        offsets (np.ndarray): Sembol sınırları (int64, uzunluk sembol sayısı + 1)
+        out (np.ndarray): (len(INDICATOR_COLUMNS), toplam çubuk) çıktı dizisi
+    """
+    for s in prange(offsets.shape[0] - 1):
+        start = offsets[s]
+        end = offsets[s + 1]
+        compute_all(high[start:end], low[start:end], close[start:end], volume[start:end],
+                    out[:, start:end])
+
+
+def _warmup():
+    """
+    Kernel'leri gerçek çağrılarla aynı tiplerle (float64 diziler, int periyot)
+    32 elemanlı dizilerle çalıştırır; ilk istek LLVM derlemesini beklemez
+    """
+    x = np.linspace(1.0, 2.0, 32)
+    out = [np.empty(32) for _ in range(5)]
+    sma_incremental(x, 20, out[0])
+    ewma(x, 2.0 / 13, 12, out[0])
+    wilder_rsi(x, 14, out[0])
+    wilder_atr(x, x, x, 14, out[0])
+    rolling_max_min(x, x, 14, out[0], out[1])
+    bbands_fused(x, 20, 2.0, *out)
+    # Gösterge tamponu USE_FP32 ayarına göre float32 ya da float64 olabilir
+    for dtype in (np.float32, np.float64):
+        buf = np.empty((len(INDICATOR_COLUMNS), 32), dtype=dtype)
+        compute_all(x, x, x, x, buf)
+        compute_all_batch(x, x, x, x, np.array([0, 16, 32]), buf)
+
+
+if EAGER_JIT:
+    _warmup()
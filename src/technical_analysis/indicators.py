@@ -7,8 +7,189 @@ import pandas as pd
 import numpy as np
 import ta
 import logging
+import math
+from collections import deque
 from typing import Dict, List, Optional
 
+from src._njit import NUMBA_AVAILABLE
+from src.technical_analysis._nb_kernels import (
+    INDICATOR_COLUMNS, bbands_fused, compute_all, compute_all_batch, ewma, rolling_max_min,
+    sma_incremental, wilder_atr, wilder_rsi
+)
+
+# Gösterge çıktıları float32 saklanır (sınırlı/yumuşatılmış değerler için yeterli,
+# bellek trafiği yarıya iner); FP64 gerekiyorsa False yapılabilir.
+# Fiyat/hacim girdileri ve kernel içi hesaplar her durumda float64'tür.
+USE_FP32 = True
+
+
+# Gösterge fonksiyonları modül seviyesindedir ve durum tutmaz; her biri df'e
+# sütun ekleyip df'i döndürür. Hata yakalamazlar: eksik sütun gibi hatalar
+# yukarı iletilir ve tek noktada, TechnicalIndicators'ta ele alınır.
+
+def add_all_fused(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+    """
+    Tüm göstergeleri compute_all kernel'iyle tek geçişte ekler
+    
+    high/low/close/volume dizileri bir kez alınır; kernel tüm gösterge
+    dizilerini aynı döngüde doldurur ve sonuç tek DataFrame olarak eklenir.
+    Çıktılar add_* fonksiyonlarıyla (ta) aynıdır.
+    """
+    high, low, close, volume = (
+        df[col].to_numpy(dtype=np.float64) for col in ('high', 'low', 'close', 'volume')
+    )
+    buf = np.empty((len(INDICATOR_COLUMNS), len(df)), dtype=_output_dtype())
+    compute_all(high, low, close, volume, buf)
+    return _attach_indicators(df, buf, inplace=inplace)
+
+
+def _output_dtype():
+    """Gösterge tamponunun veri tipi (USE_FP32)"""
+    return np.float32 if USE_FP32 else np.float64
+
+
+def _attach_indicators(df: pd.DataFrame, buf: np.ndarray, inplace: bool = False) -> pd.DataFrame:
+    """
+    (len(INDICATOR_COLUMNS), N) gösterge tamponunu df'e tek blok olarak ekler
+    
+    pandas sütunları (sütun, satır) düzeninde tuttuğundan buf.T kopyasız
+    tek bir bloğa dönüşür; sütun sütun ekleme yapılmaz.
+    """
+    if inplace:
+        for name, values in zip(INDICATOR_COLUMNS, buf):
+            df[name] = values
+        return df
+    
+    indicators = pd.DataFrame(buf.T, columns=list(INDICATOR_COLUMNS), index=df.index, copy=False)
+    
+    df = df.drop(columns=df.columns.intersection(indicators.columns))
+    return pd.concat([df, indicators], axis=1)
+
+
+def add_moving_averages(df: pd.DataFrame) -> pd.DataFrame:
+    """Hareketli ortalamaları ekler"""
+    # SMA (Simple Moving Average)
+    close = df['close'].to_numpy(dtype=np.float64)
+    for window in (20, 50, 200):
+        sma = np.empty_like(close)
+        sma_incremental(close, window, sma)
+        df[f'sma_{window}'] = sma
+    
+    # EMA (Exponential Moving Average)
+    for window in (12, 26, 50):
+        ema = np.empty_like(close)
+        ewma(close, 2.0 / (window + 1), window, ema)
+        df[f'ema_{window}'] = ema
+    
+    # WMA (Weighted Moving Average)
+    df['wma_20'] = ta.trend.wma_indicator(df['close'], window=20)
+    
+    return df
+
+
+def add_rsi(df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
+    """RSI (Relative Strength Index) ekler"""
+    close = df['close'].to_numpy(dtype=np.float64)
+    rsi = np.empty_like(close)
+    wilder_rsi(close, period, rsi)
+    df['rsi'] = rsi
+    
+    return df
+
+
+def add_macd(df: pd.DataFrame) -> pd.DataFrame:
+    """MACD (Moving Average Convergence Divergence) ekler"""
+    close = df['close'].to_numpy(dtype=np.float64)
+    ema_12 = np.empty_like(close)
+    ema_26 = np.empty_like(close)
+    ewma(close, 2.0 / 13, 12, ema_12)
+    ewma(close, 2.0 / 27, 26, ema_26)
+    
+    # Sinyal hattı MACD'nin ilk geçerli değerinden başlayan EMA 9
+    macd = ema_12 - ema_26
+    macd_signal = np.empty_like(close)
+    ewma(macd, 2.0 / 10, 9, macd_signal)
+    
+    df[['macd', 'macd_signal', 'macd_hist']] = np.column_stack(
+        (macd, macd_signal, macd - macd_signal)
+    )
+    
+    return df
+
+
+def add_bollinger_bands(df: pd.DataFrame, period: int = 20, std_dev: float = 2) -> pd.DataFrame:
+    """Bollinger Bands ekler"""
+    close = df['close'].to_numpy(dtype=np.float64)
+    # Bantlar, genişlik ve pozisyon tek geçişte
+    upper, middle, lower, width, position = np.empty((5, len(close)))
+    bbands_fused(close, period, float(std_dev), upper, middle, lower, width, position)
+    
+    df['bb_upper'] = upper
+    df['bb_middle'] = middle
+    df['bb_lower'] = lower
+    df['bb_width'] = width
+    df['bb_position'] = position
+    
+    return df
+
+
+def add_stochastic_williams(df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
+    """Stochastic Oscillator ve Williams %R ekler (ortak kayan en yüksek/en düşük)"""
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    close = df['close'].to_numpy(dtype=np.float64)
+    maxh = np.empty_like(close)
+    minl = np.empty_like(close)
+    rolling_max_min(high, low, period, maxh, minl)
+    
+    # Yatay piyasada aralık 0 olur; pandas gibi uyarısız NaN/inf üretilir
+    price_range = maxh - minl
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stoch_k = 100 * (close - minl) / price_range
+        williams_r = -100 * (maxh - close) / price_range
+    
+    # %D: %K'nın 3 çubukluk ortalaması (NaN/inf yalnızca kendi penceresini etkiler)
+    stoch_d = np.full_like(stoch_k, np.nan)
+    stoch_d[2:] = (stoch_k[2:] + stoch_k[1:-1] + stoch_k[:-2]) / 3
+    
+    df['stoch_k'] = stoch_k
+    df['stoch_d'] = stoch_d
+    df['williams_r'] = williams_r
+    
+    return df
+
+
+def add_atr(df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
+    """ATR (Average True Range) ekler"""
+    close = df['close'].to_numpy(dtype=np.float64)
+    atr = np.empty_like(close)
+    wilder_atr(df['high'].to_numpy(dtype=np.float64), df['low'].to_numpy(dtype=np.float64),
+               close, period, atr)
+    df['atr'] = atr
+    return df
+
+
+def add_volume_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """Hacim göstergelerini ekler"""
+    close = df['close'].to_numpy(dtype=np.float64)
+    volume = df['volume'].to_numpy(dtype=np.float64)
+    
+    # OBV (On Balance Volume): düşüşte -hacim, aksi halde (ilk çubuk dahil) +hacim
+    falling = np.zeros(len(close), dtype=bool)
+    falling[1:] = close[1:] < close[:-1]
+    df['obv'] = np.cumsum(np.where(falling, -volume, volume))
+    
+    # Volume SMA
+    volume_sma = np.empty_like(volume)
+    sma_incremental(volume, 20, volume_sma)
+    df['volume_sma'] = volume_sma
+    
+    # Volume Ratio
+    df['volume_ratio'] = volume / volume_sma
+    
+    return df
+
+
 class TechnicalIndicators:
     """
     Teknik analiz göstergelerini hesaplayan sınıf
@@ -18,29 +199,44 @@ class TechnicalIndicators:
         """TechnicalIndicators sınıfını başlatır"""
         self.logger = logging.getLogger(__name__)
         
-    def calculate_all_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        # get_support_resistance için son girdinin parmak izi ve sonucu
+        self._sr_key = None
+        self._sr_result: Dict = {}
+        
+    def calculate_all_indicators(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         """
         Tüm teknik göstergeleri hesaplar
         
+        Göstergeler yeni ayrılan dizilere yazılır ve yalnızca sütun olarak
+        eklenir; OHLCV verisi hiç değiştirilmediğinden derin kopya gerekmez.
+        
         Args:
             df (pd.DataFrame): OHLCV verileri içeren DataFrame
+            inplace (bool): Gösterge sütunları doğrudan df'e eklensin mi
             
         Returns:
             pd.DataFrame: Teknik göstergeler eklenmiş DataFrame
         """
         try:
-            # Veri kopyası oluştur
-            result_df = df.copy()
+            # Sığ kopya: OHLCV dizileri paylaşılır, yeni sütunlar yalnızca kopyaya eklenir
+            result_df = df if inplace else df.copy(deep=False)
             
-            # Temel göstergeler
-            result_df = self._add_moving_averages(result_df)
-            result_df = self._add_rsi(result_df)
-            result_df = self._add_macd(result_df)
-            result_df = self._add_bollinger_bands(result_df)
-            result_df = self._add_stochastic(result_df)
-            result_df = self._add_williams_r(result_df)
-            result_df = self._add_atr(result_df)
-            result_df = self._add_volume_indicators(result_df)
+            if NUMBA_AVAILABLE:
+                # Tüm göstergeler tek derlenmiş geçişte
+                result_df = add_all_fused(result_df, inplace=inplace)
+            else:
+                # Temel göstergeler
+                result_df = add_moving_averages(result_df)
+                result_df = add_rsi(result_df)
+                result_df = add_macd(result_df)
+                result_df = add_bollinger_bands(result_df)
+                result_df = add_stochastic_williams(result_df)
+                result_df = add_atr(result_df)
+                result_df = add_volume_indicators(result_df)
+                if USE_FP32:
+                    result_df = result_df.astype(
+                        {col: np.float32 for col in INDICATOR_COLUMNS if col in result_df.columns}
+                    )
             
             # NaN değerleri temizle
             result_df = result_df.dropna()
@@ -52,119 +248,49 @@ class TechnicalIndicators:
             self.logger.error(f"Gösterge hesaplama hatası: {e}")
             return df
     
-    def _add_moving_averages(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Hareketli ortalamaları ekler"""
-        try:
-            # SMA (Simple Moving Average)
-            df['sma_20'] = ta.trend.sma_indicator(df['close'], window=20)
-            df['sma_50'] = ta.trend.sma_indicator(df['close'], window=50)
-            df['sma_200'] = ta.trend.sma_indicator(df['close'], window=200)
-            
-            # EMA (Exponential Moving Average)
-            df['ema_12'] = ta.trend.ema_indicator(df['close'], window=12)
-            df['ema_26'] = ta.trend.ema_indicator(df['close'], window=26)
-            df['ema_50'] = ta.trend.ema_indicator(df['close'], window=50)
-            
-            # WMA (Weighted Moving Average)
-            df['wma_20'] = ta.trend.wma_indicator(df['close'], window=20)
-            
-            return df
-        except Exception as e:
-            self.logger.error(f"Hareketli ortalama hesaplama hatası: {e}")
-            return df
-    
-    def _add_rsi(self, df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
-        """RSI (Relative Strength Index) ekler"""
-        try:
-            df['rsi'] = ta.momentum.rsi(df['close'], window=period)
-            
-            # RSI seviyeleri
-            df['rsi_overbought'] = 70
-            df['rsi_oversold'] = 30
-            
-            return df
-        except Exception as e:
-            self.logger.error(f"RSI hesaplama hatası: {e}")
-            return df
-    
-    def _add_macd(self, df: pd.DataFrame) -> pd.DataFrame:
-        """MACD (Moving Average Convergence Divergence) ekler"""
-        try:
-            macd = ta.trend.MACD(df['close'], window_fast=12, window_slow=26, window_sign=9)
-            df['macd'] = macd.macd()
-            df['macd_signal'] = macd.macd_signal()
-            df['macd_hist'] = macd.macd_diff()
-            
-            return df
-        except Exception as e:
-            self.logger.error(f"MACD hesaplama hatası: {e}")
-            return df
-    
-    def _add_bollinger_bands(self, df: pd.DataFrame, period: int = 20, std_dev: float = 2) -> pd.DataFrame:
-        """Bollinger Bands ekler"""
-        try:
-            bb = ta.volatility.BollingerBands(df['close'], window=period, window_dev=std_dev)
-            df['bb_upper'] = bb.bollinger_hband()
-            df['bb_middle'] = bb.bollinger_mavg()
-            df['bb_lower'] = bb.bollinger_lband()
-            
-            # Bollinger Band genişliği
-            df['bb_width'] = (df['bb_upper'] - df['bb_lower']) / df['bb_middle']
-            
-            # Bollinger Band pozisyonu
-            df['bb_position'] = (df['close'] - df['bb_lower']) / (df['bb_upper'] - df['bb_lower'])
+    def calculate_all_indicators_batch(self, dfs: List[pd.DataFrame],
+                                       parallel: Optional[bool] = None) -> List[pd.DataFrame]:
+        """
+        Birden fazla sembolün teknik göstergelerini toplu hesaplar
+        
+        Semboller birbirinden bağımsızdır; paralel modda tüm veriler uç uca
+        eklenip compute_all_batch ile semboller üzerinde prange ile işlenir.
+        İş parçacığı başlatma maliyeti az sayıda sembolde kazancı aştığından
+        paralel mod varsayılan olarak yalnızca 4 ve üzeri sembolde açılır.
+        
+        Args:
+            dfs (List[pd.DataFrame]): OHLCV verileri içeren DataFrame'ler
+            parallel (Optional[bool]): Paralel hesaplama; None ise sembol sayısına göre seçilir
             
-            return df
-        except Exception as e:
-            self.logger.error(f"Bollinger Bands hesaplama hatası: {e}")
-            return df
-    
-    def _add_stochastic(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Stochastic Oscillator ekler"""
+        Returns:
+            List[pd.DataFrame]: Aynı sırada, teknik göstergeler eklenmiş DataFrame'ler
+        """
         try:
-            stoch = ta.momentum.StochasticOscillator(df['high'], df['low'], df['close'])
-            df['stoch_k'] = stoch.stoch()
-            df['stoch_d'] = stoch.stoch_signal()
+            if parallel is None:
+                parallel = len(dfs) >= 4
+            if not (parallel and NUMBA_AVAILABLE and dfs):
+                return [self.calculate_all_indicators(df) for df in dfs]
             
-            return df
-        except Exception as e:
-            self.logger.error(f"Stochastic hesaplama hatası: {e}")
-            return df
-    
-    def _add_williams_r(self, df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
-        """Williams %R ekler"""
-        try:
-            df['williams_r'] = ta.momentum.williams_r(df['high'], df['low'], df['close'], lbp=period)
-            return df
-        except Exception as e:
-            self.logger.error(f"Williams %R hesaplama hatası: {e}")
-            return df
-    
-    def _add_atr(self, df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
-        """ATR (Average True Range) ekler"""
-        try:
-            df['atr'] = ta.volatility.average_true_range(df['high'], df['low'], df['close'], window=period)
-            return df
-        except Exception as e:
-            self.logger.error(f"ATR hesaplama hatası: {e}")
-            return df
-    
-    def _add_volume_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Hacim göstergelerini ekler"""
-        try:
-            # OBV (On Balance Volume)
-            df['obv'] = ta.volume.on_balance_volume(df['close'], df['volume'])
+            offsets = np.zeros(len(dfs) + 1, dtype=np.int64)
+            np.cumsum([len(df) for df in dfs], out=offsets[1:])
+            high, low, close, volume = (
+                np.concatenate([df[col].to_numpy(dtype=np.float64) for df in dfs])
+                for col in ('high', 'low', 'close', 'volume')
+            )
+            out = np.empty((len(INDICATOR_COLUMNS), offsets[-1]), dtype=_output_dtype())
+            compute_all_batch(high, low, close, volume, offsets, out)
             
-            # Volume SMA
-            df['volume_sma'] = ta.trend.sma_indicator(df['volume'], window=20)
+            results = [
+                _attach_indicators(df, out[:, start:end]).dropna()
+                for df, start, end in zip(dfs, offsets[:-1], offsets[1:])
+            ]
             
-            # Volume Ratio
-            df['volume_ratio'] = df['volume'] / df['volume_sma']
+            self.logger.info(f"{len(dfs)} sembol için teknik göstergeler paralel hesaplandı")
+            return results
             
-            return df
         except Exception as e:
-            self.logger.error(f"Hacim göstergesi hesaplama hatası: {e}")
-            return df
+            self.logger.error(f"Toplu gösterge hesaplama hatası: {e}")
+            return list(dfs)
     
     def get_indicator_summary(self, df: pd.DataFrame) -> Dict:
         """
@@ -177,12 +303,17 @@ class TechnicalIndicators:
             Dict: Gösterge özetleri
         """
         try:
-            latest = df.iloc[-1]
+            # Satır Series'i oluşturmadan son değerlere doğrudan erişim
+            latest = {col: df[col].iat[-1] for col in (
+                'close', 'rsi', 'macd', 'macd_signal', 'bb_position', 'bb_upper', 'bb_lower',
+                'ema_12', 'ema_26', 'sma_50', 'sma_200'
+            )}
+            close_24h = df['close'].iat[-25] if len(df) > 24 else None
             
             summary = {
                 'price': {
                     'current': latest['close'],
-                    'change_24h': (latest['close'] - df.iloc[-24]['close']) / df.iloc[-24]['close'] * 100 if len(df) > 24 else 0
+                    'change_24h': (latest['close'] - close_24h) / close_24h * 100 if close_24h is not None else 0
                 },
                 'rsi': {
                     'value': latest['rsi'],
@@ -223,17 +354,24 @@ class TechnicalIndicators:
             Dict: Destek ve direnç seviyeleri
         """
         try:
-            recent_data = df.tail(window)
+            high = df['high'].to_numpy()[-window:]
+            low = df['low'].to_numpy()[-window:]
+            current_price = df['close'].iat[-1]
             
-            # Direnç seviyeleri (yüksek noktalar)
-            resistance_levels = recent_data['high'].nlargest(3).tolist()
+            # Aynı çerçeve (ör. özet ve grafik için) tekrar sorulursa yeniden hesaplama
+            key = (df.index[-1], len(df), window, current_price, high[-1], low[-1])
+            if key == self._sr_key:
+                return self._sr_result
             
-            # Destek seviyeleri (düşük noktalar)
-            support_levels = recent_data['low'].nsmallest(3).tolist()
+            # Direnç seviyeleri (en yüksek 3 nokta, sıralamadan)
+            high = high[~np.isnan(high)]
+            resistance_levels = (np.partition(high, -3)[-3:] if len(high) > 3 else high).tolist()
             
-            current_price = df['close'].iloc[-1]
+            # Destek seviyeleri (en düşük 3 nokta, sıralamadan)
+            low = low[~np.isnan(low)]
+            support_levels = (np.partition(low, 2)[:3] if len(low) > 3 else low).tolist()
             
-            return {
+            result = {
                 'current_price': current_price,
                 'resistance_levels': sorted(resistance_levels, reverse=True),
                 'support_levels': sorted(support_levels),
@@ -241,10 +379,209 @@ class TechnicalIndicators:
                 'nearest_support': max([s for s in support_levels if s < current_price], default=None)
             }
             
+            self._sr_key, self._sr_result = key, result
+            return result
+            
         except Exception as e:
             self.logger.error(f"Destek/Direnç hesaplama hatası: {e}")
             return {}
 
+def _safe_div(num: float, den: float) -> float:
+    """Sıfıra bölmede istisna yerine kernel'lerdeki gibi inf/NaN döndürür"""
+    if den == 0.0:
+        if num == 0.0 or math.isnan(num):
+            return math.nan
+        return math.copysign(math.inf, num) * math.copysign(1.0, den)
+    return num / den
+
+
+class IncrementalIndicators:
+    """
+    Canlı akışta göstergeleri her yeni çubuk için sabit sürede güncelleyen sınıf
+    
+    compute_all ile aynı tanımları izler (aynı çubuk dizisi verildiğinde aynı
+    değerler): SMA'lar deque(maxlen=period) pencereleri ve kayan toplamlarla,
+    EMA/MACD/RSI/ATR önceki değerlerle, Bollinger varyansı Welford ile
+    güncellenir. Sonuçlar capacity satırlık halka tampona da yazılır.
+    """
+    
+    def __init__(self, capacity: int = 1000):
+        """
+        IncrementalIndicators sınıfını başlatır
+        
+        Args:
+            capacity (int): Halka tamponda tutulacak son çubuk sayısı
+        """
+        self.logger = logging.getLogger(__name__)
+        self.capacity = capacity
+        self._history = np.empty((capacity, len(INDICATOR_COLUMNS)), dtype=_output_dtype())
+        self.reset()
+    
+    def reset(self):
+        """Akış durumunu sıfırlar"""
+        self.count = 0
+        
+        # Kayan pencereler ve toplamları
+        self._close_20 = deque(maxlen=20)
+        self._close_50 = deque(maxlen=50)
+        self._close_200 = deque(maxlen=200)
+        self._volume_20 = deque(maxlen=20)
+        self._high_14 = deque(maxlen=14)
+        self._low_14 = deque(maxlen=14)
+        self._sum_20 = self._sum_50 = self._sum_200 = self._volume_sum = 0.0
+        
+        # Özyinelemeli durumlar
+        self._bb_mean = self._bb_m2 = 0.0
+        self._ema_12 = self._ema_26 = self._ema_50 = self._macd_signal = 0.0
+        self._up = self._down = 0.0
+        self._stoch_k1 = self._stoch_k2 = math.nan
+        self._tr_sum = self._atr = 0.0
+        self._obv = 0.0
+        self._prev_close = math.nan
+    
+    def update(self, o: float, h: float, l: float, c: float, v: float) -> Dict[str, float]:
+        """
+        Yeni çubukla tüm göstergeleri bir adım ilerletir
+        
+        Args:
+            o (float): Açılış fiyatı (göstergelerde kullanılmaz)
+            h (float): En yüksek fiyat
+            l (float): En düşük fiyat
+            c (float): Kapanış fiyatı
+            v (float): Hacim
+            
+        Returns:
+            Dict[str, float]: INDICATOR_COLUMNS sırasında son gösterge değerleri
+        """
+        i = self.count
+        nan = math.nan
+        prev = self._prev_close
+        
+        # Pencereden çıkan değerler (deque dolmadan yok)
+        old_20 = self._close_20[0] if i >= 20 else 0.0
+        old_50 = self._close_50[0] if i >= 50 else 0.0
+        old_200 = self._close_200[0] if i >= 200 else 0.0
+        old_volume = self._volume_20[0] if i >= 20 else 0.0
+        self._close_20.append(c)
+        self._close_50.append(c)
+        self._close_200.append(c)
+        self._volume_20.append(v)
+        self._high_14.append(h)
+        self._low_14.append(l)
+        
+        # SMA 20/50/200 ve hacim SMA 20
+        self._sum_20 = self._sum_20 + c - old_20
+        self._sum_50 = self._sum_50 + c - old_50
+        self._sum_200 = self._sum_200 + c - old_200
+        self._volume_sum = self._volume_sum + v - old_volume
+        sma_20 = self._sum_20 / 20.0 if i >= 19 else nan
+        sma_50 = self._sum_50 / 50.0 if i >= 49 else nan
+        sma_200 = self._sum_200 / 200.0 if i >= 199 else nan
+        volume_sma = self._volume_sum / 20.0 if i >= 19 else nan
+        volume_ratio = _safe_div(v, volume_sma) if i >= 19 else nan
+        
+        # EMA 12/26/50 ve MACD
+        if i == 0:
+            self._ema_12 = self._ema_26 = self._ema_50 = c
+        else:
+            self._ema_12 = 2.0 / 13.0 * c + (1.0 - 2.0 / 13.0) * self._ema_12
+            self._ema_26 = 2.0 / 27.0 * c + (1.0 - 2.0 / 27.0) * self._ema_26
+            self._ema_50 = 2.0 / 51.0 * c + (1.0 - 2.0 / 51.0) * self._ema_50
+        ema_12 = self._ema_12 if i >= 11 else nan
+        ema_26 = self._ema_26 if i >= 25 else nan
+        ema_50 = self._ema_50 if i >= 49 else nan
+        
+        macd = macd_signal = macd_hist = nan
+        if i >= 25:
+            macd = self._ema_12 - self._ema_26
+            self._macd_signal = macd if i == 25 else 0.2 * macd + (1.0 - 0.2) * self._macd_signal
+            if i >= 33:
+                macd_signal = self._macd_signal
+                macd_hist = macd - macd_signal
+        
+        # WMA 20 (ağırlıklar 1..20)
+        wma_20 = nan
+        if i >= 19:
+            wma_20 = sum(w * x for w, x in zip(range(1, 21), self._close_20)) / 210.0
+        
+        # RSI (Wilder, alpha = 1/14)
+        if i > 0:
+            d = c - prev
+            self._up = 1.0 / 14.0 * max(d, 0.0) + (1.0 - 1.0 / 14.0) * self._up
+            self._down = 1.0 / 14.0 * max(-d, 0.0) + (1.0 - 1.0 / 14.0) * self._down
+        rsi = nan
+        if i >= 13:
+            rsi = 100.0 if self._down == 0.0 else 100.0 - 100.0 / (1.0 + self._up / self._down)
+        
+        # Bollinger Bands (20, 2) - Welford ekle/çıkar
+        if i < 20:
+            delta = c - self._bb_mean
+            self._bb_mean += delta / (i + 1)
+            self._bb_m2 += delta * (c - self._bb_mean)
+        else:
+            new_mean = self._bb_mean + (c - old_20) / 20.0
+            self._bb_m2 += (c - old_20) * (c - new_mean + old_20 - self._bb_mean)
+            self._bb_mean = new_mean
+        bb_upper = bb_middle = bb_lower = bb_width = bb_position = nan
+        if i >= 19:
+            std = math.sqrt(max(self._bb_m2 / 20.0, 0.0))
+            bb_middle = sma_20
+            bb_upper = bb_middle + 2.0 * std
+            bb_lower = bb_middle - 2.0 * std
+            bb_width = _safe_div(bb_upper - bb_lower, bb_middle)
+            bb_position = _safe_div(c - bb_lower, bb_upper - bb_lower)
+        
+        # Stochastic (14, 3) ve Williams %R (14)
+        stoch_k = stoch_d = williams_r = nan
+        if i >= 13:
+            hh = max(self._high_14)
+            ll = min(self._low_14)
+            stoch_k = _safe_div(100.0 * (c - ll), hh - ll)
+            williams_r = _safe_div(-100.0 * (hh - c), hh - ll)
+            if i >= 15:
+                stoch_d = (stoch_k + self._stoch_k1 + self._stoch_k2) / 3.0
+            self._stoch_k2 = self._stoch_k1
+            self._stoch_k1 = stoch_k
+        
+        # ATR (Wilder, 14); ilk gerçek aralık yalnızca high - low
+        tr = h - l
+        if i > 0:
+            tr = max(tr, abs(h - prev), abs(l - prev))
+        if i < 14:
+            self._tr_sum += tr
+            if i == 13:
+                self._atr = self._tr_sum / 14.0
+        else:
+            self._atr = (self._atr * 13.0 + tr) / 14.0
+        atr = self._atr
+        
+        # OBV: düşüşte -hacim, aksi halde +hacim
+        self._obv += -v if i > 0 and c < prev else v
+        
+        values = (sma_20, sma_50, sma_200, ema_12, ema_26, ema_50, wma_20,
+                  rsi, macd, macd_signal, macd_hist,
+                  bb_upper, bb_middle, bb_lower, bb_width, bb_position,
+                  stoch_k, stoch_d, williams_r, atr, self._obv, volume_sma, volume_ratio)
+        self._history[i % self.capacity] = values
+        self._prev_close = c
+        self.count += 1
+        return dict(zip(INDICATOR_COLUMNS, values))
+    
+    def history(self) -> pd.DataFrame:
+        """
+        Halka tampondaki son göstergeleri eskiden yeniye döndürür
+        
+        Returns:
+            pd.DataFrame: En fazla capacity satırlık gösterge tablosu
+        """
+        if self.count <= self.capacity:
+            rows = self._history[:self.count]
+        else:
+            position = self.count % self.capacity
+            rows = np.concatenate((self._history[position:], self._history[:position]))
+        return pd.DataFrame(rows, columns=list(INDICATOR_COLUMNS))
+
+
 # Test fonksiyonu
 if __name__ == "__main__":
     # Test için örnek veri oluştur
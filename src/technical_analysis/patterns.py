@@ -6,6 +6,7 @@ Bu modül fiyat formasyonlarını ve pattern'leri tanır
 import pandas as pd
 import numpy as np
 import logging
+from scipy.signal import argrelextrema
 from typing import Dict, List, Optional
 
 class PatternRecognition:
@@ -46,15 +47,15 @@ class PatternRecognition:
     def _detect_double_top(self, df: pd.DataFrame) -> Dict:
         """Çift tepe pattern'ini tespit eder"""
         try:
-            # Basit çift tepe tespiti
-            highs = df['high'].rolling(window=5, center=True).max()
-            peaks = df[df['high'] == highs]
+            # Basit çift tepe tespiti: 5 çubukluk penceredeki yerel tepeler
+            peaks = argrelextrema(df['high'].to_numpy(), np.greater, order=2)[0]
             
             if len(peaks) >= 2:
                 return {
                     'detected': True,
                     'confidence': 0.7,
-                    'description': 'Çift tepe pattern tespit edildi'
+                    'description': 'Çift tepe pattern tespit edildi',
+                    'indices': peaks.tolist()
                 }
             
             return {'detected': False, 'confidence': 0.0}
@@ -66,15 +67,15 @@ class PatternRecognition:
     def _detect_double_bottom(self, df: pd.DataFrame) -> Dict:
         """Çift dip pattern'ini tespit eder"""
         try:
-            # Basit çift dip tespiti
-            lows = df['low'].rolling(window=5, center=True).min()
-            troughs = df[df['low'] == lows]
+            # Basit çift dip tespiti: 5 çubukluk penceredeki yerel dipler
+            troughs = argrelextrema(df['low'].to_numpy(), np.less, order=2)[0]
             
             if len(troughs) >= 2:
                 return {
                     'detected': True,
                     'confidence': 0.7,
-                    'description': 'Çift dip pattern tespit edildi'
+                    'description': 'Çift dip pattern tespit edildi',
+                    'indices': troughs.tolist()
                 }
             
             return {'detected': False, 'confidence': 0.0}
@@ -13,6 +13,9 @@ class SignalGenerator:
     Teknik analiz sinyallerini üreten sınıf
     """
     
+    # Sinyal kodları ('signal_code' ve vektörel sinyaller)
+    BUY, HOLD, SELL = 1, 0, -1
+    
     def __init__(self):
         """SignalGenerator sınıfını başlatır"""
         self.logger = logging.getLogger(__name__)
@@ -51,15 +54,54 @@ class SignalGenerator:
             self.logger.error(f"Sinyal üretim hatası: {e}")
             return {}
     
+    def generate_signals_vectorized(self, df: pd.DataFrame, latest_only: bool = False) -> Dict:
+        """
+        Tüm satırlar için sinyal kodlarını tek seferde üretir (backtest için)
+        
+        Kurallar generate_signals ile aynıdır; her gösterge sütunu dallanmasız
+        boolean aritmetiğiyle BUY (1) / HOLD (0) / SELL (-1) kodlarına çevrilir
+        ve kodların toplamı fikir birliği skorunu verir.
+        
+        Args:
+            df (pd.DataFrame): Teknik göstergeler eklenmiş DataFrame
+            latest_only (bool): Yalnızca son satırın kodları döndürülsün mü
+            
+        Returns:
+            Dict: Gösterge bazında kod dizileri ve 'score' (latest_only ise tamsayılar)
+        """
+        try:
+            col = lambda name: df[name].to_numpy()
+            close = col('close')
+            
+            codes = {
+                # RSI: 30 altı alım, 70 üstü satım
+                'rsi': (col('rsi') < 30).astype(np.int8) - (col('rsi') > 70),
+                # MACD: sinyal çizgisinin üstü alım, aksi satım
+                'macd': 2 * (col('macd') > col('macd_signal')).astype(np.int8) - 1,
+                # Bollinger: alt bant altı alım, üst bant üstü satım
+                'bollinger': (close < col('bb_lower')).astype(np.int8) - (close > col('bb_upper')),
+                # EMA 12 / EMA 26 kesişimi
+                'moving_averages': 2 * (col('ema_12') > col('ema_26')).astype(np.int8) - 1,
+            }
+            codes['score'] = np.add.reduce(list(codes.values()), axis=0, dtype=np.int8)
+            
+            if latest_only:
+                return {name: int(values[-1]) for name, values in codes.items()}
+            return codes
+            
+        except Exception as e:
+            self.logger.error(f"Vektörel sinyal üretim hatası: {e}")
+            return {}
+    
     def _generate_rsi_signals(self, df: pd.DataFrame) -> Dict:
         """RSI sinyallerini üretir"""
         try:
-            latest = df.iloc[-1]
-            rsi = latest['rsi']
+            rsi = df['rsi'].iat[-1]
             
             if rsi < 30:
                 return {
                     'signal': 'BUY',
+                    'signal_code': self.BUY,
                     'strength': 'STRONG',
                     'confidence': 0.8,
                     'reason': 'RSI aşırı satım bölgesinde (30 altı)'
@@ -67,6 +109,7 @@ class SignalGenerator:
             elif rsi > 70:
                 return {
                     'signal': 'SELL',
+                    'signal_code': self.SELL,
                     'strength': 'STRONG',
                     'confidence': 0.8,
                     'reason': 'RSI aşırı alım bölgesinde (70 üstü)'
@@ -74,6 +117,7 @@ class SignalGenerator:
             else:
                 return {
                     'signal': 'HOLD',
+                    'signal_code': self.HOLD,
                     'strength': 'WEAK',
                     'confidence': 0.3,
                     'reason': 'RSI nötr bölgede'
@@ -81,18 +125,18 @@ class SignalGenerator:
                 
         except Exception as e:
             self.logger.error(f"RSI sinyal hatası: {e}")
-            return {'signal': 'HOLD', 'strength': 'WEAK', 'confidence': 0.0}
+            return {'signal': 'HOLD', 'signal_code': self.HOLD, 'strength': 'WEAK', 'confidence': 0.0}
     
     def _generate_macd_signals(self, df: pd.DataFrame) -> Dict:
         """MACD sinyallerini üretir"""
         try:
-            latest = df.iloc[-1]
-            macd = latest['macd']
-            macd_signal = latest['macd_signal']
+            macd = df['macd'].iat[-1]
+            macd_signal = df['macd_signal'].iat[-1]
             
             if macd > macd_signal:
                 return {
                     'signal': 'BUY',
+                    'signal_code': self.BUY,
                     'strength': 'MEDIUM',
                     'confidence': 0.6,
                     'reason': 'MACD sinyal çizgisinin üstünde'
@@ -100,6 +144,7 @@ class SignalGenerator:
             else:
                 return {
                     'signal': 'SELL',
+                    'signal_code': self.SELL,
                     'strength': 'MEDIUM',
                     'confidence': 0.6,
                     'reason': 'MACD sinyal çizgisinin altında'
@@ -107,19 +152,19 @@ class SignalGenerator:
                 
         except Exception as e:
             self.logger.error(f"MACD sinyal hatası: {e}")
-            return {'signal': 'HOLD', 'strength': 'WEAK', 'confidence': 0.0}
+            return {'signal': 'HOLD', 'signal_code': self.HOLD, 'strength': 'WEAK', 'confidence': 0.0}
     
     def _generate_bollinger_signals(self, df: pd.DataFrame) -> Dict:
         """Bollinger Bands sinyallerini üretir"""
         try:
-            latest = df.iloc[-1]
-            close = latest['close']
-            bb_upper = latest['bb_upper']
-            bb_lower = latest['bb_lower']
+            close = df['close'].iat[-1]
+            bb_upper = df['bb_upper'].iat[-1]
+            bb_lower = df['bb_lower'].iat[-1]
             
             if close < bb_lower:
                 return {
                     'signal': 'BUY',
+                    'signal_code': self.BUY,
                     'strength': 'MEDIUM',
                     'confidence': 0.7,
                     'reason': 'Fiyat Bollinger alt bandının altında'
@@ -127,6 +172,7 @@ class SignalGenerator:
             elif close > bb_upper:
                 return {
                     'signal': 'SELL',
+                    'signal_code': self.SELL,
                     'strength': 'MEDIUM',
                     'confidence': 0.7,
                     'reason': 'Fiyat Bollinger üst bandının üstünde'
@@ -134,6 +180,7 @@ class SignalGenerator:
             else:
                 return {
                     'signal': 'HOLD',
+                    'signal_code': self.HOLD,
                     'strength': 'WEAK',
                     'confidence': 0.4,
                     'reason': 'Fiyat Bollinger bantları arasında'
@@ -141,21 +188,19 @@ class SignalGenerator:
                 
         except Exception as e:
             self.logger.error(f"Bollinger sinyal hatası: {e}")
-            return {'signal': 'HOLD', 'strength': 'WEAK', 'confidence': 0.0}
+            return {'signal': 'HOLD', 'signal_code': self.HOLD, 'strength': 'WEAK', 'confidence': 0.0}
     
     def _generate_ma_signals(self, df: pd.DataFrame) -> Dict:
         """Hareketli ortalama sinyallerini üretir"""
         try:
-            latest = df.iloc[-1]
-            close = latest['close']
-            ema_12 = latest['ema_12']
-            ema_26 = latest['ema_26']
-            sma_50 = latest['sma_50']
+            ema_12 = df['ema_12'].iat[-1]
+            ema_26 = df['ema_26'].iat[-1]
             
             # EMA crossover
             if ema_12 > ema_26:
                 return {
                     'signal': 'BUY',
+                    'signal_code': self.BUY,
                     'strength': 'MEDIUM',
                     'confidence': 0.6,
                     'reason': 'EMA 12, EMA 26\'nın üstünde'
@@ -163,6 +208,7 @@ class SignalGenerator:
             else:
                 return {
                     'signal': 'SELL',
+                    'signal_code': self.SELL,
                     'strength': 'MEDIUM',
                     'confidence': 0.6,
                     'reason': 'EMA 12, EMA 26\'nın altında'
@@ -170,13 +216,17 @@ class SignalGenerator:
                 
         except Exception as e:
             self.logger.error(f"MA sinyal hatası: {e}")
-            return {'signal': 'HOLD', 'strength': 'WEAK', 'confidence': 0.0}
+            return {'signal': 'HOLD', 'signal_code': self.HOLD, 'strength': 'WEAK', 'confidence': 0.0}
     
     def _create_signal_summary(self, signals: Dict) -> Dict:
         """Sinyal özeti oluşturur"""
         try:
-            buy_count = sum(1 for s in signals.values() if isinstance(s, dict) and s.get('signal') == 'BUY')
-            sell_count = sum(1 for s in signals.values() if isinstance(s, dict) and s.get('signal') == 'SELL')
+            # Tamsayı kodlarla sayım ('signal' metni geriye dönük uyumluluk için korunur)
+            codes = np.fromiter(
+                (s['signal_code'] for s in signals.values() if isinstance(s, dict)), dtype=np.int8
+            )
+            buy_count = int((codes == self.BUY).sum())
+            sell_count = int((codes == self.SELL).sum())
             
             if buy_count > sell_count:
                 overall_signal = 'BUY'
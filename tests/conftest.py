@@ -0,0 +1,9 @@
+"""
+Testler için ortak ayarlar
+Depo kökünü import yoluna ekler (src paketi kurulu değildir)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,53 @@
+"""
+float32 veri yolunun float64 referansına göre hassasiyet testleri
+
+get_historical_data fiyatları float64, hacmi float32 okur; göstergeler
+USE_FP32 ile float32 saklanır. Hata, sütunun en büyük mutlak değerine göre
+ölçülür: MACD ve Williams %R gibi sıfırdan geçen sütunlarda eleman bazlı
+göreli hata anlamsızdır.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.technical_analysis import indicators
+from src.technical_analysis.indicators import INDICATOR_COLUMNS, TechnicalIndicators
+
+TOLERANCE = 1e-5
+
+
+def _ohlcv(price: float, volatility: float, n: int = 1500, seed: int = 1) -> pd.DataFrame:
+    """Verilen fiyat seviyesi ve saatlik volatilitede sentetik OHLCV üretir"""
+    rng = np.random.default_rng(seed)
+    close = price * np.cumprod(1 + rng.standard_normal(n) * volatility)
+    open_ = close * (1 + rng.standard_normal(n) * volatility / 3)
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, volatility / 2, n))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, volatility / 2, n))
+    volume = rng.uniform(1, 10, n) ** 2 * 1e3
+    return pd.DataFrame(
+        {'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume},
+        index=pd.date_range('2024-01-01', periods=n, freq='h')
+    )
+
+
+def _indicators(df: pd.DataFrame, use_fp32: bool, monkeypatch) -> pd.DataFrame:
+    monkeypatch.setattr(indicators, 'USE_FP32', use_fp32)
+    return TechnicalIndicators().calculate_all_indicators(df)
+
+
+@pytest.mark.parametrize('price', [60000.0, 2500.0, 0.5, 2e-5])
+@pytest.mark.parametrize('volatility', [0.01, 0.002, 0.0005])
+def test_float32_pipeline_matches_float64_reference(price, volatility, monkeypatch):
+    df = _ohlcv(price, volatility)
+    reference = _indicators(df, False, monkeypatch)
+    
+    # Kline ayrıştırmasıyla aynı tipler: fiyatlar float64, hacim float32
+    result = _indicators(df.astype({'volume': np.float32}), True, monkeypatch)
+    
+    assert result.index.equals(reference.index)
+    for col in INDICATOR_COLUMNS:
+        assert result[col].dtype == np.float32
+        expected = reference[col].to_numpy()
+        error = np.max(np.abs(result[col].to_numpy(dtype=np.float64) - expected))
+        assert error <= TOLERANCE * np.max(np.abs(expected)), col
@@ -0,0 +1,132 @@
+"""
+Numba göstergelerinin ta kütüphanesiyle eşdeğerlik testleri
+
+Referans, kernellerden önceki ta tabanlı hesaplamanın aynısıdır. Birleşik
+compute_all yolu, Numba yokken kullanılan add_* zinciri, toplu hesaplama ve
+IncrementalIndicators aynı 1500 çubukluk veride karşılaştırılır. Hata,
+sütunun en büyük mutlak değerine göre ölçülür (MACD gibi sıfırdan geçen
+sütunlar için).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import ta
+
+from src.technical_analysis import indicators
+from src.technical_analysis.indicators import (
+    INDICATOR_COLUMNS, IncrementalIndicators, TechnicalIndicators
+)
+
+TOLERANCE = 1e-5
+BARS = 1500
+
+
+def _ohlcv(n: int = BARS, seed: int = 3, flat: bool = False) -> pd.DataFrame:
+    """Sentetik OHLCV üretir; flat ile sabit fiyatlı bir aralık eklenir"""
+    rng = np.random.default_rng(seed)
+    close = 30000 * np.cumprod(1 + rng.standard_normal(n) * 0.01)
+    open_ = close * (1 + rng.standard_normal(n) * 0.003)
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.005, n))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.005, n))
+    if flat:
+        open_[300:330] = high[300:330] = low[300:330] = close[300:330] = close[300]
+    volume = rng.uniform(1, 10, n) ** 2
+    return pd.DataFrame(
+        {'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume},
+        index=pd.date_range('2024-01-01', periods=n, freq='h')
+    )
+
+
+def _ta_reference(df: pd.DataFrame) -> pd.DataFrame:
+    """Göstergeleri doğrudan ta ile hesaplar"""
+    close, high, low, volume = df['close'], df['high'], df['low'], df['volume']
+    ref = pd.DataFrame(index=df.index)
+    ref['sma_20'] = ta.trend.sma_indicator(close, window=20)
+    ref['sma_50'] = ta.trend.sma_indicator(close, window=50)
+    ref['sma_200'] = ta.trend.sma_indicator(close, window=200)
+    ref['ema_12'] = ta.trend.ema_indicator(close, window=12)
+    ref['ema_26'] = ta.trend.ema_indicator(close, window=26)
+    ref['ema_50'] = ta.trend.ema_indicator(close, window=50)
+    ref['wma_20'] = ta.trend.wma_indicator(close, window=20)
+    ref['rsi'] = ta.momentum.rsi(close, window=14)
+
+    macd = ta.trend.MACD(close, window_fast=12, window_slow=26, window_sign=9)
+    ref['macd'] = macd.macd()
+    ref['macd_signal'] = macd.macd_signal()
+    ref['macd_hist'] = macd.macd_diff()
+
+    bb = ta.volatility.BollingerBands(close, window=20, window_dev=2)
+    ref['bb_upper'] = bb.bollinger_hband()
+    ref['bb_middle'] = bb.bollinger_mavg()
+    ref['bb_lower'] = bb.bollinger_lband()
+    ref['bb_width'] = (ref['bb_upper'] - ref['bb_lower']) / ref['bb_middle']
+    ref['bb_position'] = (close - ref['bb_lower']) / (ref['bb_upper'] - ref['bb_lower'])
+
+    stoch = ta.momentum.StochasticOscillator(high, low, close)
+    ref['stoch_k'] = stoch.stoch()
+    ref['stoch_d'] = stoch.stoch_signal()
+    ref['williams_r'] = ta.momentum.williams_r(high, low, close, lbp=14)
+    ref['atr'] = ta.volatility.average_true_range(high, low, close, window=14)
+
+    ref['obv'] = ta.volume.on_balance_volume(close, volume)
+    ref['volume_sma'] = ta.trend.sma_indicator(volume, window=20)
+    ref['volume_ratio'] = volume / ref['volume_sma']
+    return ref
+
+
+def _assert_parity(result: pd.DataFrame, reference: pd.DataFrame):
+    assert len(result) == len(reference)
+    for col in INDICATOR_COLUMNS:
+        expected = reference[col].to_numpy(dtype=np.float64)
+        actual = result[col].to_numpy(dtype=np.float64)
+        assert np.array_equal(np.isnan(actual), np.isnan(expected)), col
+        error = np.nanmax(np.abs(actual - expected))
+        assert error <= TOLERANCE * np.nanmax(np.abs(expected)), col
+
+
+@pytest.fixture(autouse=True)
+def _float64_output(monkeypatch):
+    # float32 yuvarlaması test_float32_precision'da ayrıca ölçülür
+    monkeypatch.setattr(indicators, 'USE_FP32', False)
+
+
+@pytest.mark.parametrize('numba', [True, False], ids=['fused', 'fallback'])
+@pytest.mark.parametrize('flat', [False, True], ids=['random', 'flat'])
+def test_calculate_all_indicators_matches_ta(numba, flat, monkeypatch):
+    if numba and not indicators.NUMBA_AVAILABLE:
+        pytest.skip('Numba kurulu değil')
+    monkeypatch.setattr(indicators, 'NUMBA_AVAILABLE', numba)
+
+    df = _ohlcv(flat=flat)
+    reference = pd.concat([df, _ta_reference(df)], axis=1).dropna()
+    result = TechnicalIndicators().calculate_all_indicators(df)
+
+    assert result.index.equals(reference.index)
+    assert list(result.columns) == list(df.columns) + list(INDICATOR_COLUMNS)
+    _assert_parity(result, reference)
+
+
+def test_batch_matches_ta():
+    dfs = [_ohlcv(BARS - 100 * i, seed=i, flat=i % 2 == 1) for i in range(5)]
+    results = TechnicalIndicators().calculate_all_indicators_batch(dfs, parallel=True)
+
+    assert len(results) == len(dfs)
+    for df, result in zip(dfs, results):
+        reference = pd.concat([df, _ta_reference(df)], axis=1).dropna()
+        assert result.index.equals(reference.index)
+        _assert_parity(result, reference)
+
+
+def test_incremental_matches_ta():
+    df = _ohlcv(flat=True)
+    stream = IncrementalIndicators(capacity=BARS)
+    for row in df[['open', 'high', 'low', 'close', 'volume']].itertuples(index=False):
+        stream.update(*row)
+
+    history = stream.history()
+    history.index = df.index
+
+    # Akış ısınma sırasında da değer üretir; ta'nın geçerli olduğu satırlar karşılaştırılır
+    reference = _ta_reference(df).dropna()
+    _assert_parity(history.loc[reference.index], reference)
@@ -0,0 +1,81 @@
+"""
+SignalGenerator testleri
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.signal_generation.signal_generator import SignalGenerator
+
+
+def _indicator_frame(seed: int, start: str, n: int = 100) -> pd.DataFrame:
+    """Sentetik gösterge sütunları içeren saatlik DataFrame üretir"""
+    rng = np.random.default_rng(seed)
+    walk_columns = ['open', 'high', 'low', 'close', 'bb_upper', 'bb_lower',
+                    'ema_12', 'ema_26', 'sma_50', 'sma_200']
+    offsets = np.array([100, 102, 98, 100, 105, 95, 100, 100, 100, 100], dtype=np.float64)
+    walks = rng.standard_normal((len(walk_columns), n)).cumsum(axis=1) + offsets[:, None]
+    
+    uniform_columns = ['rsi', 'bb_position', 'bb_width', 'stoch_k', 'stoch_d', 'volume_ratio']
+    lows = np.array([20, 0, 0.1, 0, 0, 0.5])
+    highs = np.array([80, 1, 0.3, 100, 100, 3.0])
+    uniforms = rng.uniform(lows[:, None], highs[:, None], (len(uniform_columns), n))
+    
+    normal_columns = ['macd', 'macd_signal', 'macd_hist']
+    normals = rng.standard_normal((len(normal_columns), n))
+    
+    df = pd.DataFrame(
+        np.vstack([walks, uniforms, normals]).T,
+        columns=walk_columns + uniform_columns + normal_columns,
+        index=pd.date_range(start, periods=n, freq='h')
+    )
+    df['volume'] = rng.integers(1000, 10000, n)
+    return df
+
+
+def _signal_summary(signals):
+    """Zaman damgası hariç karşılaştırılabilir sinyal özeti"""
+    return [(s['type'], s['indicators'], s['confidence']) for s in signals]
+
+
+def test_shared_generator_does_not_reuse_other_symbols_row():
+    # B'nin sondan ikinci çubuğu A'nın son çubuğuyla aynı zaman damgasında
+    symbol_a = _indicator_frame(seed=1, start='2024-01-01 00:00')
+    symbol_b = _indicator_frame(seed=2, start='2024-01-01 01:00')
+    assert symbol_b.index[-2] == symbol_a.index[-1]
+    
+    shared = SignalGenerator()
+    shared.generate_signals(symbol_a)
+    shared_b = shared.generate_signals(symbol_b)
+    
+    fresh_b = SignalGenerator().generate_signals(symbol_b)
+    assert _signal_summary(shared_b) == _signal_summary(fresh_b)
+
+
+def test_same_bar_with_updated_previous_candle_uses_frame_values():
+    # Kapanmamış mumun anlık görüntüsüyle hesaplanan çağrıdan sonra kapanmış değerler gelir
+    closed = _indicator_frame(seed=3, start='2024-01-01 00:00')
+    snapshot = closed.iloc[:-1].copy()
+    snapshot.iloc[-1] = _indicator_frame(seed=4, start='2024-01-01 00:00').iloc[-2].to_numpy()
+    
+    generator = SignalGenerator()
+    generator.generate_signals(snapshot)
+    
+    assert _signal_summary(generator.generate_signals(closed)) == \
+        _signal_summary(SignalGenerator().generate_signals(closed))
+
+
+def test_generate_signals_leaves_update_stream_untouched():
+    df = _indicator_frame(seed=5, start='2024-01-01 00:00')
+    bars = df.to_dict('records')
+    
+    streamed = SignalGenerator()
+    for bar in bars[:-1]:
+        streamed.update(bar)
+    streamed.generate_signals(_indicator_frame(seed=6, start='2024-02-01 00:00'))
+    
+    reference = SignalGenerator()
+    for bar in bars[:-1]:
+        reference.update(bar)
+    
+    assert streamed.update(bars[-1]) == reference.update(bars[-1])